@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+#
+# Copyright 2020 Brian T. Park
+#
+# MIT License
+"""
+Benchmark the various algorithms of the ZoneSpecifier class using the zones in
+the zonedbpy files. With '--scope basic', the zones are extracted from the TZ
+Database files in '--input_dir' instead, and BasicZoneSpecifier is benchmarked
+against ZoneSpecifier on the same zones. With '--extractor', the bulk lexer of
+the Extractor is benchmarked against the line-by-line lexer on the TZ Database
+files in '--input_dir'.
+
+Usage:
+    benchmark.py [flags...]
+
+Examples:
+
+    # Compare the candidate finder and active selector combinations over all
+    # zones and the years [2000, 2038).
+    $ ./benchmark.py --start_year 2000 --until_year 2038
+
+    # A single zone, repeated 10 times.
+    $ ./benchmark.py --zone America/Los_Angeles --iterations 10
+
+    # BasicZoneSpecifier versus ZoneSpecifier on the zones of the basic scope.
+    $ ./benchmark.py --scope basic --input_dir ~/tz
+
+    # Extractor lexers, repeated 20 times.
+    $ ./benchmark.py --extractor --input_dir ~/tz --iterations 20
+"""
+
+import sys
+import argparse
+import logging
+import time
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import cast
+from tzdb.extractor import Extractor
+from tzdb.transformer import Transformer
+from zonedbpy import zone_infos
+from zonedb.basic_zone_specifier import BasicZoneSpecifier
+from zonedb.ingenerator import InlineGenerator
+from zonedb.ingenerator import ZoneInfo
+from zonedb.ingenerator import ZoneInfoCooked
+from zonedb.zone_specifier import ZoneSpecifier
+
+# Name and the ZoneSpecifier options of each algorithm being benchmarked.
+SpecifierVariant = NamedTuple('SpecifierVariant', [
+    ('name', str),
+    ('options', Dict[str, bool]),
+])
+
+SPECIFIER_VARIANTS = [
+    SpecifierVariant('Basic/Basic', {
+        'optimize_candidates': False,
+        'in_place_transitions': False,
+    }),
+    SpecifierVariant('Basic/InPlace', {
+        'optimize_candidates': False,
+        'in_place_transitions': True,
+    }),
+    SpecifierVariant('Optimized/Basic', {
+        'optimize_candidates': True,
+        'in_place_transitions': False,
+    }),
+    SpecifierVariant('Optimized/InPlace', {
+        'optimize_candidates': True,
+        'in_place_transitions': True,
+    }),
+    SpecifierVariant('Pruned/SinglePass', {
+        'prune_candidates': True,
+    }),
+]
+
+
+def benchmark_specifiers(
+    zones: List[ZoneInfoCooked],
+    start_year: int,
+    until_year: int,
+    iterations: int,
+) -> None:
+    """Print the time taken by ZoneSpecifier.init_for_year() over all the
+    'zones' and years in [start_year, until_year), along with the total number
+    of candidate Transitions and the maximum transition buffer size.
+    """
+    logging.info(
+        'Benchmarking %d zones over [%d, %d), %d iterations',
+        len(zones), start_year, until_year, iterations)
+    for variant in SPECIFIER_VARIANTS:
+        num_candidates = 0
+        max_buffer_size = 0
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            for zone_info in zones:
+                zone_specifier = ZoneSpecifier(zone_info, **variant.options)
+                for year in range(start_year, until_year):
+                    zone_specifier.init_for_year(year)
+                    num_candidates += len(
+                        zone_specifier.all_candidate_transitions)
+                    max_buffer_size = max(
+                        max_buffer_size,
+                        zone_specifier.max_transition_buffer_size)
+        elapsed = time.perf_counter() - start_time
+        logging.info(
+            '%-18s %8.3f s; candidates=%d; max buffer size=%d',
+            variant.name, elapsed, num_candidates // iterations,
+            max_buffer_size)
+
+
+def benchmark_basic_specifier(
+    zones: List[ZoneInfoCooked],
+    start_year: int,
+    until_year: int,
+    iterations: int,
+) -> None:
+    """Print the time taken by BasicZoneSpecifier.init_for_year() over all the
+    'zones' and years in [start_year, until_year), along with the total and
+    the maximum number of Transitions. The 'zones' must be of the 'basic'
+    scope.
+    """
+    num_transitions = 0
+    max_transitions = 0
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        for zone_info in zones:
+            zone_specifier = BasicZoneSpecifier(zone_info)
+            for year in range(start_year, until_year):
+                zone_specifier.init_for_year(year)
+                num_transitions += len(zone_specifier.transitions)
+                max_transitions = max(
+                    max_transitions, len(zone_specifier.transitions))
+    elapsed = time.perf_counter() - start_time
+    logging.info(
+        '%-18s %8.3f s; transitions=%d; max transitions=%d',
+        'BasicZoneSpecifier', elapsed, num_transitions // iterations,
+        max_transitions)
+
+
+def benchmark_extractor(input_dir: str, iterations: int) -> None:
+    """Print the time taken by Extractor.parse() with the line-by-line lexer
+    and with the bulk lexer, and verify that both produce the same maps.
+    """
+    logging.info(
+        "Benchmarking Extractor on '%s', %d iterations",
+        input_dir, iterations)
+
+    # Silence the 'Processing ...' messages of each iteration.
+    logging.disable(logging.INFO)
+    results = []
+    elapsed = []
+    for bulk_lexer in [False, True]:
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            extractor = Extractor(input_dir, bulk_lexer=bulk_lexer)
+            extractor.parse()
+        elapsed.append(time.perf_counter() - start_time)
+        results.append(extractor.get_data())
+    logging.disable(logging.NOTSET)
+
+    for name, seconds in zip(['Line lexer', 'Bulk lexer'], elapsed):
+        logging.info(
+            '%-18s %8.3f s; %.2f ms/parse',
+            name, seconds, seconds / iterations * 1000)
+    if results[0] != results[1]:
+        logging.error('Bulk lexer produced different maps')
+        sys.exit(1)
+
+
+def create_zones_from_zonedbpy(zone_name: str) -> List[ZoneInfoCooked]:
+    """Return the cooked zones of the zonedbpy files, or just 'zone_name' if
+    given.
+    """
+    if zone_name:
+        zone_info = cast(ZoneInfo, zone_infos.ZONE_INFO_MAP.get(zone_name))
+        if not zone_info:
+            logging.error("Zone '%s' not found", zone_name)
+            sys.exit(1)
+        zone_info_datas = [zone_info]
+    else:
+        zone_info_datas = [
+            cast(ZoneInfo, zone_info)
+            for _, zone_info in sorted(zone_infos.ZONE_INFO_MAP.items())
+        ]
+
+    # Cook the zones once, so that only the algorithms are measured.
+    return [ZoneInfoCooked(zone_info) for zone_info in zone_info_datas]
+
+
+def create_zones_from_tzdb(
+    input_dir: str,
+    scope: str,
+    start_year: int,
+    until_year: int,
+) -> List[ZoneInfoCooked]:
+    """Extract and transform the TZ Database files in 'input_dir' for the
+    given 'scope', using the default granularities of tzcompiler.py, and return
+    the cooked zones sorted by name.
+    """
+    extractor = Extractor(input_dir)
+    extractor.parse()
+    rules_map, zones_map, links_map = extractor.get_data()
+
+    offset_granularity = 900 if scope == 'basic' else 60
+    transformer = Transformer(
+        zones_map,
+        rules_map,
+        links_map,
+        scope,
+        start_year,
+        until_year,
+        60,  # until_at_granularity
+        offset_granularity,
+        False,  # strict
+    )
+    transformer.transform()
+    (zones_map, rules_map) = transformer.get_data()[:2]
+
+    inline_generator = InlineGenerator(zones_map, rules_map)
+    (zone_infos_map, _) = inline_generator.generate_cooked_maps()
+    return [zone_info for _, zone_info in sorted(zone_infos_map.items())]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark ZoneSpecifier.')
+    parser.add_argument(
+        '--zone', help='Name of time zone (default: all zones)')
+    parser.add_argument(
+        '--start_year',
+        help='Start year of the benchmark (default: 2000)',
+        type=int,
+        default=2000)
+    parser.add_argument(
+        '--until_year',
+        help='Until year of the benchmark (default: 2038)',
+        type=int,
+        default=2038)
+    parser.add_argument(
+        '--iterations',
+        help='Number of times to repeat the benchmark (default: 1)',
+        type=int,
+        default=1)
+    parser.add_argument(
+        '--scope',
+        help='Scope of the zones, selects BasicZoneSpecifier (default: '
+        + 'extended)',
+        choices=['basic', 'extended'],
+        default='extended')
+    parser.add_argument(
+        '--input_dir',
+        help='Location of the input TZ files (default: use zonedbpy)')
+    parser.add_argument(
+        '--extractor',
+        help='Benchmark the Extractor lexers on --input_dir instead',
+        action='store_true')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    if args.extractor:
+        if not args.input_dir:
+            logging.error('--extractor requires --input_dir')
+            sys.exit(1)
+        benchmark_extractor(args.input_dir, args.iterations)
+        return
+
+    if args.input_dir:
+        zones = create_zones_from_tzdb(
+            args.input_dir, args.scope, args.start_year, args.until_year)
+        if args.zone:
+            zones = [z for z in zones if z.name == args.zone]
+            if not zones:
+                logging.error("Zone '%s' not found", args.zone)
+                sys.exit(1)
+    elif args.scope == 'basic':
+        logging.error('--scope basic requires --input_dir')
+        sys.exit(1)
+    else:
+        zones = create_zones_from_zonedbpy(args.zone)
+
+    benchmark_specifiers(
+        zones, args.start_year, args.until_year, args.iterations)
+    if args.scope == 'basic':
+        benchmark_basic_specifier(
+            zones, args.start_year, args.until_year, args.iterations)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+#
+# Copyright 2020 Brian T. Park
+#
+# MIT License
+"""
+Report the runtime memory footprint of the Python zone database using
+tracemalloc. This is the Python counterpart of the memory8/memory32 estimates
+of the Arduino zonedb files. It measures:
+
+    * the import cost of zonedbpy.zone_policies and zonedbpy.zone_infos
+    * the size of the ZoneInfoCooked object of each zone, including its
+      ZoneEraCooked objects, but excluding the ZonePolicyCooked objects
+      shared with other zones
+    * the size of the Transition cache of a warmed ZoneSpecifier for each zone,
+      i.e. the largest memory retained by init_for_year() across the years
+
+Usage:
+    memreport.py [flags...]
+
+Examples:
+
+    # JSON report of all zones, sorted by total bytes, to stdout.
+    $ ./memreport.py
+
+    # CSV report over [2000, 2050), sorted by the cooked object size.
+    $ ./memreport.py --format csv --sort_by cooked_bytes --until_year 2050 \
+        --output memory.csv
+"""
+
+import sys
+import argparse
+import csv
+import gc
+import importlib
+import json
+import logging
+import tracemalloc
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import cast
+from typing_extensions import TypedDict
+from zonedb.ingenerator import ZoneEra
+from zonedb.ingenerator import ZoneEraCooked
+from zonedb.ingenerator import ZoneInfo
+from zonedb.ingenerator import ZoneInfoCooked
+from zonedb.ingenerator import ZonePolicyCooked
+from zonedb.zone_specifier import ZoneSpecifier
+
+# Memory footprint of a single zone, in bytes.
+ZoneMemory = TypedDict('ZoneMemory', {
+    'zone': str,
+    'cooked_bytes': int,  # ZoneInfoCooked, without shared ZonePolicyCooked
+    'cache_bytes': int,  # largest Transition cache of ZoneSpecifier
+    'cache_year': int,  # year of the largest Transition cache
+    'total_bytes': int,  # cooked_bytes + cache_bytes
+})
+
+# Memory footprint of the imports of the zonedbpy modules, in bytes.
+ImportMemory = TypedDict('ImportMemory', {
+    'zone_policies': int,
+    'zone_infos': int,
+})
+
+# Fields of ZoneMemory which can be used to sort the report.
+SORT_FIELDS = ['zone', 'cooked_bytes', 'cache_bytes', 'total_bytes']
+
+
+def measure_imports() -> ImportMemory:
+    """Return the memory allocated by importing the zonedbpy modules. Must be
+    called before anything else imports them. The zone_infos module imports
+    zone_policies, so zone_policies is imported first to separate the two.
+    """
+    if 'zonedbpy.zone_infos' in sys.modules:
+        raise Exception('zonedbpy already imported')
+
+    before = _traced_memory()
+    importlib.import_module('zonedbpy.zone_policies')
+    after_policies = _traced_memory()
+    importlib.import_module('zonedbpy.zone_infos')
+    after_infos = _traced_memory()
+    return {
+        'zone_policies': after_policies - before,
+        'zone_infos': after_infos - after_policies,
+    }
+
+
+def measure_zones(
+    zone_info_map: Dict[str, ZoneInfo],
+    start_year: int,
+    until_year: int,
+) -> List[ZoneMemory]:
+    """Return the ZoneMemory of each zone in 'zone_info_map'. The
+    ZonePolicyCooked objects are shared across zones, so they are cooked up
+    front, and not counted against any zone.
+    """
+    policies: Dict[str, ZonePolicyCooked] = {}
+    for zone_info in zone_info_map.values():
+        for era in zone_info['eras']:
+            policy = era['zonePolicy']
+            if isinstance(policy, dict):
+                policies.setdefault(
+                    policy['name'], ZonePolicyCooked(policy))
+
+    results: List[ZoneMemory] = []
+    for zone_name, zone_info in sorted(zone_info_map.items()):
+        before = _traced_memory()
+        zone_cooked = ZoneInfoCooked.create(
+            zone_info['name'],
+            [_cook_era(era, policies) for era in zone_info['eras']])
+        cooked_bytes = _traced_memory() - before
+
+        zone_specifier = ZoneSpecifier(zone_cooked)
+        (cache_bytes, cache_year) = _measure_cache(
+            zone_specifier, start_year, until_year)
+
+        results.append({
+            'zone': zone_name,
+            'cooked_bytes': cooked_bytes,
+            'cache_bytes': cache_bytes,
+            'cache_year': cache_year,
+            'total_bytes': cooked_bytes + cache_bytes,
+        })
+        del zone_specifier
+        del zone_cooked
+    return results
+
+
+def write_json(
+    imports: ImportMemory,
+    zones: List[ZoneMemory],
+    output: Any,
+) -> None:
+    report = {
+        'imports': imports,
+        'zones': zones,
+    }
+    json.dump(report, output, indent=2)
+    output.write('\n')
+
+
+def write_csv(zones: List[ZoneMemory], output: Any) -> None:
+    writer = csv.DictWriter(output, fieldnames=[
+        'zone', 'cooked_bytes', 'cache_bytes', 'cache_year', 'total_bytes',
+    ])
+    writer.writeheader()
+    for zone in zones:
+        writer.writerow(zone)
+
+
+def _measure_cache(
+    zone_specifier: ZoneSpecifier,
+    start_year: int,
+    until_year: int,
+) -> Tuple[int, int]:
+    """Return the (bytes, year) of the largest memory retained by
+    ZoneSpecifier.init_for_year() over [start_year, until_year). Each call
+    replaces the cache of the previous year, so the memory retained after each
+    call is the cache of that year alone.
+    """
+    empty = _traced_memory()
+    max_cache = (0, 0)
+    for year in range(start_year, until_year):
+        zone_specifier.init_for_year(year)
+        cache_bytes = _traced_memory() - empty
+        if cache_bytes > max_cache[0]:
+            max_cache = (cache_bytes, year)
+    return max_cache
+
+
+def _cook_era(
+    era: ZoneEra,
+    policies: Dict[str, ZonePolicyCooked],
+) -> ZoneEraCooked:
+    """Cook a ZoneEra, reusing the shared ZonePolicyCooked objects."""
+    policy = era['zonePolicy']
+    return ZoneEraCooked.create(
+        offsetSeconds=era['offsetSeconds'],
+        zonePolicy=(
+            policies[policy['name']] if isinstance(policy, dict) else policy
+        ),
+        rulesDeltaSeconds=era['rulesDeltaSeconds'],
+        format=era['format'],
+        untilYear=era['untilYear'],
+        untilMonth=era['untilMonth'],
+        untilDay=era['untilDay'],
+        untilSeconds=era['untilSeconds'],
+        untilTimeSuffix=era['untilTimeSuffix'],
+    )
+
+
+def _traced_memory() -> int:
+    """Return the current traced memory after a full collection, so that
+    garbage from earlier measurements is not attributed to the next one.
+    """
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Report the memory footprint of the zonedbpy zones.')
+    parser.add_argument(
+        '--zone', help='Name of time zone (default: all zones)')
+    parser.add_argument(
+        '--start_year',
+        help='Start year of the Transition cache (default: 2000)',
+        type=int,
+        default=2000)
+    parser.add_argument(
+        '--until_year',
+        help='Until year of the Transition cache (default: 2038)',
+        type=int,
+        default=2038)
+    parser.add_argument(
+        '--format',
+        help='Format of the report (default: json)',
+        choices=['json', 'csv'],
+        default='json')
+    parser.add_argument(
+        '--sort_by',
+        help='Field to sort the zones by: zone sorts by name, the other '
+        + 'fields sort in decreasing order (default: total_bytes)',
+        choices=SORT_FIELDS,
+        default='total_bytes')
+    parser.add_argument(
+        '--output',
+        help='Output file (default: stdout)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    tracemalloc.start()
+    imports = measure_imports()
+    logging.info(
+        'Import cost: zone_policies=%d bytes; zone_infos=%d bytes',
+        imports['zone_policies'], imports['zone_infos'])
+
+    zone_infos = sys.modules['zonedbpy.zone_infos']
+    zone_info_map = cast(Dict[str, ZoneInfo], zone_infos.ZONE_INFO_MAP)
+    if args.zone:
+        if args.zone not in zone_info_map:
+            logging.error("Zone '%s' not found", args.zone)
+            sys.exit(1)
+        zone_info_map = {args.zone: zone_info_map[args.zone]}
+
+    zones = measure_zones(zone_info_map, args.start_year, args.until_year)
+    tracemalloc.stop()
+
+    # Sort by name, then by the decreasing size if requested.
+    if args.sort_by != 'zone':
+        zones.sort(
+            key=lambda x: cast(Dict[str, int], x)[args.sort_by],
+            reverse=True)
+    logging.info(
+        'Zones=%d; cooked=%d bytes; cache=%d bytes; total=%d bytes',
+        len(zones),
+        sum(z['cooked_bytes'] for z in zones),
+        sum(z['cache_bytes'] for z in zones),
+        sum(z['total_bytes'] for z in zones))
+
+    output = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        if args.format == 'json':
+            write_json(imports, zones, output)
+        else:
+            write_csv(zones, output)
+    finally:
+        if args.output:
+            output.close()
+
+
+if __name__ == '__main__':
+    main()
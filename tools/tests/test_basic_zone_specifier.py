@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+#
+# Copyright 2020 Brian T. Park
+#
+# MIT License
+
+import unittest
+from datetime import datetime
+from zonedbpy import zone_infos
+from zonedb.ingenerator import ZoneInfoCooked
+from zonedb.basic_zone_specifier import BasicZoneSpecifier
+from zonedb.basic_zone_specifier import MIN_EPOCH_SECONDS
+from zonedb.zone_specifier import ZoneSpecifier
+
+# Zones of zonedbpy which also satisfy the constraints of the 'basic' scope.
+BASIC_ZONE_NAMES = [
+    'America/Los_Angeles',
+    'America/New_York',
+    'Asia/Dhaka',
+    'Australia/Sydney',
+    'Europe/London',
+    'Europe/Paris',
+]
+
+
+class TestBasicZoneSpecifier(unittest.TestCase):
+    def test_init_for_year(self) -> None:
+        zone_info = ZoneInfoCooked(zone_infos.ZONE_INFO_America_Los_Angeles)
+        zone_specifier = BasicZoneSpecifier(zone_info)
+        zone_specifier.init_for_year(2018)
+
+        # The prior Transition, then the 2 DST transitions of the year.
+        transitions = zone_specifier.transitions
+        self.assertEqual(3, len(transitions))
+        self.assertEqual(MIN_EPOCH_SECONDS, transitions[0].startEpochSecond)
+        self.assertEqual('PST', transitions[0].abbrev)
+        self.assertEqual(2018, transitions[1].year)
+        self.assertEqual(3, transitions[1].month)
+        self.assertEqual('PDT', transitions[1].abbrev)
+        self.assertEqual(2018, transitions[2].year)
+        self.assertEqual(11, transitions[2].month)
+        self.assertEqual('PST', transitions[2].abbrev)
+
+        # 2018-03-11T02:00:00-08:00
+        self.assertEqual(574077600, transitions[1].startEpochSecond)
+
+    def test_get_timezone_info_for_datetime(self) -> None:
+        zone_info = ZoneInfoCooked(zone_infos.ZONE_INFO_America_Los_Angeles)
+        zone_specifier = BasicZoneSpecifier(zone_info)
+
+        info = zone_specifier.get_timezone_info_for_datetime(
+            datetime(2018, 7, 1, 12))
+        self.assertEqual(-7 * 3600, info.total_offset)
+        self.assertEqual(3600, info.dst_offset)
+        self.assertEqual('PDT', info.abbrev)
+
+        # In the gap, the later UTC offset is picked.
+        info = zone_specifier.get_timezone_info_for_datetime(
+            datetime(2018, 3, 11, 2, 30))
+        self.assertEqual('PDT', info.abbrev)
+
+    def test_same_as_zone_specifier(self) -> None:
+        # Compare the UTC offsets and abbreviations around every Transition
+        # found by ZoneSpecifier.
+        for zone_name in BASIC_ZONE_NAMES:
+            zone_info = ZoneInfoCooked(zone_infos.ZONE_INFO_MAP[zone_name])
+            zone_specifier = ZoneSpecifier(zone_info)
+            basic_specifier = BasicZoneSpecifier(zone_info)
+            for year in range(2000, 2038):
+                zone_specifier.init_for_year(year)
+                for transition in zone_specifier.transitions:
+                    for delta in (-1, 0):
+                        epoch_seconds = transition.startEpochSecond + delta
+                        if epoch_seconds < 0:
+                            continue
+                        self.assertEqual(
+                            zone_specifier.get_timezone_info_for_seconds(
+                                epoch_seconds),
+                            basic_specifier.get_timezone_info_for_seconds(
+                                epoch_seconds),
+                            f'{zone_name}: {epoch_seconds}')
+
+    def test_get_buffer_sizes(self) -> None:
+        zone_info = ZoneInfoCooked(zone_infos.ZONE_INFO_Europe_London)
+        zone_specifier = BasicZoneSpecifier(zone_info)
+        (max_actives, max_buffer_size) = zone_specifier.get_buffer_sizes(
+            2000, 2038)
+        self.assertEqual(3, max_actives[0])
+        self.assertEqual(max_actives, max_buffer_size)
+
+
+if __name__ == '__main__':
+    unittest.main()
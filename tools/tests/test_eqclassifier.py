@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+#
+# Copyright 2020 Brian T. Park
+#
+# MIT License
+
+import unittest
+from zonedbpy import zone_infos
+from zonedb.ingenerator import ZoneInfoCooked
+from zonedb.ingenerator import ZoneInfoCookedMap
+from zonedb.eqclassifier import EquivalenceClassifier
+
+ZONE_NAMES = [
+    'America/Detroit',
+    'America/Indiana/Indianapolis',
+    'America/Los_Angeles',
+    'America/New_York',
+    'Europe/Berlin',
+    'Europe/Paris',
+]
+
+
+def _create_zone_infos() -> ZoneInfoCookedMap:
+    return {
+        name: ZoneInfoCooked(zone_infos.ZONE_INFO_MAP[name])
+        for name in ZONE_NAMES
+    }
+
+
+class TestEquivalenceClassifier(unittest.TestCase):
+    def test_classify(self) -> None:
+        classifier = EquivalenceClassifier(_create_zone_infos(), 2000, 2038)
+        (classes, representatives) = classifier.classify()
+        self.assertEqual([
+            ['America/Detroit', 'America/New_York'],
+            ['America/Indiana/Indianapolis'],
+            ['America/Los_Angeles'],
+            ['Europe/Berlin', 'Europe/Paris'],
+        ], classes)
+        self.assertEqual('America/Detroit', representatives['America/New_York'])
+        self.assertEqual('Europe/Berlin', representatives['Europe/Berlin'])
+
+    def test_classify_ignores_history_before_start_year(self) -> None:
+        # Indianapolis started to observe DST in 2006.
+        classifier = EquivalenceClassifier(_create_zone_infos(), 2007, 2038)
+        (classes, representatives) = classifier.classify()
+        self.assertEqual(
+            'America/Detroit',
+            representatives['America/Indiana/Indianapolis'])
+
+    def test_calc_signature(self) -> None:
+        classifier = EquivalenceClassifier(_create_zone_infos(), 2000, 2002)
+        signature = classifier.calc_signature('America/Los_Angeles')
+
+        # Standard time at the start of the interval, then 2 DST transitions
+        # per year.
+        self.assertEqual(5, len(signature))
+        (start, info) = signature[0]
+        self.assertEqual(0, start)
+        self.assertEqual(-8 * 3600, info.total_offset)
+        self.assertEqual('PST', info.abbrev)
+        self.assertEqual('PDT', signature[1][1].abbrev)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,8 +4,84 @@
 #
 # MIT License
 
+import os
+import tarfile
+import tempfile
 import unittest
+from typing import Any
+from typing import Dict
+from typing import List
+from tzdb.extractor import Extractor
+from tzdb.extractor import expand_zi_text
 from tzdb.extractor import parse_at_time_string
+from tzdb.extractor import read_snapshot
+from tzdb.transformer import time_string_to_seconds
+
+# A few entries of the 'northamerica' and 'europe' files. The continuation
+# lines of a Zone entry must begin with a TAB.
+NORTHAMERICA = """\
+# Rule  NAME    FROM    TO    TYPE IN   ON      AT      SAVE    LETTER
+Rule    US      2007    max   -    Mar  Sun>=8  2:00    1:00    D
+Rule    US      2007    max   -    Nov  Sun>=1  2:00    0       S
+Rule    CA      1950    1966  -    Apr  lastSun 1:00    1:00    D
+
+Zone America/Los_Angeles -7:52:58 -     LMT     1883 Nov 18 12:07:02
+\t\t\t-8:00\tUS\tP%sT\t1946
+\t\t\t-8:00\tCA\tP%sT\t1967
+\t\t\t-8:00\tUS\tP%sT
+"""
+
+EUROPE = """\
+Rule    EU      1981    max   -    Mar  lastSun  1:00u  1:00    S
+Rule    EU      1996    max   -    Oct  lastSun  1:00u  0       -
+
+Zone    Europe/Paris    0:09:21 -       LMT     1891 Mar 16
+\t\t\t1:00\tEU\tCE%sT
+Link    Europe/Paris    Europe/Monaco
+"""
+
+
+# The same entries in the compact tzdata.zi format.
+TZDATA_ZI = """\
+# version 2020a
+R US 2007 ma - Mar Su>=8 2 1 D
+R US 2007 ma - N Su>=1 2 0 S
+R CA 1950 1966 - Ap lastSu 1 1 D
+R EU 1981 ma - Mar lastSu 1u 1 S
+R EU 1996 ma - O lastSu 1u 0 -
+Z America/Los_Angeles -7:52:58 - LMT 1883 N 18 12:7:2
+-8 US P%sT 1946
+-8 CA P%sT 1967
+-8 US P%sT
+Z Europe/Paris 0:9:21 - LMT 1891 Mar 16
+1 EU CE%sT
+L Europe/Paris Europe/Monaco
+"""
+
+RULE_TIME_FIELDS = ['atTime', 'deltaOffset']
+ZONE_TIME_FIELDS = ['offsetString', 'rules', 'untilTime']
+
+
+def _normalize(
+    items_map: Dict[str, List[Any]],
+    time_fields: List[str],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Return a copy of the records of 'items_map' without the rawLine, and
+    with the 'time_fields' converted to seconds.
+    """
+    normalized: Dict[str, List[Dict[str, Any]]] = {}
+    for name, items in items_map.items():
+        records = []
+        for item in items:
+            record = item.to_dict()
+            del record['rawLine']
+            for field in time_fields:
+                value = record[field]
+                if value and value[0] in '-0123456789':
+                    record[field] = time_string_to_seconds(value)
+            records.append(record)
+        normalized[name] = records
+    return normalized
 
 
 class TestParseAtHourString(unittest.TestCase):
@@ -20,5 +96,228 @@ class TestParseAtHourString(unittest.TestCase):
         self.assertRaises(Exception, parse_at_time_string, '2:00p')
 
 
+class TestExpandZiText(unittest.TestCase):
+    def test_expand_zi_text(self) -> None:
+        self.assertEqual(
+            'Rule\tUS\t2007\tmax\t-\tNov\tSun>=1\t2\t0\tS\n'
+            'Rule\tCA\t1950\tonly\t-\tApr\tlastSun\t1\t1\tD\n'
+            'Zone\tEurope/Paris\t0:9:21\t-\tLMT\t1891\tMar\t16\n'
+            '\t\t\t1\t1:00\tCE%sT\n'
+            'Link\tEurope/Paris\tEurope/Monaco\n',
+            expand_zi_text(
+                'R US 2007 ma - N Su>=1 2 0 S\n'
+                'R CA 1950 o - Ap lastSu 1 1 D # comment\n'
+                'Z Europe/Paris 0:9:21 - LMT 1891 Mar 16\n'
+                '1 1 CE%sT\n'
+                'L Europe/Paris Europe/Monaco\n'))
+
+
+class TestExtractor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        for file_name in Extractor.ZONE_FILES:
+            if file_name == 'northamerica':
+                content = NORTHAMERICA
+            elif file_name == 'europe':
+                content = EUROPE
+            else:
+                content = ''
+            with open(os.path.join(self.tmp_dir.name, file_name), 'w') as f:
+                f.write(content)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_parse(self) -> None:
+        extractor = Extractor(self.tmp_dir.name)
+        extractor.parse()
+        (rules_map, zones_map, links_map) = extractor.get_data()
+        self.assertEqual(['EU', 'US', 'CA'], list(rules_map.keys()))
+        self.assertEqual(2, len(rules_map['US']))
+        self.assertEqual(4, len(zones_map['America/Los_Angeles']))
+        self.assertEqual({'Europe/Monaco': 'Europe/Paris'}, links_map)
+
+    def test_bulk_lexer_same_as_line_lexer(self) -> None:
+        line_lexer = Extractor(self.tmp_dir.name, bulk_lexer=False)
+        line_lexer.parse()
+        bulk_lexer = Extractor(self.tmp_dir.name)
+        bulk_lexer.parse()
+
+        self.assertEqual(line_lexer.rule_lines, bulk_lexer.rule_lines)
+        self.assertEqual(line_lexer.zone_lines, bulk_lexer.zone_lines)
+        self.assertEqual(line_lexer.link_lines, bulk_lexer.link_lines)
+        self.assertEqual(line_lexer.get_data(), bulk_lexer.get_data())
+        self.assertEqual(
+            list(line_lexer.rules_map.keys()),
+            list(bulk_lexer.rules_map.keys()))
+
+    def test_parse_tarball(self) -> None:
+        tarball = os.path.join(self.tmp_dir.name, 'tzdata2020a.tar.gz')
+        with tarfile.open(tarball, 'w:gz') as tar:
+            for file_name in reversed(Extractor.ZONE_FILES):
+                tar.add(
+                    os.path.join(self.tmp_dir.name, file_name),
+                    arcname=file_name)
+
+        serial = Extractor(self.tmp_dir.name)
+        serial.parse()
+        extractor = Extractor(tarball)
+        extractor.parse()
+        self.assertEqual(serial.get_data(), extractor.get_data())
+        self.assertEqual(
+            list(serial.rules_map.keys()), list(extractor.rules_map.keys()))
+
+    def test_parse_tzdata_zi(self) -> None:
+        zi_file = os.path.join(self.tmp_dir.name, 'tzdata.zi')
+        with open(zi_file, 'w') as f:
+            f.write(TZDATA_ZI)
+
+        serial = Extractor(self.tmp_dir.name)
+        serial.parse()
+        extractor = Extractor(zi_file)
+        extractor.parse()
+
+        # The tzdata.zi format drops the leading zeros and the ':00' of the
+        # time fields, so compare those in seconds, and ignore the rawLine.
+        (rules_map, zones_map, links_map) = extractor.get_data()
+        self.assertEqual(
+            _normalize(serial.rules_map, RULE_TIME_FIELDS),
+            _normalize(rules_map, RULE_TIME_FIELDS))
+        self.assertEqual(
+            _normalize(serial.zones_map, ZONE_TIME_FIELDS),
+            _normalize(zones_map, ZONE_TIME_FIELDS))
+        self.assertEqual(serial.links_map, links_map)
+
+    def test_parse_incremental(self) -> None:
+        snapshot_file = os.path.join(self.tmp_dir.name, 'snapshot.json')
+        previous = Extractor(self.tmp_dir.name)
+        previous.parse()
+        previous.write_snapshot(snapshot_file)
+
+        # Modify the EU policy, remove Europe/Paris, and add a link.
+        with open(os.path.join(self.tmp_dir.name, 'europe'), 'w') as f:
+            f.write(EUROPE.replace('1996', '1997')
+                    .replace('Europe/Paris', 'Europe/Berlin')
+                    + 'Link    Europe/Berlin    Europe/Busingen\n')
+
+        full = Extractor(self.tmp_dir.name)
+        full.parse()
+        extractor = Extractor(
+            self.tmp_dir.name, snapshot=read_snapshot(snapshot_file))
+        extractor.parse()
+        self.assertEqual(full.get_data(), extractor.get_data())
+        self.assertEqual(
+            list(full.zones_map.keys()), list(extractor.zones_map.keys()))
+        self.assertEqual(3, extractor.reused_blocks)
+        self.assertEqual(2, extractor.processed_blocks)
+        self.assertEqual({
+            'addedZones': ['Europe/Berlin'],
+            'removedZones': ['Europe/Paris'],
+            'modifiedZones': [],
+            'addedPolicies': [],
+            'removedPolicies': [],
+            'modifiedPolicies': ['EU'],
+            'addedLinks': ['Europe/Busingen'],
+            'removedLinks': [],
+            'modifiedLinks': ['Europe/Monaco'],
+        }, extractor.change_set)
+
+    def test_stream(self) -> None:
+        extractor = Extractor(self.tmp_dir.name, raw_lines=False)
+        items = [(kind, name) for (kind, name, _) in extractor.stream()]
+        self.assertEqual([
+            ('Zone', 'Europe/Paris'),
+            ('Zone', 'America/Los_Angeles'),
+            ('Rule', 'EU'),
+            ('Rule', 'US'),
+            ('Rule', 'CA'),
+            ('Link', 'Europe/Monaco'),
+        ], items)
+
+    def test_parse_without_raw_lines(self) -> None:
+        full = Extractor(self.tmp_dir.name)
+        full.parse()
+        extractor = Extractor(self.tmp_dir.name, raw_lines=False)
+        extractor.parse()
+
+        self.assertEqual({}, extractor.rule_lines)
+        self.assertEqual({}, extractor.zone_lines)
+        self.assertEqual({}, extractor.link_lines)
+        self.assertEqual(
+            '', extractor.zones_map['America/Los_Angeles'][0].rawLine)
+        for items_map in (full.rules_map, full.zones_map):
+            for items in items_map.values():
+                for item in items:
+                    item.rawLine = ''
+        self.assertEqual(full.get_data(), extractor.get_data())
+        self.assertEqual(
+            list(full.rules_map.keys()), list(extractor.rules_map.keys()))
+
+        self.assertRaises(Exception, extractor.create_snapshot)
+
+    def test_parse_year_range(self) -> None:
+        # Add older Rules to the US policy, and an older era to Paris.
+        with open(os.path.join(self.tmp_dir.name, 'northamerica'), 'w') as f:
+            f.write(NORTHAMERICA.replace('Rule    CA', """\
+Rule    US      1967    1973  -    Apr  lastSun 2:00    1:00    D
+Rule    US      1967    2006  -    Oct  lastSun 2:00    0       S
+Rule    US      1918    1919  -    Mar  lastSun 2:00    1:00    D
+Rule    CA""", 1))
+        with open(os.path.join(self.tmp_dir.name, 'europe'), 'w') as f:
+            f.write(EUROPE.replace(
+                '\t\t\t1:00\tEU',
+                '\t\t\t0:09:21\t-\tPMT\t1911\n\t\t\t1:00\tEU'))
+
+        full = Extractor(self.tmp_dir.name)
+        full.parse()
+        extractor = Extractor(
+            self.tmp_dir.name, start_year=2000, until_year=2038)
+        extractor.parse()
+
+        # Of the US Rules which end before 1999, only the latest (1973-04) is
+        # kept, in its original position.
+        self.assertEqual(
+            [(2007, 3), (2007, 11), (1967, 4), (1967, 10)],
+            [(r.fromYear, r.inMonth) for r in extractor.rules_map['US']])
+        self.assertEqual(
+            [(1950, 4)],
+            [(r.fromYear, r.inMonth) for r in extractor.rules_map['CA']])
+        self.assertEqual(1, extractor.skipped_rule_lines)
+
+        # The eras ending before 1999 are skipped.
+        self.assertEqual(
+            [10000], [e.untilYear for e in extractor.zones_map[
+                'America/Los_Angeles']])
+        self.assertEqual(
+            [10000], [e.untilYear for e in extractor.zones_map[
+                'Europe/Paris']])
+        self.assertEqual(5, extractor.skipped_zone_lines)
+        self.assertEqual(full.links_map, extractor.links_map)
+
+        self.assertRaises(Exception, extractor.create_snapshot)
+
+    def test_parse_tarball_missing_file(self) -> None:
+        tarball = os.path.join(self.tmp_dir.name, 'tzdata2020a.tar.gz')
+        with tarfile.open(tarball, 'w:gz') as tar:
+            tar.add(
+                os.path.join(self.tmp_dir.name, 'europe'), arcname='europe')
+
+        extractor = Extractor(tarball)
+        self.assertRaises(Exception, extractor.parse)
+
+    def test_parse_parallel_same_as_serial(self) -> None:
+        serial = Extractor(self.tmp_dir.name)
+        serial.parse()
+        parallel = Extractor(self.tmp_dir.name, jobs=2)
+        parallel.parse()
+
+        self.assertEqual(serial.rule_lines, parallel.rule_lines)
+        self.assertEqual(serial.zone_lines, parallel.zone_lines)
+        self.assertEqual(serial.link_lines, parallel.link_lines)
+        self.assertEqual(serial.get_data(), parallel.get_data())
+        self.assertEqual(
+            list(serial.zones_map.keys()), list(parallel.zones_map.keys()))
+
+
 if __name__ == '__main__':
     unittest.main()
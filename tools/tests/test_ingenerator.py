@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+#
+# Copyright 2020 Brian T. Park
+#
+# MIT License
+
+import unittest
+from typing import Any
+from typing import List
+from typing import Tuple
+from tzdb.extractor import _process_rule_line
+from tzdb.extractor import _process_zone_line
+from tzdb.transformer import Transformer
+from zonedb.ingenerator import InlineGenerator
+from zonedb.ingenerator import ZoneEraCooked
+from zonedb.ingenerator import ZoneInfoCooked
+from zonedb.ingenerator import ZoneInfoCookedMap
+from zonedb.ingenerator import ZoneInfoMap
+from zonedb.ingenerator import ZonePolicyCooked
+from zonedb.ingenerator import ZonePolicyCookedMap
+from zonedb.ingenerator import ZonePolicyMap
+from zonedb.ingenerator import ZoneRuleCooked
+from zonedb.zone_specifier import ZoneSpecifier
+
+RULE_LINES = {
+    'US': [
+        'Rule US 1967 2006 - Oct lastSun 2:00 0 S',
+        'Rule US 1987 2006 - Apr Sun>=1 2:00 1:00 D',
+        'Rule US 2007 max - Mar Sun>=8 2:00 1:00 D',
+        'Rule US 2007 max - Nov Sun>=1 2:00 0 S',
+    ],
+    'EU': [
+        'Rule EU 1981 max - Mar lastSun 1:00u 1:00 S',
+        'Rule EU 1996 max - Oct lastSun 1:00u 0 -',
+    ],
+}
+
+ZONE_LINES = {
+    'America/Los_Angeles': [
+        '-7:52:58 - LMT 1883 Nov 18 12:07:02',
+        '-8:00 US P%sT',
+    ],
+    'Europe/Paris': [
+        '0:09:21 - LMT 1891 Mar 16',
+        '1:00 EU CE%sT',
+    ],
+    'Europe/Berlin': [
+        '0:53:28 - LMT 1893 Apr',
+        '1:00 EU CE%sT',
+    ],
+    'Asia/Kolkata': [
+        '5:53:28 - LMT 1854 Jun 28',
+        '5:30 - IST',
+    ],
+}
+
+
+def _generate() -> Tuple[
+    ZoneInfoMap, ZonePolicyMap, ZoneInfoCookedMap, ZonePolicyCookedMap,
+]:
+    """Feed the Transformer output through both paths of InlineGenerator."""
+    zones_map = {
+        name: [_process_zone_line(line) for line in lines]
+        for name, lines in ZONE_LINES.items()
+    }
+    rules_map = {
+        name: [_process_rule_line(line) for line in lines]
+        for name, lines in RULE_LINES.items()
+    }
+    transformer = Transformer(
+        zones_map, rules_map, {}, 'extended', 2000, 2038, 60, 60, False)
+    transformer.transform()
+    (zones_map, rules_map) = transformer.get_data()[:2]
+
+    (zone_infos, zone_policies) = InlineGenerator(
+        zones_map, rules_map).generate_maps()
+    (zone_infos_cooked, zone_policies_cooked) = InlineGenerator(
+        zones_map, rules_map).generate_cooked_maps()
+    return (zone_infos, zone_policies, zone_infos_cooked, zone_policies_cooked)
+
+
+def _rule_fields(rule: ZoneRuleCooked) -> List[Any]:
+    return [getattr(rule, s) for s in ZoneRuleCooked.__slots__]
+
+
+def _era_fields(era: ZoneEraCooked) -> List[Any]:
+    """Return the fields of the ZoneEraCooked, with its ZonePolicyCooked
+    replaced by its name and the fields of its rules.
+    """
+    fields = []
+    for s in ZoneEraCooked.__slots__:
+        value = getattr(era, s)
+        if isinstance(value, ZonePolicyCooked):
+            value = (value.name, [_rule_fields(r) for r in value.rules])
+        fields.append(value)
+    return fields
+
+
+class TestInlineGenerator(unittest.TestCase):
+    def test_cooked_maps_match_dict_maps(self) -> None:
+        (zone_infos, zone_policies, zone_infos_cooked, zone_policies_cooked) \
+            = _generate()
+        self.assertEqual(sorted(zone_infos), sorted(zone_infos_cooked))
+        self.assertEqual(sorted(zone_policies), sorted(zone_policies_cooked))
+
+        for name, zone_info in zone_infos.items():
+            from_dict = ZoneInfoCooked(zone_info)
+            cooked = zone_infos_cooked[name]
+            self.assertEqual(from_dict.name, cooked.name)
+            self.assertEqual(
+                [_era_fields(era) for era in from_dict.eras],
+                [_era_fields(era) for era in cooked.eras])
+
+        for name, zone_policy in zone_policies.items():
+            from_dict_policy = ZonePolicyCooked(zone_policy)
+            cooked_policy = zone_policies_cooked[name]
+            self.assertEqual(from_dict_policy.name, cooked_policy.name)
+            self.assertEqual(
+                [_rule_fields(r) for r in from_dict_policy.rules],
+                [_rule_fields(r) for r in cooked_policy.rules])
+
+    def test_cooked_policies_are_shared(self) -> None:
+        (_, _, zone_infos_cooked, zone_policies_cooked) = _generate()
+        eu = zone_policies_cooked['EU']
+        self.assertIs(eu, zone_infos_cooked['Europe/Paris'].eras[-1].zonePolicy)
+        self.assertIs(
+            eu, zone_infos_cooked['Europe/Berlin'].eras[-1].zonePolicy)
+
+    def test_zone_specifier_uses_cooked_maps(self) -> None:
+        (zone_infos, _, zone_infos_cooked, _) = _generate()
+        for name, zone_info in zone_infos.items():
+            cooked = zone_infos_cooked[name]
+            from_dict = ZoneSpecifier(zone_info)
+            from_cooked = ZoneSpecifier(cooked)
+            self.assertIs(cooked, from_cooked.zone_info)
+            for year in range(2000, 2038):
+                from_dict.init_for_year(year)
+                from_cooked.init_for_year(year)
+                self.assertEqual(
+                    [repr(t) for t in from_dict.transitions],
+                    [repr(t) for t in from_cooked.transitions],
+                    '%s: %d' % (name, year))
+
+
+if __name__ == '__main__':
+    unittest.main()
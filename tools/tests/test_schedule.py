@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+#
+# Copyright 2020 Brian T. Park
+#
+# MIT License
+
+import unittest
+from datetime import datetime
+from datetime import timezone
+from zonedbpy import zone_infos
+from zonedb.schedule import Recurrence
+from zonedb.schedule import ScheduleExpander
+from zonedb.zone_specifier import ACETIME_EPOCH
+
+# Every day at 02:30, which falls into the spring-forward gap of the US zones.
+DAILY_0230 = Recurrence(
+    month=0, on_day_of_week=0, on_day_of_month=0, at_seconds=9000)
+
+# Every day at 01:30, which falls into the fall-back overlap of the US zones.
+DAILY_0130 = Recurrence(
+    month=0, on_day_of_week=0, on_day_of_month=0, at_seconds=5400)
+
+# First Sunday of the month at 09:00.
+FIRST_SUNDAY_0900 = Recurrence(
+    month=0, on_day_of_week=7, on_day_of_month=1, at_seconds=32400)
+
+
+def _to_epoch_seconds(
+    year: int, month: int, day: int, hour: int, minute: int,
+) -> int:
+    dt = datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
+    return int((dt - ACETIME_EPOCH).total_seconds())
+
+
+class TestScheduleExpander(unittest.TestCase):
+    def test_daily(self) -> None:
+        expander = ScheduleExpander(zone_infos.ZONE_INFO_America_Los_Angeles)
+        epochs = expander.expand(DAILY_0230, 2018, 2019)
+        self.assertEqual(365, len(epochs))
+        # 2018-01-01T02:30-08:00
+        self.assertEqual(_to_epoch_seconds(2018, 1, 1, 10, 30), epochs[0])
+        # 2018-07-01T02:30-07:00
+        self.assertIn(_to_epoch_seconds(2018, 7, 1, 9, 30), epochs)
+
+    def test_gap(self) -> None:
+        # 2018-03-11T02:30 does not exist in Los Angeles.
+        gap_epoch = _to_epoch_seconds(2018, 3, 11, 10, 30)
+
+        expander = ScheduleExpander(zone_infos.ZONE_INFO_America_Los_Angeles)
+        epochs = expander.expand(DAILY_0230, 2018, 2019)
+        self.assertIn(gap_epoch, epochs)
+
+        expander = ScheduleExpander(
+            zone_infos.ZONE_INFO_America_Los_Angeles, gap='skip')
+        epochs = expander.expand(DAILY_0230, 2018, 2019)
+        self.assertEqual(364, len(epochs))
+        self.assertNotIn(gap_epoch, epochs)
+
+    def test_overlap(self) -> None:
+        # 2018-11-04T01:30 occurs at both -07:00 and -08:00 in Los Angeles.
+        earlier = _to_epoch_seconds(2018, 11, 4, 8, 30)
+        later = _to_epoch_seconds(2018, 11, 4, 9, 30)
+
+        expander = ScheduleExpander(zone_infos.ZONE_INFO_America_Los_Angeles)
+        epochs = expander.expand(DAILY_0130, 2018, 2019)
+        self.assertEqual(365, len(epochs))
+        self.assertIn(earlier, epochs)
+        self.assertNotIn(later, epochs)
+
+        expander = ScheduleExpander(
+            zone_infos.ZONE_INFO_America_Los_Angeles, overlap='later')
+        epochs = expander.expand(DAILY_0130, 2018, 2019)
+        self.assertNotIn(earlier, epochs)
+        self.assertIn(later, epochs)
+
+        expander = ScheduleExpander(
+            zone_infos.ZONE_INFO_America_Los_Angeles, overlap='both')
+        epochs = expander.expand(DAILY_0130, 2018, 2019)
+        self.assertEqual(366, len(epochs))
+        self.assertIn(earlier, epochs)
+        self.assertIn(later, epochs)
+
+    def test_first_sunday(self) -> None:
+        expander = ScheduleExpander(zone_infos.ZONE_INFO_Europe_Paris)
+        epochs = expander.expand(FIRST_SUNDAY_0900, 2020, 2021)
+        self.assertEqual(12, len(epochs))
+        # 2020-01-05T09:00+01:00, 2020-07-05T09:00+02:00
+        self.assertEqual(_to_epoch_seconds(2020, 1, 5, 8, 0), epochs[0])
+        self.assertEqual(_to_epoch_seconds(2020, 7, 5, 7, 0), epochs[6])
+
+    def test_unknown_policy(self) -> None:
+        with self.assertRaises(Exception):
+            ScheduleExpander(
+                zone_infos.ZONE_INFO_America_Los_Angeles, gap='later')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,14 @@
 
 import unittest
 from collections import OrderedDict
+from typing import Tuple
+from tzdb.extractor import LinksMap
+from tzdb.extractor import MAX_UNTIL_YEAR
+from tzdb.extractor import RulesMap
+from tzdb.extractor import ZonesMap
+from tzdb.extractor import _process_rule_line
+from tzdb.extractor import _process_zone_line
+from tzdb.transformer import Transformer
 from tzdb.transformer import _parse_on_day_string
 from tzdb.transformer import _days_in_month
 from tzdb.transformer import calc_day_of_month
@@ -17,6 +25,53 @@ from tzdb.transformer import truncate_to_granularity
 from tzdb.transformer import INVALID_SECONDS
 from tzdb.transformer import hash_name
 from tzdb.transformer import add_string
+from tzdb.transformer import _find_multiple_transitions_in_month
+from tzdb.transformer import RuleIndex
+from tzdb.transformer import find_matching_rules
+from tzdb.transformer import find_latest_prior_rules
+from tzdb.transformer import find_earliest_subsequent_rules
+
+RULE_LINES = {
+    'US': [
+        'Rule US 1967 2006 - Oct lastSun 2:00 0 S',
+        'Rule US 1987 2006 - Apr Sun>=1 2:00 1:00 D',
+        'Rule US 2007 max - Mar Sun>=8 2:00 1:00 D',
+        'Rule US 2007 max - Nov Sun>=1 2:00 0 S',
+    ],
+    'EU': [
+        'Rule EU 1981 max - Mar lastSun 1:00u 1:00 S',
+        'Rule EU 1996 max - Oct lastSun 1:00u 0 -',
+    ],
+}
+
+ZONE_LINES = {
+    'America/Los_Angeles': [
+        '-7:52:58 - LMT 1883 Nov 18 12:07:02',
+        '-8:00 US P%sT',
+    ],
+    'Europe/Paris': [
+        '0:09:21 - LMT 1891 Mar 16',
+        '1:00 EU CE%sT',
+    ],
+}
+
+LINKS_MAP = {
+    'Europe/Monaco': 'Europe/Paris',
+    'US/Pacific': 'America/Los_Angeles',
+}
+
+
+def _create_maps() -> Tuple[ZonesMap, RulesMap, LinksMap]:
+    """Return new copies of the maps created by the Extractor."""
+    zones_map: ZonesMap = {
+        name: [_process_zone_line(line) for line in lines]
+        for name, lines in ZONE_LINES.items()
+    }
+    rules_map: RulesMap = {
+        name: [_process_rule_line(line) for line in lines]
+        for name, lines in RULE_LINES.items()
+    }
+    return (zones_map, rules_map, dict(LINKS_MAP))
 
 
 class TestParseOnDayString(unittest.TestCase):
@@ -138,5 +193,248 @@ class TestHash(unittest.TestCase):
         self.assertEqual(252819604, hash_name('abcde'))
 
 
+class TestFindMultipleTransitionsInMonth(unittest.TestCase):
+    def test_no_overlap(self) -> None:
+        rules = [_process_rule_line(line) for line in RULE_LINES['US']]
+        self.assertIsNone(_find_multiple_transitions_in_month(rules))
+
+    def test_overlap(self) -> None:
+        rules = [_process_rule_line(line) for line in [
+            'Rule X 2000 max - Mar lastSun 2:00 1:00 S',
+            'Rule X 2010 2012 - Mar Sun>=1 2:00 0 -',
+        ]]
+        self.assertEqual(
+            (2, 2012, 3), _find_multiple_transitions_in_month(rules))
+
+        # The overlap of the month whose first rule comes last is reported.
+        rules += [_process_rule_line(line) for line in [
+            'Rule X 1990 1995 - Apr lastSun 2:00 1:00 S',
+            'Rule X 1995 only - Apr Sun>=1 2:00 0 -',
+        ]]
+        self.assertEqual(
+            (2, 1995, 4), _find_multiple_transitions_in_month(rules))
+
+
+class TestRuleIndex(unittest.TestCase):
+    def test_same_as_scan(self) -> None:
+        # A DST transition in Mar and Oct for each year in [1950, 2000),
+        # followed by rules until 'max'.
+        lines = []
+        for year in range(1950, 2000):
+            lines.append(f'Rule X {year} only - Mar lastSun 2:00 1:00 S')
+            lines.append(f'Rule X {year} only - Oct lastSun 2:00 0 -')
+        lines.append('Rule X 2000 max - Mar lastSun 2:00 1:00 S')
+        lines.append('Rule X 2000 max - Oct lastSun 2:00 0 -')
+        rules = [_process_rule_line(line) for line in lines]
+        index = RuleIndex(rules)
+        self.assertTrue(index.indexed)
+
+        for year in [1900, 1950, 1975, 1999, 2000, 2020, 9999, 10000]:
+            self.assertEqual(
+                find_latest_prior_rules(rules, year),
+                index.find_latest_prior_rules(year))
+            self.assertEqual(
+                find_earliest_subsequent_rules(rules, year),
+                index.find_earliest_subsequent_rules(year))
+            for until in [year, year + 1, year + 30, 10000]:
+                self.assertEqual(
+                    find_matching_rules(rules, year, until),
+                    index.find_matching_rules(year, until))
+
+
+class TestTransformer(unittest.TestCase):
+    def test_transform(self) -> None:
+        (zones_map, rules_map, links_map) = _create_maps()
+        transformer = Transformer(
+            zones_map, rules_map, links_map, 'extended', 2000, 2038, 60, 60,
+            False)
+        transformer.transform()
+        (zones_map, rules_map, links_map) = transformer.get_data()[:3]
+        self.assertEqual(['America/Los_Angeles', 'Europe/Paris'],
+                         list(zones_map.keys()))
+        self.assertEqual(1, len(zones_map['America/Los_Angeles']))
+        # The 1967-2006 Rules are the most recent prior Rules.
+        self.assertEqual(4, len(rules_map['US']))
+        self.assertEqual(LINKS_MAP, links_map)
+        self.assertEqual([], transformer.pass_profiles)
+
+    def test_profile(self) -> None:
+        (zones_map, rules_map, links_map) = _create_maps()
+        transformer = Transformer(
+            zones_map, rules_map, links_map, 'extended', 2000, 2038, 60, 60,
+            False, profile=True)
+        transformer.transform()
+        profiles = {p['name']: p for p in transformer.pass_profiles}
+
+        profile = profiles['_remove_zone_eras_too_old']
+        self.assertEqual({'zones': 2, 'eras': 4}, profile['input'])
+        self.assertEqual({'zones': 2, 'eras': 2}, profile['output'])
+        self.assertGreaterEqual(profile['seconds'], 0)
+
+        profile = profiles['_mark_rules_used_by_zones']
+        self.assertEqual(
+            {'zones': 2, 'eras': 2, 'policies': 2, 'rules': 6},
+            profile['input'])
+
+        profile = profiles['_create_rules_with_anchor_transition']
+        self.assertEqual({'policies': 2, 'rules': 6}, profile['output'])
+
+    def test_fused(self) -> None:
+        for scope in ['basic', 'extended']:
+            results = []
+            for fused in [False, True]:
+                (zones_map, rules_map, links_map) = _create_maps()
+                transformer = Transformer(
+                    zones_map, rules_map, links_map, scope, 2000, 2038, 60,
+                    60, False, profile=True, fused=fused)
+                transformer.transform()
+                results.append(transformer.get_data())
+                names = [p['name'] for p in transformer.pass_profiles]
+                self.assertEqual(
+                    fused, '_transform_zones_fused' in names)
+            self.assertEqual(results[0], results[1])
+
+    def test_variants(self) -> None:
+        (zones_map, rules_map, links_map) = _create_maps()
+        transformer = Transformer(
+            zones_map, rules_map, links_map, 'extended', 2000, 2038, 60, 60,
+            False)
+        variants = transformer.transform_variants([
+            {'scope': 'basic', 'offset_granularity': 900, 'strict': True},
+            {},
+        ])
+        self.assertEqual(2, len(variants))
+        self.assertEqual('basic', variants[0].scope)
+        self.assertEqual(900, variants[0].offset_granularity)
+        self.assertEqual('extended', variants[1].scope)
+        # The maps of the original Transformer are not modified.
+        self.assertEqual(_create_maps(), (zones_map, rules_map, links_map))
+
+        for variant in variants:
+            (zones_map, rules_map, links_map) = _create_maps()
+            expected = Transformer(
+                zones_map, rules_map, links_map, variant.scope, 2000, 2038,
+                variant.until_at_granularity, variant.offset_granularity,
+                variant.strict)
+            expected.transform()
+            self.assertEqual(expected.get_data(), variant.get_data())
+
+    def test_in_place(self) -> None:
+        for scope in ['basic', 'extended']:
+            (zones_map, rules_map, links_map) = _create_maps()
+            expected = Transformer(
+                zones_map, rules_map, links_map, scope, 2000, 2038, 60, 60,
+                False)
+            expected.transform()
+            self.assertEqual([], expected.change_log)
+
+            (zones_map, rules_map, links_map) = _create_maps()
+            eras = zones_map['America/Los_Angeles']
+            transformer = Transformer(
+                zones_map, rules_map, links_map, scope, 2000, 2038, 60, 60,
+                False, in_place=True)
+            transformer.transform()
+            self.assertEqual(expected.get_data(), transformer.get_data())
+
+            # The maps and the lists of eras given to the Transformer are
+            # updated, instead of being replaced.
+            self.assertIs(zones_map, transformer.zones_map)
+            self.assertIs(rules_map, transformer.rules_map)
+            self.assertIs(links_map, transformer.links_map)
+            self.assertIs(eras, zones_map['America/Los_Angeles'])
+
+            removed = {
+                entry['name'] for entry in transformer.change_log
+                if entry['map'] == 'zones' and entry['change'] == 'removed'
+            }
+            self.assertEqual(set(expected.all_removed_zones), removed)
+            self.assertIn(
+                {
+                    'pass': '_remove_zone_eras_too_old',
+                    'map': 'zones',
+                    'name': 'America/Los_Angeles',
+                    'change': 'updated',
+                },
+                transformer.change_log)
+
+    def test_merge_contiguous_rules(self) -> None:
+        rules_map: RulesMap = {
+            'Rus': [
+                _process_rule_line(line) for line in [
+                    'Rule Rus 1981 1984 - Apr 1 0:00 1:00 S',
+                    'Rule Rus 1981 1983 - Oct 1 0:00 0 -',
+                    'Rule Rus 1984 1995 - Sep lastSun 2:00s 0 -',
+                    'Rule Rus 1985 2010 - Mar lastSun 2:00s 1:00 S',
+                    'Rule Rus 1996 only - Sep lastSun 2:00s 0 -',
+                    'Rule Rus 1997 2010 - Sep lastSun 2:00s 0 -',
+                    'Rule Rus 2012 only - Mar lastSun 2:00s 1:00 S',
+                ]
+            ],
+            'US': [_process_rule_line(line) for line in RULE_LINES['US']],
+        }
+        transformer = Transformer({}, {}, {}, 'extended', 2000, 2038, 60, 60,
+                                  False)
+        results = transformer._merge_contiguous_rules(rules_map)
+
+        # Only the Sep rules are merged. The Mar rules are not contiguous.
+        rules = results['Rus']
+        self.assertEqual(5, len(rules))
+        self.assertEqual(
+            [(1981, 1984), (1981, 1983), (1984, 2010), (1985, 2010),
+                (2012, 2012)],
+            [(rule.fromYear, rule.toYear) for rule in rules])
+        self.assertTrue(rules[2].rawLine.startswith('Merged: '))
+        # The original rules are not modified.
+        self.assertEqual(1995, rules_map['Rus'][2].toYear)
+        self.assertIs(rules_map['US'], results['US'])
+
+    def test_merge_equivalent_eras(self) -> None:
+        (zones_map, rules_map, links_map) = _create_maps()
+        zones_map['America/Montevideo'] = [
+            _process_zone_line(line) for line in [
+                '-3:00 US -03/-02 2010',
+                '-3:00 US -03/-02 2015 Mar 10',
+                '-3:00 - -03 2020',
+                '-3:00 - -03',
+            ]
+        ]
+        eras = list(zones_map['America/Montevideo'])
+        transformer = Transformer(
+            zones_map, rules_map, links_map, 'extended', 2000, 2038, 60, 60,
+            False)
+        transformer.transform()
+
+        merged_eras = transformer.zones_map['America/Montevideo']
+        self.assertEqual(2, len(merged_eras))
+        self.assertEqual(
+            (2015, 3, 10), (merged_eras[0].untilYear,
+                            merged_eras[0].untilMonth,
+                            merged_eras[0].untilDay))
+        self.assertEqual(MAX_UNTIL_YEAR, merged_eras[1].untilYear)
+        self.assertTrue(merged_eras[1].rawLine.startswith('Merged: '))
+        self.assertEqual(
+            {
+                'merged equivalent eras at UNTIL: 2010-01-01 0s',
+                'merged equivalent eras at UNTIL: 2020-01-01 0s',
+            },
+            transformer.all_notable_zones['America/Montevideo'])
+        # The original eras are not modified.
+        self.assertEqual(2020, eras[2].untilYear)
+
+    def test_jobs(self) -> None:
+        for scope in ['basic', 'extended']:
+            results = []
+            for jobs in [1, 2]:
+                (zones_map, rules_map, links_map) = _create_maps()
+                transformer = Transformer(
+                    zones_map, rules_map, links_map, scope, 2000, 2038, 60,
+                    60, False, jobs=jobs)
+                transformer.transform()
+                results.append(transformer.get_data())
+            self.assertEqual(results[0], results[1])
+            self.assertEqual(
+                list(results[0][0].keys()), list(results[1][0].keys()))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -4,17 +4,24 @@
 #
 # MIT License
 
+import pickle
 import unittest
+from typing import Any
+from typing import List
+from typing import Tuple
 from zonedbpy import zone_infos
 # from zonedbpy import validation_data # reenable using zoneinfo.json?
 # from validation.tdgenerator import TestItem
 from zonedb.zone_specifier import DateTuple
 from zonedb.zone_specifier import Transition
 from zonedb.zone_specifier import ZoneMatch
+from zonedb.zone_specifier import ZONE_REGISTRY
 from zonedb.zone_specifier import ZoneSpecifier
+from zonedb.zone_specifier import register_zone_infos
 from zonedb.zone_specifier import CandidateFinderBasic
 from zonedb.zone_specifier import _compare_transition_to_match
 from zonedb.zone_specifier import _compare_transition_to_match_fuzzy
+from zonedb.ingenerator import ZoneInfoCooked
 
 
 # class TestValidationData(unittest.TestCase):
@@ -883,5 +890,184 @@ class TestZoneSpecifierMatchesAndTransitions(unittest.TestCase):
         self.assertEqual(0 * 3600, transitions[1].deltaSeconds)
 
 
+class TestZoneSpecifierLazyEvaluation(unittest.TestCase):
+    def test_lazy_evaluation_matches_init_for_year(self) -> None:
+        """The lazy evaluation path must return the same OffsetInfo as the
+        full init_for_year() path, including at the boundaries of each
+        Transition and ZoneEra.
+        """
+        for zone_info in [
+            zone_infos.ZONE_INFO_America_Los_Angeles,
+            zone_infos.ZONE_INFO_America_Indiana_Petersburg,
+            zone_infos.ZONE_INFO_America_Moncton,
+            zone_infos.ZONE_INFO_Europe_Istanbul,
+            zone_infos.ZONE_INFO_Europe_Dublin,
+            zone_infos.ZONE_INFO_Pacific_Apia,
+            zone_infos.ZONE_INFO_Asia_Kamchatka,
+        ]:
+            full_specifier = ZoneSpecifier(zone_info)
+            for year in range(2000, 2020):
+                full_specifier.init_for_year(year)
+                for transition in full_specifier.transitions:
+                    start = transition.startEpochSecond
+                    for epoch_seconds in [start - 1, start, start + 1]:
+                        expected = ZoneSpecifier(zone_info) \
+                            .get_timezone_info_for_seconds(epoch_seconds)
+                        lazy_specifier = ZoneSpecifier(
+                            zone_info, lazy_evaluation=True)
+                        self.assertEqual(
+                            expected,
+                            lazy_specifier.get_timezone_info_for_seconds(
+                                epoch_seconds),
+                            '%s: %d' % (zone_info['name'], epoch_seconds))
+
+    def test_lazy_evaluation_leaves_full_window_untouched(self) -> None:
+        zone_specifier = ZoneSpecifier(
+            zone_infos.ZONE_INFO_America_Los_Angeles, lazy_evaluation=True)
+        zone_specifier.get_timezone_info_for_seconds(0)
+        self.assertEqual(0, zone_specifier.year)
+        self.assertEqual([], zone_specifier.transitions)
+
+        # The full window is still available on demand.
+        zone_specifier.init_for_year(2000)
+        self.assertEqual(3, len(zone_specifier.transitions))
+
+
+def _to_observables(transitions: List[Transition]) -> List[Tuple[Any, ...]]:
+    """Return the fields of the Transitions which are visible to the users
+    of ZoneSpecifier. The isActive flag and originalTransitionTime are
+    bookkeeping of the various ActiveSelector classes.
+    """
+    return [(
+        t.startDateTime,
+        t.untilDateTime,
+        t.transitionTime,
+        t.startEpochSecond,
+        t.offsetSeconds,
+        t.deltaSeconds,
+        t.format,
+        t.letter,
+        t.abbrev,
+    ) for t in transitions]
+
+
+class TestZoneSpecifierPrunedCandidates(unittest.TestCase):
+    def test_pruned_matches_other_algorithms(self) -> None:
+        """The Pruned/SinglePass pair must produce the same Transitions as
+        each of the 4 combinations of the other finders and selectors, for
+        all zones over [2000, 2038).
+        """
+        for _, zone_info in sorted(zone_infos.ZONE_INFO_MAP.items()):
+            pruned = ZoneSpecifier(zone_info, prune_candidates=True)
+            others = [
+                ZoneSpecifier(
+                    zone_info,
+                    in_place_transitions=in_place_transitions,
+                    optimize_candidates=optimize_candidates)
+                for in_place_transitions in [False, True]
+                for optimize_candidates in [False, True]
+            ]
+            for year in range(2000, 2038):
+                pruned.init_for_year(year)
+                expected = _to_observables(pruned.transitions)
+                for other in others:
+                    other.init_for_year(year)
+                    self.assertEqual(
+                        expected,
+                        _to_observables(other.transitions),
+                        '%s: %d' % (zone_info['name'], year))
+
+    def test_pruned_creates_fewer_candidates(self) -> None:
+        pruned = ZoneSpecifier(
+            zone_infos.ZONE_INFO_America_Los_Angeles, prune_candidates=True)
+        optimized = ZoneSpecifier(zone_infos.ZONE_INFO_America_Los_Angeles)
+        pruned.init_for_year(2018)
+        optimized.init_for_year(2018)
+        self.assertLess(
+            len(pruned.all_candidate_transitions),
+            len(optimized.all_candidate_transitions))
+
+
+class TestZoneSpecifierPickle(unittest.TestCase):
+    def tearDown(self) -> None:
+        ZONE_REGISTRY.clear()
+
+    def test_pickle_round_trip(self) -> None:
+        zone_specifier = ZoneSpecifier(
+            zone_infos.ZONE_INFO_America_Los_Angeles,
+            viewing_months=13,
+            optimize_candidates=False)
+        zone_specifier.init_for_year(2010)
+
+        # The Transitions are recalculated by the first query.
+        restored = pickle.loads(pickle.dumps(zone_specifier))
+        self.assertEqual('America/Los_Angeles', restored.zone_info.name)
+        self.assertEqual(13, restored.viewing_months)
+        self.assertFalse(restored.optimize_candidates)
+        self.assertEqual(0, restored.year)
+        self.assertEqual([], restored.transitions)
+
+        epoch_seconds = (10 * 365 + 180) * 86400  # mid-2010
+        self.assertEqual(
+            zone_specifier.get_timezone_info_for_seconds(epoch_seconds),
+            restored.get_timezone_info_for_seconds(epoch_seconds))
+        self.assertEqual(2010, restored.year)
+        self.assertEqual(
+            [repr(t) for t in zone_specifier.transitions],
+            [repr(t) for t in restored.transitions])
+
+    def test_pickle_transitions(self) -> None:
+        options = [
+            {'in_place_transitions': False, 'optimize_candidates': False},
+            {'in_place_transitions': True, 'optimize_candidates': True},
+            {'prune_candidates': True},
+        ]
+        for name in ['America/Los_Angeles', 'Europe/Dublin', 'Asia/Tehran',
+                     'Australia/Lord_Howe', 'Africa/Casablanca']:
+            for kwargs in options:
+                zone_specifier = ZoneSpecifier(
+                    zone_infos.ZONE_INFO_MAP[name],
+                    pickle_transitions=True,
+                    **kwargs)  # type: ignore
+                zone_specifier.init_for_year(2020)
+
+                restored = pickle.loads(pickle.dumps(zone_specifier))
+                self.assertTrue(restored.pickle_transitions)
+                self.assertEqual(2020, restored.year)
+                self.assertEqual(
+                    zone_specifier.max_transition_buffer_size,
+                    restored.max_transition_buffer_size)
+                self.assertEqual(
+                    [repr(m) for m in zone_specifier.matches],
+                    [repr(m) for m in restored.matches])
+                self.assertEqual(
+                    [repr(t) for t in zone_specifier.transitions],
+                    [repr(t) for t in restored.transitions])
+                for era in (t.zoneEra for t in restored.transitions):
+                    self.assertIn(era, restored.zone_info.eras)
+
+    def test_pickle_falls_back_to_zonedbpy(self) -> None:
+        register_zone_infos(
+            {'Europe/Dublin': zone_infos.ZONE_INFO_Europe_Dublin})
+        zone_specifier = ZoneSpecifier(
+            zone_infos.ZONE_INFO_America_Los_Angeles)
+        restored = pickle.loads(pickle.dumps(zone_specifier))
+        self.assertEqual('America/Los_Angeles', restored.zone_info.name)
+
+    def test_pickle_uses_registry(self) -> None:
+        zone_info = ZoneInfoCooked(zone_infos.ZONE_INFO_Europe_Dublin)
+        register_zone_infos({'Europe/Dublin': zone_info})
+        restored = pickle.loads(pickle.dumps(ZoneSpecifier(zone_info)))
+        self.assertIs(zone_info, restored.zone_info)
+
+    def test_pickle_detects_different_registry(self) -> None:
+        zone_specifier = ZoneSpecifier(zone_infos.ZONE_INFO_Europe_Dublin)
+        data = pickle.dumps(zone_specifier)
+        register_zone_infos(
+            {'Europe/Dublin': zone_infos.ZONE_INFO_Europe_London})
+        with self.assertRaises(Exception):
+            pickle.loads(data)
+
+
 if __name__ == '__main__':
     unittest.main()
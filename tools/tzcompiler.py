@@ -26,8 +26,13 @@ using the --language flag:
   * --language arduino
   * --language python
 
-The raw TZ Database are parsed by extractor.py and processed
-transformer.py. The Transformer class accepts a number of options:
+The raw TZ Database are parsed by extractor.py, and processed by
+transformer.py, both using --jobs worker processes. The extracted data can be
+saved with '--snapshot {file}', and given to a later run with
+'--prev_snapshot {file}', which reparses only the Rule and Zone entries which
+changed in the new version of the TZ Database, and logs the added, removed and
+modified zones, policies and links. The Transformer class accepts a number of
+options:
 
   * --scope {basic | extended)
   * --start_year {start}
@@ -38,7 +43,12 @@ transformer.py. The Transformer class accepts a number of options:
   * --strict
 
 which determine which Rules or Zones are retained during the 'transformation'
-process.
+process. The '--transform_profile {file}' flag writes the wall time, the
+allocated memory, and the number of zones, eras, policies and rules before and
+after each pass of the Transformer, as a JSON file. The '--fused_transform' flag
+runs the zone passes of the Transformer in a single traversal of the zones. The
+'--in_place_transform' flag updates the maps of the Extractor in place, so that
+only one copy of the zones and rules is held through the pipeline.
 
 If --language arduino is selected, the following flags are used:
 
@@ -57,6 +67,7 @@ import logging
 import sys
 from typing_extensions import Protocol
 from tzdb.extractor import Extractor
+from tzdb.extractor import read_snapshot
 from tzdb.transformer import Transformer
 from tzdb.tzdbcollector import TzDbCollector, TzDb
 from zonedb.argenerator import ArduinoGenerator
@@ -86,7 +97,7 @@ def generate_zonedb(
     # so that ZoneSpecifier can be created.
     logging.info('==== Generating inlined zone_infos and zone_policies')
     inline_generator = InlineGenerator(tzdb['zones_map'], tzdb['rules_map'])
-    (zone_infos, zone_policies) = inline_generator.generate_maps()
+    (zone_infos, zone_policies) = inline_generator.generate_cooked_maps()
     logging.info(
         'zone_infos=%d; zone_policies=%d',
         len(zone_infos), len(zone_policies))
@@ -124,7 +135,8 @@ def generate_zonedb(
             'Checking years in [%d, %d)',
             tzdb['start_year'], tzdb['until_year'])
         estimator = BufSizeEstimator(
-            zone_infos, zone_policies, tzdb['start_year'], tzdb['until_year'])
+            tzdb['scope'], zone_infos, zone_policies, tzdb['start_year'],
+            tzdb['until_year'])
         (buf_sizes, max_size) = estimator.estimate()
         logging.info(
             'Num zones=%d; Max buffer size=%d',
@@ -157,7 +169,20 @@ def main() -> None:
 
     # Extractor flags.
     parser.add_argument(
-        '--input_dir', help='Location of the input directory', required=True)
+        '--input_dir',
+        help='Location of the input directory, tzdata tarball, or tzdata.zi',
+        required=True)
+    parser.add_argument(
+        '--jobs',
+        help='Number of worker processes (default: 1)',
+        type=int,
+        default=1)
+    parser.add_argument(
+        '--prev_snapshot',
+        help='Snapshot of a previous extraction, to reparse only the changes')
+    parser.add_argument(
+        '--snapshot',
+        help='File to save the snapshot of the extraction')
 
     # Transformer flags.
     parser.add_argument(
@@ -203,6 +228,19 @@ def main() -> None:
         help='Remove zones and rules not aligned at granularity time boundary',
         action='store_true',
         default=False)
+    parser.add_argument(
+        '--transform_profile',
+        help='Write the JSON profile of each pass of the Transformer to file')
+    parser.add_argument(
+        '--fused_transform',
+        help='Run the zone passes of the Transformer in a single traversal',
+        action='store_true',
+        default=False)
+    parser.add_argument(
+        '--in_place_transform',
+        help='Update the extracted maps in place instead of copying them',
+        action='store_true',
+        default=False)
 
     # Data pipeline selectors. Comma-separated list.
     # tzdb: generate 'tzdb.json'
@@ -293,10 +331,25 @@ def main() -> None:
 
     # Extract the TZ files
     logging.info('======== Extracting TZ Data files')
-    extractor = Extractor(args.input_dir)
+    snapshot = read_snapshot(args.prev_snapshot) \
+        if args.prev_snapshot else None
+    # Only the zonedb files, tzdb.json and the snapshots need the raw lines.
+    raw_lines = bool(actions & {'zonedb', 'tzdb'}) \
+        or bool(args.snapshot) or snapshot is not None
+    if args.snapshot or snapshot is not None:
+        # The snapshots need the data of all the years.
+        extractor = Extractor(
+            args.input_dir, args.jobs, snapshot=snapshot, raw_lines=raw_lines)
+    else:
+        extractor = Extractor(
+            args.input_dir, args.jobs, raw_lines=raw_lines,
+            start_year=args.start_year, until_year=args.until_year)
     extractor.parse()
     extractor.print_summary()
+    if args.snapshot:
+        extractor.write_snapshot(args.snapshot)
     rules_map, zones_map, links_map = extractor.get_data()
+    del extractor
 
     # Transform the TZ zones and rules
     logging.info('======== Transforming Zones and Rules')
@@ -311,14 +364,21 @@ def main() -> None:
         until_at_granularity,
         offset_granularity,
         args.strict,
+        profile=bool(args.transform_profile),
+        fused=args.fused_transform,
+        jobs=args.jobs,
+        in_place=args.in_place_transform,
     )
     transformer.transform()
     transformer.print_summary()
+    if args.transform_profile:
+        transformer.write_profile(args.transform_profile)
     (
         zones_map, rules_map, links_map, removed_zones, removed_policies,
         removed_links, notable_zones, notable_policies, notable_links,
         format_strings, zone_strings,
     ) = transformer.get_data()
+    del transformer
 
     # Collect TZ DB data into a single JSON-serializable object.
     tzdb_generator = TzDbCollector(
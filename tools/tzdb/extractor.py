@@ -62,14 +62,29 @@ Maybe it helps to think of the 'Link' command similar to the 'ln' link command
 in Unix, which has the same order of arguments as the 'cp' command.)
 """
 
+import copy
+import hashlib
+import io
+import json
 import logging
 import os
+import re
+import tarfile
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import TextIO
 from typing import Tuple
+from typing import Type
+from typing import TypeVar
+from typing import TYPE_CHECKING
+from typing import Union
+from typing import cast
 from typing_extensions import TypedDict
 
 # AceTime Epoch is 2000-01-01 00:00:00
@@ -101,64 +116,209 @@ INVALID_YEAR: int = -1
 INVALID_YEAR_TINY: int = -128
 
 
-# Note: I created ZoneEraRaw and ZoneRuleRaw to get some amount of interpreter
-# checking, so that a simple typo would not cause bugs. That was before I
-# learned about mypy and TypedDict. I *think* I could replace these with
-# TypedDict, but I'm not 100% sure.
+_RecordT = TypeVar('_RecordT', bound='RawRecord')
 
-class ZoneEraRaw(TypedDict, total=False):
+
+class RawRecord:
+    """Base class of ZoneEraRaw and ZoneRuleRaw. The fields are stored in
+    __slots__ instead of a dict, which uses less memory and is faster to
+    access. A field which was never set is missing, like a missing key of a
+    dict, so the derived fields exist only after the Transformer sets them.
+    The records are converted to dicts only at the JSON boundary (see
+    record_to_json()).
+    """
+    __slots__: Sequence[str] = ()
+
+    @classmethod
+    def from_dict(cls: Type[_RecordT], arg: Dict[str, Any]) -> _RecordT:
+        """Create the record from the dict created by to_dict()."""
+        result = cls.__new__(cls)
+        for key, value in arg.items():
+            setattr(result, key, value)
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields which are set, in the order of __slots__."""
+        return {s: getattr(self, s) for s in self.__slots__ if hasattr(self, s)}
+
+    def copy(self: _RecordT) -> _RecordT:
+        result = self.__class__.__new__(self.__class__)
+        for s in self.__slots__:
+            if hasattr(self, s):
+                setattr(result, s, getattr(self, s))
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RawRecord):
+            return NotImplemented
+        return self.__class__ is other.__class__ \
+            and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return '%s(%r)' % (self.__class__.__name__, self.to_dict())
+
+
+class ZoneEraRaw(RawRecord):
     """Represents the input records corresponding to the 'ZONE' lines in a
     tz database file.
     """
-    offsetString: str   # offset from UTC/GMT
-    rules: str  # name of the Rule in effect, '-', or minute offset
-    format: str  # abbreviation format (e.g. P%sT, E%ST, GMT/BST)
-    untilYear: int  # MAX_UNTIL_YEAR means 'max'
-    untilYearOnly: bool  # true if only the year is given
-    untilMonth: int  # 1-12
-    untilDayString: str  # e.g. 'lastSun', 'Sun>=3', or '1'-'31'
-    untilTime: str  # e.g. '2:00', '00:01'
-    untilTimeSuffix: str  # '', 's', 'w', 'g', 'u', 'z'
-    rawLine: str  # original ZONE line in TZ file
-
-    # These are derived from above and optional.
-    offsetSeconds: int  # offset from UTC/GMT in seconds
-    offsetSecondsTruncated: int  # offsetSeconds truncation granularity
-
-    # delta offset from UTC in seconds if RULES is DST offset string of the form
-    # hh:mm[:ss]
-    rulesDeltaSeconds: int
-
-    rulesDeltaSecondsTruncated: int  # rulesDeltaSeconds truncated granularity
-    untilDay: int  # 1-31
-    untilSeconds: int  # untilTime converted into total seconds
-    untilSecondsTruncated: int  # untilSeconds after truncation
-
-
-class ZoneRuleRaw(TypedDict, total=False):
+    # The order of the fields is the order of the keys in tzdb.json.
+    # yapf: disable
+    __slots__ = [
+        'offsetString',  # offset from UTC/GMT
+        'rules',  # name of the Rule in effect, '-', or minute offset
+        'format',  # abbreviation format (e.g. P%sT, E%ST, GMT/BST)
+        'untilYear',  # MAX_UNTIL_YEAR means 'max'
+        'untilYearOnly',  # true if only the year is given
+        'untilMonth',  # 1-12
+        'untilDayString',  # e.g. 'lastSun', 'Sun>=3', or '1'-'31'
+        'untilTime',  # e.g. '2:00', '00:01'
+        'untilTimeSuffix',  # '', 's', 'w', 'g', 'u', 'z'
+        'rawLine',  # original ZONE line in TZ file
+
+        # These are derived from above and optional.
+        'untilDay',  # 1-31
+        'untilSeconds',  # untilTime converted into total seconds
+        'untilSecondsTruncated',  # untilSeconds after truncation
+        'offsetSeconds',  # offset from UTC/GMT in seconds
+        'offsetSecondsTruncated',  # offsetSeconds truncation granularity
+        # delta offset from UTC in seconds if RULES is DST offset string of the
+        # form hh:mm[:ss]
+        'rulesDeltaSeconds',
+        'rulesDeltaSecondsTruncated',  # rulesDeltaSeconds truncated granularity
+    ]
+    # yapf: enable
+
+    # Hack because '__slots__' is unsupported by mypy. See
+    # https://github.com/python/mypy/issues/5941.
+    if TYPE_CHECKING:
+        offsetString: str
+        rules: str
+        format: str
+        untilYear: int
+        untilYearOnly: bool
+        untilMonth: int
+        untilDayString: str
+        untilTime: str
+        untilTimeSuffix: str
+        rawLine: str
+        untilDay: int
+        untilSeconds: int
+        untilSecondsTruncated: int
+        offsetSeconds: int
+        offsetSecondsTruncated: int
+        rulesDeltaSeconds: int
+        rulesDeltaSecondsTruncated: int
+
+    def __init__(
+        self,
+        offsetString: str,
+        rules: str,
+        format: str,
+        untilYear: int,
+        untilYearOnly: bool,
+        untilMonth: int,
+        untilDayString: str,
+        untilTime: str,
+        untilTimeSuffix: str,
+        rawLine: str,
+    ):
+        self.offsetString = offsetString
+        self.rules = rules
+        self.format = format
+        self.untilYear = untilYear
+        self.untilYearOnly = untilYearOnly
+        self.untilMonth = untilMonth
+        self.untilDayString = untilDayString
+        self.untilTime = untilTime
+        self.untilTimeSuffix = untilTimeSuffix
+        self.rawLine = rawLine
+
+
+class ZoneRuleRaw(RawRecord):
     """Represents the input records corresponding to the 'RULE' lines in a
     tz database file.
     """
-    fromYear: int  # from year
-    toYear: int  # to year, 1 to MAX_YEAR (9999) means 'max'
-    inMonth: int  # month index (1-12)
-    onDay: str  # 'lastSun' or 'Sun>=2', or 'dayOfMonth'
-    atTime: str  # hour at which to transition to and from DST
-    atTimeSuffix: str  # 's', 'w', 'u'
-    deltaOffset: str  # offset from Standard time ('SAVE' field)
-    letter: str  # 'D', 'S', '-'
-    rawLine: str  # the original RULE line from the TZ file
-
-    # These are derived from above and are optional.
-    onDayOfWeek: int  # 1=Monday, 7=Sunday, 0={exact dayOfMonth match}
-    onDayOfMonth: int  # 1-31 "dow>=xx", -(1-31) "dow<=xx", 0={lastXxx}
-    atSeconds: int  # atTime in seconds since 00:00:00
-    atSecondsTruncated: int  # atSeconds after truncation
-    deltaSeconds: int  # offset from Standard time in seconds
-    deltaSecondsTruncated: int  # deltaSeconds after truncation
-    used: Optional[bool]  # whether or not the rule is used by a zone
+    # The order of the fields is the order of the keys in tzdb.json.
+    # yapf: disable
+    __slots__ = [
+        'fromYear',  # from year
+        'toYear',  # to year, 1 to MAX_YEAR (9999) means 'max'
+        'inMonth',  # month index (1-12)
+        'onDay',  # 'lastSun' or 'Sun>=2', or 'dayOfMonth'
+        'atTime',  # hour at which to transition to and from DST
+        'atTimeSuffix',  # 's', 'w', 'u'
+        'deltaOffset',  # offset from Standard time ('SAVE' field)
+        'letter',  # 'D', 'S', '-'
+        'rawLine',  # the original RULE line from the TZ file
+
+        # These are derived from above and are optional.
+        'atSeconds',  # atTime in seconds since 00:00:00
+        'atSecondsTruncated',  # atSeconds after truncation
+        'deltaSeconds',  # offset from Standard time in seconds
+        'deltaSecondsTruncated',  # deltaSeconds after truncation
+        'onDayOfWeek',  # 1=Monday, 7=Sunday, 0={exact dayOfMonth match}
+        'onDayOfMonth',  # 1-31 "dow>=xx", -(1-31) "dow<=xx", 0={lastXxx}
+        'used',  # whether or not the rule is used by a zone
+    ]
+    # yapf: enable
+
+    # Hack because '__slots__' is unsupported by mypy. See
+    # https://github.com/python/mypy/issues/5941.
+    if TYPE_CHECKING:
+        fromYear: int
+        toYear: int
+        inMonth: int
+        onDay: str
+        atTime: str
+        atTimeSuffix: str
+        deltaOffset: str
+        letter: str
+        rawLine: str
+        atSeconds: int
+        atSecondsTruncated: int
+        deltaSeconds: int
+        deltaSecondsTruncated: int
+        onDayOfWeek: int
+        onDayOfMonth: int
+        used: Optional[bool]
+
+    def __init__(
+        self,
+        fromYear: int,
+        toYear: int,
+        inMonth: int,
+        onDay: str,
+        atTime: str,
+        atTimeSuffix: str,
+        deltaOffset: str,
+        letter: str,
+        rawLine: str,
+    ):
+        self.fromYear = fromYear
+        self.toYear = toYear
+        self.inMonth = inMonth
+        self.onDay = onDay
+        self.atTime = atTime
+        self.atTimeSuffix = atTimeSuffix
+        self.deltaOffset = deltaOffset
+        self.letter = letter
+        self.rawLine = rawLine
+
+
+def record_to_json(obj: Any) -> Dict[str, Any]:
+    """The 'default' function of json.dump() which converts the ZoneEraRaw and
+    ZoneRuleRaw records into dicts.
+    """
+    if isinstance(obj, RawRecord):
+        return obj.to_dict()
+    raise TypeError(
+        f'Object of type {obj.__class__.__name__} is not JSON serializable')
 
 
+# Comments, removed from the whole text of a zone file by the bulk lexer.
+_COMMENT_PATTERN = re.compile(r'#[^\n]*')
+
 # ruleName(policyName) -> ZoneRuleRaw[]
 RulesMap = Dict[str, List[ZoneRuleRaw]]
 
@@ -168,6 +328,45 @@ ZonesMap = Dict[str, List[ZoneEraRaw]]
 # linkName -> zoneName
 LinksMap = Dict[str, str]
 
+# An item yielded by Extractor.stream(), one of:
+#   ('Zone', zoneName, ZoneEraRaw[])
+#   ('Rule', policyName, ZoneRuleRaw[])
+#   ('Link', linkName, zoneName)
+ExtractedItem = Tuple[str, str, Union[List[ZoneEraRaw], List[ZoneRuleRaw], str]]
+
+# A Rule which ends before the year range of the Extractor, whose parsing is
+# deferred: ((toYear, inMonth), index in its policy, tokens, rawLine).
+PriorRule = Tuple[Tuple[int, int], int, List[str], str]
+
+
+class ExtractorSnapshot(TypedDict):
+    """The records of a previous extraction, with the hash of the lines of
+    each Rule and Zone block, used by the incremental mode of the Extractor.
+    It can be saved as JSON between two runs (see Extractor.write_snapshot()
+    and read_snapshot()).
+    """
+    ruleHashes: Dict[str, str]  # policyName -> hash of its Rule lines
+    zoneHashes: Dict[str, str]  # zoneName -> hash of its Zone lines
+    rulesMap: RulesMap
+    zonesMap: ZonesMap
+    linksMap: LinksMap
+
+
+class ChangeSet(TypedDict):
+    """The names of the zones, policies and links which were added, removed or
+    modified since the ExtractorSnapshot given to the Extractor. Each list is
+    sorted.
+    """
+    addedZones: List[str]
+    removedZones: List[str]
+    modifiedZones: List[str]
+    addedPolicies: List[str]
+    removedPolicies: List[str]
+    modifiedPolicies: List[str]
+    addedLinks: List[str]
+    removedLinks: List[str]
+    modifiedLinks: List[str]
+
 
 class Extractor:
     """Reads each test data section from the given file-like object (e.g.
@@ -175,12 +374,70 @@ class Extractor:
 
     Usage:
 
-        extractor = Extractor(input_dir)
+        extractor = Extractor(input_dir [, jobs] [, bulk_lexer] [, snapshot]
+            [, raw_lines] [, start_year] [, until_year])
         extractor.parse()
         extractor.print_summary()
         extractor.zones_map
         extractor.rules_map
         ...
+
+    or:
+
+        extractor = Extractor(input_dir, raw_lines=False)
+        for (kind, name, value) in extractor.stream():
+            ...
+
+    The 'input_dir' is either a directory of the TZ Database files, a
+    tzdata release tarball (e.g. tzdata2020a.tar.gz), or the compact
+    'tzdata.zi' file which contains all the Rule, Zone and Link entries in a
+    single file (see expand_zi_text()).
+
+    If 'jobs' is greater than 1, each zone file is processed in a
+    separate worker process, and the results are merged in the order of
+    ZONE_FILES, which produces exactly the same maps as the serial mode.
+
+    If 'bulk_lexer' is True (the default), each file is split into lines in one
+    go, and every line is tokenized once, directly into its ZoneRuleRaw or
+    ZoneEraRaw record (see _lex_zone_text()). If False, the lines are read one
+    at a time by _read_line(), then tokenized again by _process_rules() and
+    _process_zones(). Both produce exactly the same maps.
+
+    If a 'snapshot' of a previous extraction is given (see create_snapshot()),
+    the lines of each Rule and Zone block are hashed, and only the blocks whose
+    hash differs from the snapshot are processed. The records of the other
+    blocks are reused from the snapshot, without copying them. The differences
+    with the snapshot are recorded in 'change_set', so that subsequent stages
+    can limit their work to the changed zones and policies. The 'jobs' and
+    'bulk_lexer' parameters are ignored in this mode, and the ignored and
+    invalid line counts include only the lines of the processed blocks.
+
+    If 'raw_lines' is False, the 'rawLine' of each record is empty, and the
+    lines of the entries are not retained in self.rule_lines, self.zone_lines
+    and self.link_lines. Only the generated zonedb files and tzdb.json use the
+    'rawLine', so the other pipelines can save the memory of the lines. The
+    zone files are then read one at a time by stream(), which parse() consumes
+    into the same maps. If 'jobs' is greater than 1, each worker process
+    streams its own zone file instead. The 'bulk_lexer' parameter is ignored,
+    and a 'snapshot' is not supported, since it needs the lines.
+
+    If 'start_year' or 'until_year' is given, the Zone eras and Rules which
+    cannot affect the years [start_year, until_year) of the Transformer are
+    skipped after reading only their year fields:
+
+        * a Zone era whose UNTIL year is before (start_year - 1), or which
+          follows an era whose UNTIL year is after (until_year + 1), as in
+          Transformer._remove_zone_eras_too_old() and
+          _remove_zone_eras_too_new()
+        * a Rule whose TO year is before (start_year - 1), unless it is one of
+          the latest such Rules of its policy in the same zone file, which
+          Transformer._mark_rules_used_by_zones() selects as the most recent
+          prior Rules, and from which the anchor Rule is created
+
+    The retained Rules of a policy are a superset of the Rules used by the
+    Transformer, so the transformed data is the same as without the year
+    range. The snapshot of the incremental mode needs the full data, so it
+    does not support a year range.
     """
 
     ZONE_FILES: List[str] = [
@@ -195,8 +452,30 @@ class Extractor:
         'southamerica',
     ]
 
-    def __init__(self, input_dir: str):
+    def __init__(
+        self,
+        input_dir: str,
+        jobs: int = 1,
+        bulk_lexer: bool = True,
+        snapshot: Optional[ExtractorSnapshot] = None,
+        raw_lines: bool = True,
+        start_year: int = MIN_YEAR,
+        until_year: int = MAX_UNTIL_YEAR,
+    ):
+        filter_years = start_year > MIN_YEAR or until_year < MAX_UNTIL_YEAR
+        if snapshot is not None and not raw_lines:
+            raise Exception('Incremental mode requires raw_lines')
+        if snapshot is not None and filter_years:
+            raise Exception('Incremental mode does not support a year range')
+
         self.input_dir: str = input_dir
+        self.jobs: int = jobs
+        self.bulk_lexer: bool = bulk_lexer
+        self.snapshot: Optional[ExtractorSnapshot] = snapshot
+        self.raw_lines: bool = raw_lines
+        self.start_year: int = start_year
+        self.until_year: int = until_year
+        self.filter_years: bool = filter_years
 
         self.next_line: Optional[str] = None
         self.rule_lines: Dict[str, List[str]] = {}  # ruleName to lines[]
@@ -211,6 +490,13 @@ class Extractor:
         self.invalid_rule_lines: int = 0
         self.invalid_zone_lines: int = 0
         self.invalid_link_lines: int = 0
+        self.skipped_rule_lines: int = 0
+        self.skipped_zone_lines: int = 0
+
+        # Incremental mode.
+        self.change_set: Optional[ChangeSet] = None
+        self.reused_blocks: int = 0
+        self.processed_blocks: int = 0
 
     def parse(self) -> None:
         """Read the zoneinfo files from TZ Database and create the 'zones_map'
@@ -218,22 +504,469 @@ class Extractor:
         * zones_map contains a map of (zone_name -> ZoneEraRaw[]).
         * rules contains a map of (policy_name -> ZoneRuleRaw[]).
         """
-        self._parse_zone_files()
-        self._process_rules()
-        self._process_zones()
+        if self.snapshot is not None:
+            self._collect_zone_files()
+            self._process_incremental(self.snapshot)
+        elif self.jobs > 1:
+            self._parse_zone_files_parallel()
+        elif not self.raw_lines:
+            self._insert_streamed()
+            return
+        elif self.bulk_lexer:
+            self._lex_zone_files()
+        else:
+            self._parse_zone_files()
+            self._process_rules()
+            self._process_zones()
         self._process_links()
+        if not self.raw_lines:
+            self.link_lines = {}
+        if self.snapshot is not None:
+            self.change_set = self._create_change_set(self.snapshot)
 
     def get_data(self) -> Tuple[RulesMap, ZonesMap, LinksMap]:
         """Return the extracted data maps."""
         return self.rules_map, self.zones_map, self.links_map
 
+    def stream(self) -> Iterator[ExtractedItem]:
+        """Read and tokenize the zone files one at a time, and yield the
+        records of each Zone as soon as its last line is read. The Rule lines
+        of a policy are not necessarily contiguous, so the records of each
+        policy are yielded after all the files are read, followed by the Links.
+        The lines themselves are not retained. A Zone whose lines are split
+        into multiple entries is yielded once per entry, and a Link with
+        multiple targets is counted as invalid, as in _process_links().
+        """
+        logging.basicConfig(level=logging.INFO)
+        rules: RulesMap = {}
+        links: Dict[str, List[str]] = {}
+        for label, text in self._read_zone_files():
+            logging.info('Processing %s' % label)
+            for name, eras in self._stream_zone_text(text, rules, links):
+                yield ('Zone', name, eras)
+
+        for name, entries in rules.items():
+            if entries:
+                yield ('Rule', name, entries)
+        for name, targets in links.items():
+            if len(targets) > 1:
+                self.invalid_link_lines += len(targets)
+            else:
+                yield ('Link', name, targets[0])
+
+    def create_snapshot(self) -> ExtractorSnapshot:
+        """Return the ExtractorSnapshot of the parsed data, to be given to the
+        Extractor of a later version of the TZ Database. The records are
+        copied, so the snapshot is not affected by the Transformer, which
+        updates the records in place.
+        """
+        if not self.raw_lines:
+            raise Exception('Snapshot requires raw_lines')
+        if self.filter_years:
+            raise Exception('Snapshot does not support a year range')
+        return {
+            'ruleHashes': _hash_blocks(self.rule_lines),
+            'zoneHashes': _hash_blocks(self.zone_lines),
+            'rulesMap': copy.deepcopy(self.rules_map),
+            'zonesMap': copy.deepcopy(self.zones_map),
+            'linksMap': dict(self.links_map),
+        }
+
+    def write_snapshot(self, snapshot_file: str) -> None:
+        """Write the result of create_snapshot() as JSON to 'snapshot_file'.
+        """
+        with open(snapshot_file, 'w', encoding='utf-8') as output_file:
+            json.dump(
+                self.create_snapshot(), output_file, default=record_to_json)
+            print(file=output_file)  # add terminating newline
+        logging.info("Created %s", snapshot_file)
+
+    def _process_incremental(self, snapshot: ExtractorSnapshot) -> None:
+        """Process the Rule and Zone blocks collected by _parse_zone_files()
+        whose lines changed since the 'snapshot', and reuse the records of the
+        snapshot for the others. The names are inserted in the order of
+        self.rule_lines and self.zone_lines, as in _process_rules() and
+        _process_zones().
+        """
+        rule_hashes = snapshot['ruleHashes']
+        rules_map = snapshot['rulesMap']
+        for name, lines in self.rule_lines.items():
+            if rule_hashes.get(name) == _hash_lines(lines):
+                self.reused_blocks += 1
+                rules = rules_map.get(name)
+                if rules:
+                    self.rules_map[name] = rules
+            else:
+                self.processed_blocks += 1
+                self._process_rule_lines(name, lines)
+
+        zone_hashes = snapshot['zoneHashes']
+        zones_map = snapshot['zonesMap']
+        for name, lines in self.zone_lines.items():
+            if zone_hashes.get(name) == _hash_lines(lines):
+                self.reused_blocks += 1
+                eras = zones_map.get(name)
+                if eras:
+                    self.zones_map[name] = eras
+            else:
+                self.processed_blocks += 1
+                self._process_zone_lines(name, lines)
+
+    def _create_change_set(self, snapshot: ExtractorSnapshot) -> ChangeSet:
+        """Compare the blocks of the parsed data with the 'snapshot'."""
+        (added_policies, removed_policies, modified_policies) = _diff_maps(
+            snapshot['ruleHashes'], _hash_blocks(self.rule_lines))
+        (added_zones, removed_zones, modified_zones) = _diff_maps(
+            snapshot['zoneHashes'], _hash_blocks(self.zone_lines))
+        (added_links, removed_links, modified_links) = _diff_maps(
+            snapshot['linksMap'], self.links_map)
+        return {
+            'addedZones': added_zones,
+            'removedZones': removed_zones,
+            'modifiedZones': modified_zones,
+            'addedPolicies': added_policies,
+            'removedPolicies': removed_policies,
+            'modifiedPolicies': modified_policies,
+            'addedLinks': added_links,
+            'removedLinks': removed_links,
+            'modifiedLinks': modified_links,
+        }
+
     def _parse_zone_files(self) -> None:
         logging.basicConfig(level=logging.INFO)
-        for file_name in self.ZONE_FILES:
-            full_filename = os.path.join(self.input_dir, file_name)
-            logging.info('Processing %s' % full_filename)
-            with open(full_filename, 'r', encoding='utf-8') as f:
-                self._parse_zone_file(f)
+        for label, text in self._read_zone_files():
+            logging.info('Processing %s' % label)
+            self._parse_zone_file(io.StringIO(text))
+
+    def _parse_zone_files_parallel(self) -> None:
+        """Parse and process each zone file in a pool of 'jobs' processes,
+        then merge the results in the order of ZONE_FILES. Each Rule or Zone
+        line is processed independently of the others, so processing the lines
+        of each file separately, then concatenating them, is the same as
+        processing the concatenated lines.
+        """
+        logging.basicConfig(level=logging.INFO)
+        (labels, texts) = zip(*self._read_zone_files())
+        bulk_lexers = [self.bulk_lexer] * len(labels)
+        raw_lines = [self.raw_lines] * len(labels)
+        years = [(self.start_year, self.until_year)] * len(labels)
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            results = list(executor.map(
+                _extract_text, labels, texts, bulk_lexers, raw_lines, years))
+
+        for result in results:
+            _merge_items(self.rule_lines, result.rule_lines)
+            _merge_items(self.zone_lines, result.zone_lines)
+            _merge_items(self.link_lines, result.link_lines)
+            _merge_items(self.rules_map, result.rules_map)
+            _merge_items(self.zones_map, result.zones_map)
+            self.ignored_rule_lines += result.ignored_rule_lines
+            self.ignored_zone_lines += result.ignored_zone_lines
+            self.invalid_rule_lines += result.invalid_rule_lines
+            self.invalid_zone_lines += result.invalid_zone_lines
+            self.skipped_rule_lines += result.skipped_rule_lines
+            self.skipped_zone_lines += result.skipped_zone_lines
+
+    def _lex_zone_files(self) -> None:
+        logging.basicConfig(level=logging.INFO)
+        rules: RulesMap = {}
+        zones: ZonesMap = {}
+        for label, text in self._read_zone_files():
+            logging.info('Processing %s' % label)
+            self._lex_zone_text(text, rules, zones)
+        self._insert_lexed(rules, zones)
+
+    def _lex_zone_text(
+        self,
+        text: str,
+        rules: RulesMap,
+        zones: ZonesMap,
+    ) -> None:
+        """Tokenize the 'text' of a zone file in a single pass. Collects the
+        same self.rule_lines, self.zone_lines and self.link_lines as
+        _parse_zone_file(), and creates the records of 'rules' and 'zones' from
+        the same tokens, instead of splitting each line again in
+        _process_rules() and _process_zones().
+        """
+        rule_lines = self.rule_lines
+        zone_lines = self.zone_lines
+        link_lines = self.link_lines
+        filter_rules = self.start_year > MIN_YEAR
+        prior_rules: Dict[str, List[PriorRule]] = {}
+
+        in_zone_mode = False
+        prev_lines: List[str] = []
+        prev_eras: List[ZoneEraRaw] = []
+        for line in _COMMENT_PATTERN.sub('', text).split('\n'):
+            # Remove trailing whitespaces, then skip blank lines.
+            line = line.rstrip()
+            if not line:
+                continue
+
+            tag = line[:4]
+            if tag == 'Rule':
+                tokens = line.split()
+                rule_name = tokens[1]
+                _get_items(rule_lines, rule_name).append(line)
+                in_zone_mode = False
+                if filter_rules:
+                    prior_date = self._get_prior_date(tokens)
+                    if prior_date:
+                        _get_items(prior_rules, rule_name).append((
+                            prior_date, len(rules.get(rule_name, [])),
+                            tokens, line))
+                        continue
+                try:
+                    rule = _rule_from_tokens(tokens, line)
+                except Exception as e:
+                    logging.exception('Exception %s: %s', e, line)
+                    self.invalid_rule_lines += 1
+                    continue
+                _get_items(rules, rule_name).append(rule)
+            elif tag == 'Link':
+                tokens = line.split()
+                _get_items(link_lines, tokens[2]).append(tokens[1])
+                in_zone_mode = False
+            elif tag == 'Zone':
+                tokens = line.split()
+                zone_name = tokens[1]
+                tokens = tokens[2:]
+                line = ' '.join(tokens)
+                prev_lines = _get_items(zone_lines, zone_name)
+                prev_eras = _get_items(zones, zone_name)
+                prev_lines.append(line)
+                in_zone_mode = True
+                self._lex_zone_era(prev_eras, tokens, line)
+            elif tag[0] == '\t' and in_zone_mode:
+                # Subsequent lines that begin with a TAB character belong to
+                # the current 'Zone' entry.
+                prev_lines.append(line)
+                self._lex_zone_era(prev_eras, line.split(), line)
+
+        if prior_rules:
+            self._insert_prior_rules(rules, prior_rules)
+
+    def _collect_zone_files(self) -> None:
+        """Collect the lines of each Rule, Zone and Link entry of the zone
+        files into self.rule_lines, self.zone_lines and self.link_lines, the
+        same as _parse_zone_file(), but without reading the lines one at a
+        time.
+        """
+        logging.basicConfig(level=logging.INFO)
+        for label, text in self._read_zone_files():
+            logging.info('Processing %s' % label)
+            in_zone_mode = False
+            prev_lines: List[str] = []
+            for line in _COMMENT_PATTERN.sub('', text).split('\n'):
+                line = line.rstrip()
+                if not line:
+                    continue
+
+                tag = line[:4]
+                if tag == 'Rule':
+                    tokens = line.split()
+                    _get_items(self.rule_lines, tokens[1]).append(line)
+                    in_zone_mode = False
+                elif tag == 'Link':
+                    tokens = line.split()
+                    _get_items(self.link_lines, tokens[2]).append(tokens[1])
+                    in_zone_mode = False
+                elif tag == 'Zone':
+                    tokens = line.split()
+                    prev_lines = _get_items(self.zone_lines, tokens[1])
+                    prev_lines.append(' '.join(tokens[2:]))
+                    in_zone_mode = True
+                elif tag[0] == '\t' and in_zone_mode:
+                    prev_lines.append(line)
+
+    def _stream_zone_text(
+        self,
+        text: str,
+        rules: RulesMap,
+        links: Dict[str, List[str]],
+    ) -> Iterator[Tuple[str, List[ZoneEraRaw]]]:
+        """Tokenize the 'text' of a zone file like _lex_zone_text(), adding
+        the Rule records to 'rules' and the Link targets to 'links', but
+        yield the (name, eras) of each Zone entry once it is complete, instead
+        of collecting the lines.
+        """
+        raw_lines = self.raw_lines
+        filter_rules = self.start_year > MIN_YEAR
+        prior_rules: Dict[str, List[PriorRule]] = {}
+        in_zone_mode = False
+        zone_name = ''
+        eras: List[ZoneEraRaw] = []
+        for line in _COMMENT_PATTERN.sub('', text).split('\n'):
+            # Remove trailing whitespaces, then skip blank lines.
+            line = line.rstrip()
+            if not line:
+                continue
+
+            tag = line[:4]
+            if tag[0] == '\t':
+                # Subsequent lines that begin with a TAB character belong to
+                # the current 'Zone' entry.
+                if in_zone_mode:
+                    self._lex_zone_era(
+                        eras, line.split(), line if raw_lines else '')
+                continue
+            if tag != 'Rule' and tag != 'Link' and tag != 'Zone':
+                continue
+
+            # Any other entry completes the current 'Zone' entry.
+            if in_zone_mode and eras:
+                yield (zone_name, eras)
+            in_zone_mode = False
+
+            tokens = line.split()
+            if tag == 'Rule':
+                # Create the policy even if its first line is invalid, to
+                # preserve the order of _process_rules().
+                entries = _get_items(rules, tokens[1])
+                if filter_rules:
+                    prior_date = self._get_prior_date(tokens)
+                    if prior_date:
+                        _get_items(prior_rules, tokens[1]).append((
+                            prior_date, len(entries), tokens,
+                            line if raw_lines else ''))
+                        continue
+                try:
+                    rule = _rule_from_tokens(
+                        tokens, line if raw_lines else '')
+                except Exception as e:
+                    logging.exception('Exception %s: %s', e, line)
+                    self.invalid_rule_lines += 1
+                    continue
+                entries.append(rule)
+            elif tag == 'Link':
+                _get_items(links, tokens[2]).append(tokens[1])
+            else:
+                zone_name = tokens[1]
+                tokens = tokens[2:]
+                eras = []
+                in_zone_mode = True
+                self._lex_zone_era(
+                    eras, tokens, ' '.join(tokens) if raw_lines else '')
+
+        if in_zone_mode and eras:
+            yield (zone_name, eras)
+        if prior_rules:
+            self._insert_prior_rules(rules, prior_rules)
+
+    def _insert_streamed(self) -> None:
+        """Insert the items of stream() into self.rules_map,
+        self.zones_map and self.links_map. The Zones are inserted in the order
+        of their first entry, and the eras of a Zone with multiple entries are
+        merged, as in _process_zones().
+        """
+        for (kind, name, value) in self.stream():
+            if kind == 'Zone':
+                zone_eras = cast(List[ZoneEraRaw], value)
+                _get_items(self.zones_map, name).extend(zone_eras)
+            elif kind == 'Rule':
+                self.rules_map[name] = cast(List[ZoneRuleRaw], value)
+            else:
+                self.links_map[name] = cast(str, value)
+
+    def _insert_lexed(self, rules: RulesMap, zones: ZonesMap) -> None:
+        """Insert the lexed records into self.rules_map and self.zones_map in
+        the order of self.rule_lines and self.zone_lines, which is the order
+        created by _process_rules() and _process_zones(), even if the first
+        line of a name is invalid.
+        """
+        for name in self.rule_lines:
+            entries = rules.get(name)
+            if entries:
+                self.rules_map[name] = entries
+        for name in self.zone_lines:
+            eras = zones.get(name)
+            if eras:
+                self.zones_map[name] = eras
+
+    def _lex_zone_era(
+        self,
+        eras: List[ZoneEraRaw],
+        tokens: List[str],
+        line: str,
+    ) -> None:
+        if self.filter_years and self._is_era_skipped(eras, tokens):
+            self.skipped_zone_lines += 1
+            return
+        try:
+            eras.append(_zone_from_tokens(tokens, line))
+        except Exception as e:
+            logging.exception('Exception %s: %s', e, line)
+            self.invalid_zone_lines += 1
+
+    def _is_era_skipped(
+        self,
+        eras: List[ZoneEraRaw],
+        tokens: List[str],
+    ) -> bool:
+        """Return True if the Zone era of 'tokens', following the 'eras' of
+        the same entry, cannot affect the years [start_year, until_year). The
+        last era of a Zone has no UNTIL field, so it is never too old.
+        """
+        if eras and eras[-1].untilYear > self.until_year + 1:
+            return True
+        return len(tokens) >= 4 and tokens[3].isdigit() \
+            and int(tokens[3]) < self.start_year - 1
+
+    def _get_prior_date(self, tokens: List[str]) -> Optional[Tuple[int, int]]:
+        """Return the (TO, IN) of the 'Rule' tokens if the Rule ends before
+        (start_year - 1), otherwise None. An invalid Rule also returns None, so
+        that it is parsed and counted as invalid as usual.
+        """
+        try:
+            to_string = tokens[3]
+            to_year = int(tokens[2]) if to_string == 'only' \
+                else int(to_string)
+            if to_year >= self.start_year - 1:
+                return None
+            return (to_year, MONTH_TO_MONTH_INDEX[tokens[5]])
+        except (IndexError, KeyError, ValueError):
+            return None
+
+    def _insert_prior_rules(
+        self,
+        rules: RulesMap,
+        prior_rules: Dict[str, List[PriorRule]],
+    ) -> None:
+        """Parse the 'prior_rules' of each policy in its latest (TO, IN)
+        month, and insert them into 'rules' at their original positions. The
+        other prior Rules are skipped.
+        """
+        for name, priors in prior_rules.items():
+            latest = max(prior[0] for prior in priors)
+            entries = _get_items(rules, name)
+            # Insert from the last, so that the indexes remain valid.
+            for (date, index, tokens, line) in reversed(priors):
+                if date != latest:
+                    self.skipped_rule_lines += 1
+                    continue
+                try:
+                    rule = _rule_from_tokens(tokens, line)
+                except Exception as e:
+                    logging.exception('Exception %s: %s', e, line)
+                    self.invalid_rule_lines += 1
+                    continue
+                entries.insert(index, rule)
+
+    def _read_zone_files(self) -> Iterable[Tuple[str, str]]:
+        """Return the (label, text) of each of the ZONE_FILES, in order. The
+        'input_dir' is either a directory, or a tzdata release tarball (e.g.
+        tzdata2020a.tar.gz) whose members are read directly from the
+        compressed stream, without extracting them to disk, or a compact
+        'tzdata.zi' file, which is returned as a single text expanded into
+        the format of the ZONE_FILES. The files of a directory are read
+        lazily, one at a time.
+        """
+        if os.path.isfile(self.input_dir):
+            if self.input_dir.endswith('.zi'):
+                with open(self.input_dir, 'r', encoding='utf-8') as f:
+                    return [(self.input_dir, expand_zi_text(f.read()))]
+            return _read_tarball(self.input_dir, self.ZONE_FILES)
+        return _read_directory(self.input_dir, self.ZONE_FILES)
 
     def _parse_zone_file(self, input: TextIO) -> None:
         """Read the 'input' file and collect all 'Rule' lines into
@@ -274,33 +1007,55 @@ class Extractor:
         name: str
         lines: List[str]
         for name, lines in self.rule_lines.items():
-            line: str
-            for line in lines:
-                try:
-                    rule_entry: ZoneRuleRaw = _process_rule_line(line)
-                    if rule_entry:
-                        _add_item(self.rules_map, name, rule_entry)
-                    else:
-                        self.ignored_rule_lines += 1
-                except Exception as e:
-                    logging.exception('Exception %s: %s', e, line)
-                    self.invalid_rule_lines += 1
+            self._process_rule_lines(name, lines)
+
+    def _process_rule_lines(self, name: str, lines: List[str]) -> None:
+        filter_rules = self.start_year > MIN_YEAR
+        prior_rules: Dict[str, List[PriorRule]] = {}
+        line: str
+        for line in lines:
+            if filter_rules:
+                tokens = line.split()
+                prior_date = self._get_prior_date(tokens)
+                if prior_date:
+                    _get_items(prior_rules, name).append((
+                        prior_date, len(self.rules_map.get(name, [])),
+                        tokens, line))
+                    continue
+            try:
+                rule_entry: ZoneRuleRaw = _process_rule_line(line)
+                if rule_entry:
+                    _add_item(self.rules_map, name, rule_entry)
+                else:
+                    self.ignored_rule_lines += 1
+            except Exception as e:
+                logging.exception('Exception %s: %s', e, line)
+                self.invalid_rule_lines += 1
+        if prior_rules:
+            self._insert_prior_rules(self.rules_map, prior_rules)
 
     def _process_zones(self) -> None:
         name: str
         lines: List[str]
         for name, lines in self.zone_lines.items():
-            line: str
-            for line in lines:
-                try:
-                    zone_era: ZoneEraRaw = _process_zone_line(line)
-                    if zone_era:
-                        _add_item(self.zones_map, name, zone_era)
-                    else:
-                        self.ignored_zone_lines += 1
-                except Exception as e:
-                    logging.exception('Exception %s: %s', e, line)
-                    self.invalid_zone_lines += 1
+            self._process_zone_lines(name, lines)
+
+    def _process_zone_lines(self, name: str, lines: List[str]) -> None:
+        line: str
+        for line in lines:
+            if self.filter_years and self._is_era_skipped(
+                    self.zones_map.get(name, []), line.split()):
+                self.skipped_zone_lines += 1
+                continue
+            try:
+                zone_era: ZoneEraRaw = _process_zone_line(line)
+                if zone_era:
+                    _add_item(self.zones_map, name, zone_era)
+                else:
+                    self.ignored_zone_lines += 1
+            except Exception as e:
+                logging.exception('Exception %s: %s', e, line)
+                self.invalid_zone_lines += 1
 
     def _process_links(self) -> None:
         link_name: str
@@ -362,11 +1117,12 @@ class Extractor:
                 zone_entry_count += 1
 
         logging.info('-------- Extractor Summary')
-        logging.info(
-            f'Line count (Rule, Zone, Link): ('
-            + f'{len(self.rule_lines)}, '
-            + f'{len(self.zone_lines)}, '
-            + f'{len(self.link_lines)})')
+        if self.raw_lines:
+            logging.info(
+                f'Line count (Rule, Zone, Link): ('
+                + f'{len(self.rule_lines)}, '
+                + f'{len(self.zone_lines)}, '
+                + f'{len(self.link_lines)})')
         logging.info(
             'Name count (Rule, Zone, Link): ('
             + f'{len(self.rules_map)}, '
@@ -384,6 +1140,19 @@ class Extractor:
             + f'{self.invalid_rule_lines}, '
             + f'{self.invalid_zone_lines}, '
             + f'{self.invalid_link_lines})')
+        if self.filter_years:
+            logging.info(
+                f'Skipped lines before {self.start_year - 1} '
+                + f'or after {self.until_year + 1} (Rule, Zone): ('
+                + f'{self.skipped_rule_lines}, '
+                + f'{self.skipped_zone_lines})')
+        if self.change_set is not None:
+            logging.info(
+                'Blocks (reused, processed): ('
+                + f'{self.reused_blocks}, '
+                + f'{self.processed_blocks})')
+            for key, names in self.change_set.items():
+                logging.info(f'{key}: {names}')
         logging.info('-------- Extractor Summary End')
 
 
@@ -395,6 +1164,249 @@ def _add_item(table: Dict[str, List[Any]], name: str, line: Any) -> None:
     array.append(line)
 
 
+def _get_items(table: Dict[str, List[Any]], name: str) -> List[Any]:
+    """Return the list of items of 'name', creating it if necessary."""
+    array: Optional[List[Any]] = table.get(name)
+    if array is None:
+        array = []
+        table[name] = array
+    return array
+
+
+def _merge_items(
+    table: Dict[str, List[Any]],
+    other: Dict[str, List[Any]],
+) -> None:
+    """Append the items of 'other' to 'table', preserving the order of both
+    the names and the items.
+    """
+    for name, items in other.items():
+        array: Optional[List[Any]] = table.get(name)
+        if not array:
+            array = []
+            table[name] = array
+        array.extend(items)
+
+
+def read_snapshot(snapshot_file: str) -> ExtractorSnapshot:
+    """Read the ExtractorSnapshot written by Extractor.write_snapshot()."""
+    with open(snapshot_file, 'r', encoding='utf-8') as f:
+        snapshot: ExtractorSnapshot = json.load(f)
+    snapshot['rulesMap'] = {
+        name: [ZoneRuleRaw.from_dict(cast(Dict[str, Any], rule))
+               for rule in rules]
+        for name, rules in snapshot['rulesMap'].items()
+    }
+    snapshot['zonesMap'] = {
+        name: [ZoneEraRaw.from_dict(cast(Dict[str, Any], era))
+               for era in eras]
+        for name, eras in snapshot['zonesMap'].items()
+    }
+    return snapshot
+
+
+def _hash_lines(lines: List[str]) -> str:
+    """Return the hash of the lines of a Rule or Zone block."""
+    return hashlib.sha1('\n'.join(lines).encode('utf-8')).hexdigest()
+
+
+def _hash_blocks(blocks: Dict[str, List[str]]) -> Dict[str, str]:
+    return {name: _hash_lines(lines) for name, lines in blocks.items()}
+
+
+def _diff_maps(
+    old: Dict[str, str],
+    new: Dict[str, str],
+) -> Tuple[List[str], List[str], List[str]]:
+    """Return the sorted (added, removed, modified) names of 'new' relative to
+    'old'.
+    """
+    added = sorted(name for name in new if name not in old)
+    removed = sorted(name for name in old if name not in new)
+    modified = sorted(
+        name for name, value in new.items()
+        if name in old and old[name] != value)
+    return (added, removed, modified)
+
+
+def _extract_text(
+    label: str,
+    text: str,
+    bulk_lexer: bool,
+    raw_lines: bool = True,
+    years: Tuple[int, int] = (MIN_YEAR, MAX_UNTIL_YEAR),
+) -> Extractor:
+    """Parse and process the 'text' of a single zone file, and return its
+    Extractor. Runs in a worker process of
+    Extractor._parse_zone_files_parallel(), so it must be a module-level
+    function. If not 'raw_lines', only the Link targets are collected in
+    link_lines, so that the Links of all the files are processed together.
+    """
+    extractor = Extractor(
+        label, bulk_lexer=bulk_lexer, raw_lines=raw_lines,
+        start_year=years[0], until_year=years[1])
+    logging.info('Processing %s' % label)
+    if not raw_lines:
+        rules: RulesMap = {}
+        for name, eras in extractor._stream_zone_text(
+                text, rules, extractor.link_lines):
+            _get_items(extractor.zones_map, name).extend(eras)
+        for name, entries in rules.items():
+            if entries:
+                extractor.rules_map[name] = entries
+    elif bulk_lexer:
+        rules = {}
+        zones: ZonesMap = {}
+        extractor._lex_zone_text(text, rules, zones)
+        extractor._insert_lexed(rules, zones)
+    else:
+        extractor._parse_zone_file(io.StringIO(text))
+        extractor._process_rules()
+        extractor._process_zones()
+    return extractor
+
+
+def _read_directory(
+    input_dir: str,
+    file_names: List[str],
+) -> Iterator[Tuple[str, str]]:
+    """Yield the (label, text) of each of the 'file_names' in 'input_dir'."""
+    for file_name in file_names:
+        full_filename = os.path.join(input_dir, file_name)
+        with open(full_filename, 'r', encoding='utf-8') as f:
+            yield (full_filename, f.read())
+
+
+def _read_tarball(
+    tarball: str,
+    file_names: List[str],
+) -> List[Tuple[str, str]]:
+    """Return the (label, text) of each of the 'file_names' in the given
+    tarball, in the order of 'file_names'. The archive is read sequentially as
+    a stream, so each member is decompressed once, regardless of the order of
+    the members in the archive.
+    """
+    texts: Dict[str, str] = {}
+    with tarfile.open(tarball, 'r|*') as tar:
+        for member in tar:
+            # Release tarballs place the files at the top level, but also
+            # accept a './' prefix.
+            name = member.name[2:] if member.name.startswith('./') \
+                else member.name
+            if name not in file_names or not member.isfile():
+                continue
+            f = tar.extractfile(member)
+            if f is None:
+                continue
+            texts[name] = f.read().decode('utf-8')
+
+    zone_files: List[Tuple[str, str]] = []
+    for file_name in file_names:
+        text = texts.get(file_name)
+        if text is None:
+            raise Exception(f"File '{file_name}' not found in '{tarball}'")
+        zone_files.append((f'{tarball}:{file_name}', text))
+    return zone_files
+
+
+# Full names of the days of the week in the ON and UNTIL fields.
+DAYS_OF_WEEK: List[str] = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+def expand_zi_text(text: str) -> str:
+    """Expand the compact 'tzdata.zi' format into the format of the ZONE_FILES
+    understood by the Extractor. The tzdata.zi file is generated by 'make
+    tzdata.zi' in the TZ Database, and differs from the ZONE_FILES in the
+    following ways:
+
+        * the 'Rule', 'Zone' and 'Link' keywords are abbreviated to 'R', 'Z'
+          and 'L'
+        * the continuation lines of a Zone entry are not indented
+        * months, days of the week, and the 'only' and 'max' keywords are
+          abbreviated to their shortest unambiguous prefix (e.g. 'Ap',
+          'lastSu', 'Su>=1', 'o', 'ma')
+        * a RULES field with a DST offset may omit the minutes (e.g. '1')
+        * the Rule names are also shortened (e.g. 'd' instead of 'Algeria')
+
+    The names of the Rules cannot be recovered, so the ZonePolicies have the
+    shortened names, but all the other fields are identical.
+    """
+    lines: List[str] = []
+    for line in _COMMENT_PATTERN.sub('', text).split('\n'):
+        tokens = line.split()
+        if not tokens:
+            continue
+        tag = tokens[0]
+        if tag == 'R':
+            # R NAME FROM TO - IN ON AT SAVE LETTER
+            tokens[0] = 'Rule'
+            tokens[3] = _expand_zi_year(tokens[3])
+            tokens[5] = _expand_zi_month(tokens[5])
+            tokens[6] = _expand_zi_day(tokens[6])
+            lines.append('\t'.join(tokens))
+        elif tag == 'Z':
+            # Z NAME STDOFF RULES FORMAT [UNTIL]
+            lines.append('\t'.join(['Zone', tokens[1]]
+                                   + _expand_zi_era(tokens[2:])))
+        elif tag == 'L':
+            # L TARGET LINK
+            lines.append('\t'.join(['Link'] + tokens[1:]))
+        else:
+            # STDOFF RULES FORMAT [UNTIL]
+            lines.append('\t\t\t' + '\t'.join(_expand_zi_era(tokens)))
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def _expand_zi_era(tokens: List[str]) -> List[str]:
+    """Expand the STDOFF RULES FORMAT [UNTIL] fields of a tzdata.zi Zone."""
+    rules = tokens[1]
+    if rules[-1:].isdigit() and ':' not in rules:
+        tokens[1] = rules + ':00'
+    if len(tokens) >= 5:
+        tokens[4] = _expand_zi_month(tokens[4])
+    if len(tokens) >= 6:
+        tokens[5] = _expand_zi_day(tokens[5])
+    return tokens
+
+
+def _expand_zi_year(year: str) -> str:
+    """Expand the abbreviated 'only' or 'max' keywords of the TO field."""
+    if year[0].isdigit():
+        return year
+    for keyword in ['only', 'max']:
+        if keyword.startswith(year.lower()):
+            return keyword
+    raise Exception(f"Invalid TO year '{year}'")
+
+
+def _expand_zi_month(month: str) -> str:
+    for name in MONTH_TO_MONTH_INDEX:
+        if name.lower().startswith(month.lower()):
+            return name
+    raise Exception(f"Invalid month '{month}'")
+
+
+def _expand_zi_day(day: str) -> str:
+    """Expand the abbreviated day of week in 'lastSu', 'Su>=1' or 'Su<=25'."""
+    if day[0].isdigit():
+        return day
+    if day.startswith('last'):
+        return 'last' + _expand_zi_day_of_week(day[4:])
+    for op in ['>=', '<=']:
+        index = day.find(op)
+        if index > 0:
+            return _expand_zi_day_of_week(day[:index]) + day[index:]
+    raise Exception(f"Invalid day '{day}'")
+
+
+def _expand_zi_day_of_week(day_of_week: str) -> str:
+    for name in DAYS_OF_WEEK:
+        if name.lower().startswith(day_of_week.lower()):
+            return name
+    raise Exception(f"Invalid day of week '{day_of_week}'")
+
+
 MONTH_TO_MONTH_INDEX: Dict[str, int] = {
     'Jan': 1,
     'Feb': 2,
@@ -412,15 +1424,18 @@ MONTH_TO_MONTH_INDEX: Dict[str, int] = {
 
 
 def _process_rule_line(line: str) -> ZoneRuleRaw:
-    """Normalize a dictionary that represents a 'Rule' line from the TZ
+    """Create the ZoneRuleRaw that represents a 'Rule' line from the TZ
     database. Contains the following fields:
     Rule NAME FROM TO TYPE IN ON AT SAVE LETTER
     0    1    2    3  4    5  6  7  8    9
 
     These represent transitions from Daylight to/from Standard.
     """
-    tokens: List[str] = line.split()
+    return _rule_from_tokens(line.split(), line)
+
 
+def _rule_from_tokens(tokens: List[str], line: str) -> ZoneRuleRaw:
+    """Create the ZoneRuleRaw from the 'tokens' of the 'Rule' line."""
     # Check for valid year.
     from_year: int = int(tokens[2])
     to_year_string: str = tokens[3]
@@ -438,18 +1453,17 @@ def _process_rule_line(line: str) -> ZoneRuleRaw:
     (at_time, at_time_suffix) = parse_at_time_string(tokens[7])
     delta_offset = tokens[8]
 
-    # Return map corresponding to a ZoneRule instance
-    return {
-        'fromYear': from_year,
-        'toYear': to_year,
-        'inMonth': in_month,
-        'onDay': on_day,
-        'atTime': at_time,
-        'atTimeSuffix': at_time_suffix,
-        'deltaOffset': delta_offset,
-        'letter': tokens[9],
-        'rawLine': line,
-    }
+    return ZoneRuleRaw(
+        fromYear=from_year,
+        toYear=to_year,
+        inMonth=in_month,
+        onDay=on_day,
+        atTime=at_time,
+        atTimeSuffix=at_time_suffix,
+        deltaOffset=delta_offset,
+        letter=tokens[9],
+        rawLine=line,
+    )
 
 
 def parse_at_time_string(at_string: str) -> Tuple[str, str]:
@@ -468,15 +1482,20 @@ def parse_at_time_string(at_string: str) -> Tuple[str, str]:
 
 
 def _process_zone_line(line: str) -> ZoneEraRaw:
-    """Normalize an zone era from dictionary that represents one line of
-    a 'Zone' record. The columns are:
+    """Create the ZoneEraRaw that represents one line of a 'Zone' record.
+    The columns are:
     STDOFF   RULES  FORMAT  [UNTIL]
     0        1      2       3
     -5:50:36 -      LMT     1883 Nov 18 12:09:24
     -6:00    US     C%sT    1920
     """
-    tokens: List[str] = line.split()
+    return _zone_from_tokens(line.split(), line)
+
 
+def _zone_from_tokens(tokens: List[str], line: str) -> ZoneEraRaw:
+    """Create the ZoneEraRaw from the 'tokens' of a 'Zone' line, without the
+    leading 'Zone' and NAME tokens.
+    """
     # STDOFF
     offset_string: str = tokens[0]
 
@@ -513,16 +1532,15 @@ def _process_zone_line(line: str) -> ZoneEraRaw:
     # FORMAT
     format: str = tokens[2]
 
-    # Return map corresponding to a ZoneEra instance
-    return {
-        'offsetString': offset_string,
-        'rules': rules_string,
-        'format': format,
-        'untilYear': until_year,
-        'untilYearOnly': until_year_only,
-        'untilMonth': until_month,
-        'untilDayString': until_day,
-        'untilTime': until_time,
-        'untilTimeSuffix': until_time_suffix,
-        'rawLine': line,
-    }
+    return ZoneEraRaw(
+        offsetString=offset_string,
+        rules=rules_string,
+        format=format,
+        untilYear=until_year,
+        untilYearOnly=until_year_only,
+        untilMonth=until_month,
+        untilDayString=until_day,
+        untilTime=until_time,
+        untilTimeSuffix=until_time_suffix,
+        rawLine=line,
+    )
@@ -9,11 +9,16 @@ for code generation in the ArduinoGenerator, PythonGenerator or the
 InlineGenerator.
 """
 
+import bisect
+import json
 import logging
 import sys
 import re
 import datetime
+import time
+import tracemalloc
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from .extractor import MAX_UNTIL_YEAR
 from .extractor import MIN_YEAR
 from .extractor import MAX_YEAR
@@ -22,6 +27,8 @@ from .extractor import ZoneEraRaw
 from .extractor import ZonesMap
 from .extractor import RulesMap
 from .extractor import LinksMap
+from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -43,6 +50,15 @@ CommentsCollection = Dict[str, Set[str]]
 # TODO: Should probably be renamed PoliciesToZones.
 RulesToZones = Dict[str, List[str]]
 
+# A stage of the zone passes of Transformer.transform(), applied to a single
+# zone: (name, eras, removed_zones, notable_zones) -> eras. Returns the eras to
+# keep, or None if the zone is removed. Adds the reasons of the removal or the
+# caveats of the zone to removed_zones or notable_zones. Used only internally.
+ZoneStage = Callable[
+    [str, List[ZoneEraRaw], CommentsCollection, CommentsCollection],
+    Optional[List[ZoneEraRaw]],
+]
+
 
 # Deduped list of strings (as OrderedDict of {string -> index}), total size, and
 # the total original size. The 'index' allows the generated zoneinfo files (in
@@ -53,6 +69,49 @@ StringCollection = TypedDict('StringCollection', {
     'orig_size': int,  # total length of strings including duplicates
 })
 
+# Passes of Transformer.transform(), as (method, extra arguments) which is
+# called as method(map, *args) and returns the transformed map. Used only
+# internally.
+Passes = List[Tuple[Callable[..., Any], Tuple[Any, ...]]]
+
+# Number of names and entries of the maps given to, or returned by, a pass of
+# Transformer.transform(). Only the maps handled by the pass are counted.
+PassCounts = TypedDict('PassCounts', {
+    'zones': int,
+    'eras': int,
+    'policies': int,
+    'rules': int,
+    'links': int,
+}, total=False)
+
+# Options of a variant of Transformer.transform_variants(). The missing fields
+# are the same as the Transformer.
+TransformerVariant = TypedDict('TransformerVariant', {
+    'scope': str,
+    'until_at_granularity': int,
+    'offset_granularity': int,
+    'strict': bool,
+}, total=False)
+
+# Entry of the change log of a Transformer created with 'in_place', which
+# records each name removed from, or whose entries were updated in, the maps
+# given to the Transformer.
+ChangeLogEntry = TypedDict('ChangeLogEntry', {
+    'pass': str,  # name of the method
+    'map': str,  # 'zones', 'policies' or 'links'
+    'name': str,  # name of the zone, policy or link
+    'change': str,  # 'removed' or 'updated'
+})
+
+# Profile of a single pass of Transformer.transform().
+PassProfile = TypedDict('PassProfile', {
+    'name': str,  # name of the method
+    'seconds': float,  # wall time
+    'allocatedBytes': int,  # change of the memory traced by tracemalloc
+    'input': PassCounts,
+    'output': PassCounts,
+})
+
 
 class Transformer:
     def __init__(
@@ -66,6 +125,10 @@ class Transformer:
         until_at_granularity: int,
         offset_granularity: int,
         strict: bool,
+        profile: bool = False,
+        fused: bool = False,
+        jobs: int = 1,
+        in_place: bool = False,
     ):
         """
         Args:
@@ -79,6 +142,18 @@ class Transformer:
             offset_granularity: SAVE, RULES(offset) to this many seconds
             strict: throw out Zones or Rules which are not exactly
                 on the time boundary defined by granularity
+            profile: record a PassProfile of each pass of transform() into
+                'pass_profiles', using tracemalloc for the allocations
+            fused: run the zone passes of transform() as a single traversal
+                of the zones_map, which produces the same results
+            jobs: if greater than 1, run the zone passes and the rule passes
+                in a pool of 'jobs' processes, which produces the same results
+                ('fused' is then ignored)
+            in_place: update zones_map, rules_map and links_map, and their
+                lists of ZoneEraRaw and ZoneRuleRaw, in place instead of
+                replacing them with new ones, so that the caller and the
+                Transformer hold a single copy of the data, and record each
+                change into 'change_log'
         """
         self.zones_map = zones_map
         self.rules_map = rules_map
@@ -89,6 +164,12 @@ class Transformer:
         self.until_at_granularity = until_at_granularity
         self.offset_granularity = offset_granularity
         self.strict = strict
+        self.profile = profile
+        self.fused = fused
+        self.jobs = jobs
+        self.in_place = in_place
+        self.pass_profiles: List[PassProfile] = []
+        self.change_log: List[ChangeLogEntry] = []
 
         self.original_zone_count = len(zones_map)
         self.original_rule_count = len(rules_map)
@@ -138,65 +219,142 @@ class Transformer:
             using just the index
         * self.zone_strings: de-duped map of zone names and the corresponding
             array index.
+        * self.pass_profiles: if 'profile' is True, the PassProfile of each
+            pass, in order.
+        * self.change_log: if 'in_place' is True, the ChangeLogEntry of each
+            zone, policy and link removed or updated by each pass, in order.
         """
 
-        zones_map = self.zones_map
-        rules_map = self.rules_map
-        links_map = self.links_map
+        logging.info('Found %s zone infos' % len(self.zones_map))
+        logging.info('Found %s rule policies' % len(self.rules_map))
+
+        # Tracing the allocations slows down every pass by a similar factor,
+        # so the relative times remain meaningful.
+        start_tracing = self.profile and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
 
+        zones_map = self._transform_common(self.zones_map)
+        self._transform_variant(zones_map)
+
+        if start_tracing:
+            tracemalloc.stop()
+
+    def transform_variants(
+        self,
+        variants: List[TransformerVariant],
+    ) -> List['Transformer']:
+        """Same as transform(), for several variants of the scope,
+        granularities and strict flag at once, e.g. the 'basic' scope with an
+        offset_granularity of 900 and the 'extended' scope with 60. The passes
+        which depend only on the years are run once, then each variant runs the
+        remaining passes on its own copy of the maps. The fields missing from a
+        TransformerVariant are the same as this Transformer.
+
+        Return a new transformed Transformer for each variant, in order, which
+        produces the same results as calling transform() on a Transformer
+        created with the options of the variant. The maps of this Transformer
+        are not modified.
+        """
         logging.info('Found %s zone infos' % len(self.zones_map))
         logging.info('Found %s rule policies' % len(self.rules_map))
 
-        # Part 1: Transform the zones_map
-        # zones_map = self._remove_zones_without_slash(zones_map)
-        zones_map = self._detect_hash_collisions(zones_map)
-        zones_map = self._remove_zone_eras_too_old(zones_map)
-        zones_map = self._remove_zone_eras_too_new(zones_map)
-        zones_map = self._remove_zones_without_eras(zones_map)
-        if self.scope == 'basic':
-            zones_map = self._remove_zone_until_year_only_false(zones_map)
-        zones_map = self._create_zones_with_until_day(zones_map)
-        zones_map = self._create_zones_with_expanded_until_time(zones_map)
-        zones_map = self._remove_zones_invalid_until_time_suffix(zones_map)
-        zones_map = self._create_zones_with_expanded_offset_string(zones_map)
-        zones_map = self._remove_zones_with_invalid_rules_format_combo(
-            zones_map)
-        zones_map = self._create_zones_with_rules_expansion(zones_map)
-        zones_map = self._remove_zones_with_non_monotonic_until(zones_map)
+        start_tracing = self.profile and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+
+        # The common passes are applied to a shallow copy of the zones_map, so
+        # that 'in_place' does not modify the maps of this Transformer.
+        zones_map = self.zones_map
+        if self.in_place:
+            zones_map = {
+                name: list(eras) for name, eras in zones_map.items()
+            }
+        zones_map = self._transform_common(zones_map)
+        transformers = []
+        for variant in variants:
+            logging.info('Transforming variant %s', variant)
+            transformer = self._create_variant(variant, zones_map)
+            transformer._transform_variant(transformer.zones_map)
+            transformers.append(transformer)
+
+        if start_tracing:
+            tracemalloc.stop()
+        return transformers
+
+    def _transform_common(self, zones_map: ZonesMap) -> ZonesMap:
+        """Part 1a: Transform the zones_map with the passes which do not depend
+        on the scope, the granularities or the strict flag. The removed zones
+        are recorded in self.all_removed_zones.
+        """
+        # zones_map = self._zones_pass(
+        #     self._remove_zones_without_slash, zones_map)
+        zones_map = self._zones_pass(self._detect_hash_collisions, zones_map)
+        zones_map = self._zones_pass(self._remove_zone_eras_too_old, zones_map)
+        zones_map = self._zones_pass(self._remove_zone_eras_too_new, zones_map)
+        zones_map = self._zones_pass(
+            self._remove_zones_without_eras, zones_map)
+        return zones_map
+
+    def _transform_variant(self, zones_map: ZonesMap) -> None:
+        """Transform the 'zones_map' returned by _transform_common(), and
+        self.rules_map and self.links_map, with the remaining passes, then
+        replace the maps with the transformed ones.
+        """
+        rules_map = self.rules_map
+        links_map = self.links_map
+
+        # Part 1b: Transform the zones_map
+        if self.jobs > 1:
+            zones_map = self._zones_pass(
+                self._transform_zones_parallel, zones_map)
+        else:
+            for func, args in self._get_zone_passes():
+                zones_map = self._zones_pass(func, zones_map, *args)
 
         # Part 2: Transformations requring both zones_map and rules_map.
+        start = self._start_pass(
+            self._mark_rules_used_by_zones, zones_map, rules_map)
         (zones_map, rules_map) = self._mark_rules_used_by_zones(
             zones_map, rules_map)
+        self._end_pass(start, zones_map, rules_map)
         rules_to_zones = _create_rules_to_zones(zones_map, rules_map)
 
         # Part 3: Transform the rules_map
-        rules_map = self._remove_rules_unused(rules_map)
-        rules_map = self._remove_rules_out_of_bounds(rules_map)
-        if self.scope == 'basic':
-            rules_map = self._remove_rules_multiple_transitions_in_month(
-                rules_map)
-        rules_map = self._create_rules_with_expanded_at_time(
-            rules_map, rules_to_zones)
-        rules_map = self._remove_rules_invalid_at_time_suffix(rules_map)
-        rules_map = self._create_rules_with_expanded_delta_offset(rules_map)
-        rules_map = self._create_rules_with_on_day_expansion(rules_map)
-        rules_map = self._create_rules_with_anchor_transition(rules_map)
-        if self.scope == 'basic':
-            rules_map = self._remove_rules_with_border_transitions(rules_map)
-        if self.scope == 'basic':
-            rules_map = self._remove_rules_long_dst_letter(rules_map)
+        if self.jobs > 1:
+            rules_map = self._rules_pass(
+                self._transform_rules_parallel, rules_map, rules_to_zones)
+        else:
+            for func, args in self._get_rule_passes(rules_to_zones):
+                rules_map = self._rules_pass(func, rules_map, *args)
 
         # Part 4: Go back to zones_map and remove unused.
-        zones_map = self._remove_zones_without_rules(zones_map, rules_map)
+        zones_map = self._zones_pass(
+            self._remove_zones_without_rules, zones_map, rules_map)
 
         # Part 5: Remove links which point to removed zones.
-        links_map = self.remove_links_to_missing_zones(links_map, zones_map)
+        start = self._start_pass(
+            self.remove_links_to_missing_zones, zones_map, None, links_map)
+        links_map = self._update_map(
+            self.remove_links_to_missing_zones, 'links', links_map,
+            self.remove_links_to_missing_zones(links_map, zones_map))
+        self._end_pass(start, zones_map, None, links_map)
 
         # Part 6: Remove zones and links whose normalized names conflict.
         # For example, "GTM+0" and "GMT-0" will normalize to the same
         # kZoneGMT_0, so cannot be used.
-        zones_map, links_map = self.remove_zones_and_links_with_similar_names(
-            zones_map, links_map)
+        start = self._start_pass(
+            self.remove_zones_and_links_with_similar_names, zones_map, None,
+            links_map)
+        (result_zones, result_links) = \
+            self.remove_zones_and_links_with_similar_names(zones_map, links_map)
+        zones_map = self._update_map(
+            self.remove_zones_and_links_with_similar_names, 'zones', zones_map,
+            result_zones)
+        links_map = self._update_map(
+            self.remove_zones_and_links_with_similar_names, 'links', links_map,
+            result_links)
+        self._end_pass(start, zones_map, None, links_map)
 
         # Part 7: Replace the original maps with the transformed ones.
         self.rules_map = rules_map
@@ -208,6 +366,44 @@ class Transformer:
             self.zones_map, self.rules_map)
         self.zone_strings = create_zone_strings(self.zones_map)
 
+    def _create_variant(
+        self,
+        variant: TransformerVariant,
+        zones_map: ZonesMap,
+    ) -> 'Transformer':
+        """Return a new Transformer for the 'variant', with copies of the
+        'zones_map', self.rules_map and self.links_map, and of the reasons,
+        the PassProfiles and the change log recorded so far. The ZoneEraRaw
+        and ZoneRuleRaw are copied because the passes update them in place.
+        """
+        transformer = Transformer(
+            {name: [era.copy() for era in eras]
+                for name, eras in zones_map.items()},
+            {name: [rule.copy() for rule in rules]
+                for name, rules in self.rules_map.items()},
+            dict(self.links_map),
+            variant.get('scope', self.scope),
+            self.start_year,
+            self.until_year,
+            variant.get('until_at_granularity', self.until_at_granularity),
+            variant.get('offset_granularity', self.offset_granularity),
+            variant.get('strict', self.strict),
+            profile=self.profile,
+            fused=self.fused,
+            jobs=self.jobs,
+            in_place=self.in_place,
+        )
+        transformer.original_zone_count = self.original_zone_count
+        transformer.original_rule_count = self.original_rule_count
+        transformer.original_link_count = self.original_link_count
+        for all_reasons, reasons in zip(
+            transformer._get_all_reasons(), self._get_all_reasons()
+        ):
+            _merge_reasons(all_reasons, reasons)
+        transformer.pass_profiles = list(self.pass_profiles)
+        transformer.change_log = list(self.change_log)
+        return transformer
+
     def get_data(self) -> Tuple[
         ZonesMap, RulesMap, LinksMap,
         CommentsMap, CommentsMap, CommentsMap,
@@ -250,6 +446,309 @@ class Transformer:
             f"; removed={len(self.all_removed_links)}"
             f"; noted={len(self.all_notable_links)}")
 
+        if self.in_place:
+            logging.info(
+                f"Changes in place: {len(self.change_log)}")
+
+    def write_profile(self, output_file: str) -> None:
+        """Write the 'pass_profiles' of transform() as JSON to 'output_file'.
+        """
+        report = {
+            'seconds': sum(p['seconds'] for p in self.pass_profiles),
+            'passes': self.pass_profiles,
+        }
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            print(file=f)  # add terminating newline
+        logging.info("Created %s", output_file)
+
+    # --------------------------------------------------------------------
+    # Methods related to profiling the passes.
+    # --------------------------------------------------------------------
+
+    def _zones_pass(
+        self,
+        func: Callable[..., ZonesMap],
+        zones_map: ZonesMap,
+        *args: Any,
+    ) -> ZonesMap:
+        """Return func(zones_map, *args), recording its PassProfile. If
+        'in_place', the results are applied to 'zones_map', which is returned.
+        """
+        if not self.profile:
+            results = func(zones_map, *args)
+            return self._update_map(func, 'zones', zones_map, results)
+        start = self._start_pass(func, zones_map)
+        results = func(zones_map, *args)
+        results = self._update_map(func, 'zones', zones_map, results)
+        self._end_pass(start, results)
+        return results
+
+    def _rules_pass(
+        self,
+        func: Callable[..., RulesMap],
+        rules_map: RulesMap,
+        *args: Any,
+    ) -> RulesMap:
+        """Return func(rules_map, *args), recording its PassProfile. If
+        'in_place', the results are applied to 'rules_map', which is returned.
+        """
+        if not self.profile:
+            results = func(rules_map, *args)
+            return self._update_map(func, 'policies', rules_map, results)
+        start = self._start_pass(func, None, rules_map)
+        results = func(rules_map, *args)
+        results = self._update_map(func, 'policies', rules_map, results)
+        self._end_pass(start, None, results)
+        return results
+
+    def _start_pass(
+        self,
+        func: Callable[..., Any],
+        zones_map: Optional[ZonesMap] = None,
+        rules_map: Optional[RulesMap] = None,
+        links_map: Optional[LinksMap] = None,
+    ) -> Tuple[PassProfile, float, int]:
+        """Return the PassProfile of 'func' with the counts of its input
+        maps, and the starting time and traced memory. The maps must be
+        counted before the pass, because some passes update them in place.
+        """
+        profile: PassProfile = {
+            'name': func.__name__,
+            'seconds': 0.0,
+            'allocatedBytes': 0,
+            'input': {},
+            'output': {},
+        }
+        if not self.profile:
+            return (profile, 0.0, 0)
+        profile['input'] = _count_maps(zones_map, rules_map, links_map)
+        return (
+            profile, time.perf_counter(), tracemalloc.get_traced_memory()[0])
+
+    def _end_pass(
+        self,
+        start: Tuple[PassProfile, float, int],
+        zones_map: Optional[ZonesMap] = None,
+        rules_map: Optional[RulesMap] = None,
+        links_map: Optional[LinksMap] = None,
+    ) -> None:
+        """Complete the PassProfile created by _start_pass() with the counts
+        of the output maps, and append it to self.pass_profiles.
+        """
+        if not self.profile:
+            return
+        (profile, start_time, start_memory) = start
+        profile['seconds'] = time.perf_counter() - start_time
+        profile['allocatedBytes'] = \
+            tracemalloc.get_traced_memory()[0] - start_memory
+        profile['output'] = _count_maps(zones_map, rules_map, links_map)
+        self.pass_profiles.append(profile)
+
+    # --------------------------------------------------------------------
+    # Methods related to the in-place transformation.
+    # --------------------------------------------------------------------
+
+    def _update_map(
+        self,
+        func: Callable[..., Any],
+        map_name: str,
+        items_map: Dict[str, Any],
+        results: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Return the 'results' of the pass 'func' applied to 'items_map'. If
+        'in_place', the names missing from 'results' are deleted from
+        'items_map', the lists of entries replaced by the pass are updated in
+        place, each change is appended to self.change_log, and 'items_map' is
+        returned instead. The passes never add or reorder names, so
+        'items_map' keeps the same order as 'results'.
+        """
+        if not self.in_place or results is items_map:
+            return results
+
+        for name in [name for name in items_map if name not in results]:
+            del items_map[name]
+            self._log_change(func, map_name, name, 'removed')
+        for name, value in results.items():
+            old_value = items_map[name]
+            if value is old_value:
+                continue
+            if isinstance(old_value, list):
+                old_value[:] = value
+            else:
+                items_map[name] = value
+            self._log_change(func, map_name, name, 'updated')
+        return items_map
+
+    def _log_change(
+        self,
+        func: Callable[..., Any],
+        map_name: str,
+        name: str,
+        change: str,
+    ) -> None:
+        self.change_log.append({
+            'pass': func.__name__,
+            'map': map_name,
+            'name': name,
+            'change': change,
+        })
+
+    # --------------------------------------------------------------------
+    # Methods related to running the passes in parallel.
+    # --------------------------------------------------------------------
+
+    def _get_zone_passes(self) -> Passes:
+        """Return the passes of Part 1b of transform(), which are applied to
+        each zone independently of the others.
+        """
+        if self.fused:
+            return [(self._transform_zones_fused, ())]
+
+        passes: Passes = []
+        if self.scope == 'basic':
+            passes.append((self._remove_zone_until_year_only_false, ()))
+        passes.extend([
+            (self._create_zones_with_until_day, ()),
+            (self._create_zones_with_expanded_until_time, ()),
+            (self._remove_zones_invalid_until_time_suffix, ()),
+            (self._create_zones_with_expanded_offset_string, ()),
+            (self._remove_zones_with_invalid_rules_format_combo, ()),
+            (self._create_zones_with_rules_expansion, ()),
+            (self._remove_zones_with_non_monotonic_until, ()),
+            (self._merge_zones_equivalent_eras, ()),
+        ])
+        return passes
+
+    def _get_rule_passes(self, rules_to_zones: RulesToZones) -> Passes:
+        """Return the passes of Part 3 of transform(), which are applied to
+        each policy independently of the others.
+        """
+        passes: Passes = [
+            (self._remove_rules_unused, ()),
+            (self._remove_rules_out_of_bounds, ()),
+        ]
+        if self.scope == 'basic':
+            passes.append(
+                (self._remove_rules_multiple_transitions_in_month, ()))
+        passes.extend([
+            (self._create_rules_with_expanded_at_time, (rules_to_zones,)),
+            (self._remove_rules_invalid_at_time_suffix, ()),
+            (self._create_rules_with_expanded_delta_offset, ()),
+            (self._create_rules_with_on_day_expansion, ()),
+            (self._create_rules_with_anchor_transition, ()),
+        ])
+        if self.scope == 'basic':
+            passes.append((self._remove_rules_with_border_transitions, ()))
+            passes.append((self._remove_rules_long_dst_letter, ()))
+        passes.append((self._merge_contiguous_rules, ()))
+        return passes
+
+    def _transform_zones_parallel(self, zones_map: ZonesMap) -> ZonesMap:
+        """Run the passes of _get_zone_passes() in a pool of 'jobs'
+        processes.
+        """
+        return cast(ZonesMap, self._transform_parallel('zones', zones_map, {}))
+
+    def _transform_rules_parallel(
+        self,
+        rules_map: RulesMap,
+        rules_to_zones: RulesToZones,
+    ) -> RulesMap:
+        """Run the passes of _get_rule_passes() in a pool of 'jobs'
+        processes.
+        """
+        return cast(
+            RulesMap,
+            self._transform_parallel('rules', rules_map, rules_to_zones))
+
+    def _transform_parallel(
+        self,
+        part: str,
+        items_map: Dict[str, Any],
+        rules_to_zones: RulesToZones,
+    ) -> Dict[str, Any]:
+        """Split 'items_map' into 'jobs' contiguous chunks, and run all the
+        passes of 'part' ('zones' or 'rules') over each chunk in a separate
+        process. The chunks are merged in their original order. The reasons
+        are merged pass by pass, which inserts them in the same order as the
+        serial transform(), regardless of the number of jobs.
+        """
+        items = list(items_map.items())
+        size = -(-len(items) // self.jobs)
+        chunks = [
+            dict(items[i:i + size]) for i in range(0, len(items), size)
+        ]
+        if not chunks:
+            return {}
+
+        # The workers are given a copy of this Transformer without the maps.
+        # The zone passes are not fused in the workers, because the fused
+        # traversal merges the reasons of all its stages at once.
+        worker = Transformer(
+            {}, {}, {}, self.scope, self.start_year, self.until_year,
+            self.until_at_granularity, self.offset_granularity, self.strict)
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            results = list(executor.map(
+                worker._transform_chunk,
+                [part] * len(chunks),
+                chunks,
+                [rules_to_zones] * len(chunks)))
+
+        merged: Dict[str, Any] = {}
+        for chunk, _ in results:
+            merged.update(chunk)
+        pass_count = len(results[0][1])
+        for i in range(pass_count):
+            for _, chunk_reasons in results:
+                for all_reasons, reasons in zip(
+                    self._get_all_reasons(), chunk_reasons[i]
+                ):
+                    _merge_reasons(all_reasons, reasons)
+        return merged
+
+    def _transform_chunk(
+        self,
+        part: str,
+        chunk: Dict[str, Any],
+        rules_to_zones: RulesToZones,
+    ) -> Tuple[Dict[str, Any], List[List[CommentsCollection]]]:
+        """Run all the passes of 'part' over 'chunk' in a worker process.
+        Return the transformed chunk, and the reasons of _get_all_reasons()
+        recorded by each pass.
+        """
+        if part == 'zones':
+            passes = self._get_zone_passes()
+        else:
+            passes = self._get_rule_passes(rules_to_zones)
+
+        pass_reasons: List[List[CommentsCollection]] = []
+        for func, args in passes:
+            chunk = func(chunk, *args)
+            pass_reasons.append(self._get_all_reasons())
+            self._clear_all_reasons()
+        return (chunk, pass_reasons)
+
+    def _get_all_reasons(self) -> List[CommentsCollection]:
+        """Return the all_removed_xxx and all_notable_xxx collections."""
+        return [
+            self.all_removed_zones,
+            self.all_removed_policies,
+            self.all_removed_links,
+            self.all_notable_zones,
+            self.all_notable_policies,
+            self.all_notable_links,
+        ]
+
+    def _clear_all_reasons(self) -> None:
+        """Replace the collections of _get_all_reasons() with empty ones."""
+        self.all_removed_zones = {}
+        self.all_removed_policies = {}
+        self.all_removed_links = {}
+        self.all_notable_zones = {}
+        self.all_notable_policies = {}
+        self.all_notable_links = {}
+
     def _print_removed_map(self, removed_map: CommentsCollection) -> None:
         """Helper routine that prints the removed Zone rules or Zone eras along
         with the reason why it was removed.
@@ -296,27 +795,101 @@ class Transformer:
                 hashes[h] = name
         return zones_map
 
+    def _apply_zone_stage(
+        self,
+        stage: ZoneStage,
+        zones_map: ZonesMap,
+    ) -> Tuple[ZonesMap, CommentsCollection, CommentsCollection]:
+        """Apply the ZoneStage to every zone of 'zones_map'. Return the zones
+        which were kept, and the reasons of the removed and notable zones.
+        """
+        results: ZonesMap = {}
+        removed_zones: CommentsCollection = {}
+        notable_zones: CommentsCollection = {}
+        for name, eras in zones_map.items():
+            keep_eras = stage(name, eras, removed_zones, notable_zones)
+            if keep_eras is not None:
+                results[name] = keep_eras
+        return results, removed_zones, notable_zones
+
+    def _transform_zones_fused(self, zones_map: ZonesMap) -> ZonesMap:
+        """Run every zone of 'zones_map' through the ZoneStages of the zone
+        passes of Part 1b of transform() in a single traversal, stopping at the
+        first stage which removes the zone. This avoids creating an
+        intermediate ZonesMap for each pass. The reasons are collected
+        separately for each stage, and merged in the order of the passes, so
+        that the results are identical to running the passes one after the
+        other.
+        """
+        # The ZoneStage, and the collection of its removed zones. Note that
+        # _remove_zones_invalid_until_time_suffix() records its zones in
+        # all_removed_policies.
+        stages: List[Tuple[ZoneStage, CommentsCollection]] = []
+        if self.scope == 'basic':
+            stages.append(
+                (self._check_zone_until_year_only, self.all_removed_zones))
+        stages.extend([
+            (self._expand_zone_until_day, self.all_removed_zones),
+            (self._expand_zone_until_time, self.all_removed_zones),
+            (self._check_zone_until_time_suffix, self.all_removed_policies),
+            (self._expand_zone_offset_string, self.all_removed_zones),
+            (self._check_zone_rules_format_combo, self.all_removed_zones),
+            (self._expand_zone_rules, self.all_removed_zones),
+            (self._check_zone_monotonic_until, self.all_removed_zones),
+            (self._merge_zone_equivalent_eras, self.all_removed_zones),
+        ])
+        removed: List[CommentsCollection] = [{} for _ in stages]
+        notable: List[CommentsCollection] = [{} for _ in stages]
+
+        results: ZonesMap = {}
+        for name, eras in zones_map.items():
+            for i, (stage, _) in enumerate(stages):
+                keep_eras = stage(name, eras, removed[i], notable[i])
+                if keep_eras is None:
+                    break
+                eras = keep_eras
+            else:
+                results[name] = eras
+
+        for (stage, all_removed), removed_zones, notable_zones in zip(
+            stages, removed, notable
+        ):
+            logging.info("Removed %s zone infos in %s", len(removed_zones),
+                         stage.__name__)
+            self._print_removed_map(removed_zones)
+            _merge_reasons(all_removed, removed_zones)
+            _merge_reasons(self.all_notable_zones, notable_zones)
+        logging.info("Kept %s of %s zone infos after %s fused stages",
+                     len(results), len(zones_map), len(stages))
+        return results
+
     def _remove_zone_eras_too_old(self, zones_map: ZonesMap) -> ZonesMap:
         """Remove zone eras which are too old, i.e. before (self.start_year-1).
         For start_year 2000, and viewing_months>13,
         ZoneSpecifier.init_for_year() could be called with 1999.
         """
-        results: ZonesMap = {}
-        count = 0
-        for name, eras in zones_map.items():
-            keep_eras: List[ZoneEraRaw] = []
-            for era in eras:
-                if era['untilYear'] >= self.start_year - 1:
-                    keep_eras.append(era)
-                else:
-                    count += 1
-            if keep_eras:
-                results[name] = keep_eras
+        results, _, _ = self._apply_zone_stage(
+            self._trim_zone_eras_too_old, zones_map)
+        count = _count_eras(zones_map) - _count_eras(results)
 
         logging.info("Removed %s zone eras before year %04d", count,
                      self.start_year)
         return results
 
+    def _trim_zone_eras_too_old(
+        self,
+        name: str,
+        eras: List[ZoneEraRaw],
+        removed_zones: CommentsCollection,
+        notable_zones: CommentsCollection,
+    ) -> Optional[List[ZoneEraRaw]]:
+        """ZoneStage of _remove_zone_eras_too_old()."""
+        keep_eras: List[ZoneEraRaw] = []
+        for era in eras:
+            if era.untilYear >= self.start_year - 1:
+                keep_eras.append(era)
+        return keep_eras if keep_eras else None
+
     def _remove_zone_eras_too_new(self, zones_map: ZonesMap) -> ZonesMap:
         """Remove zone eras which are too new, i.e. after self.until_year.
         We need at least one year after the last valid year (i.e. until_year),
@@ -329,36 +902,37 @@ class Transformer:
         If the ZoneSpecifier code is called with a year greater than
         self.until_year, it may cause a loop to crash.
         """
-        results: ZonesMap = {}
-        count = 0
-        for name, eras in zones_map.items():
-            keep_eras: List[ZoneEraRaw] = []
-            start_year = MIN_YEAR
-            for era in eras:
-                if start_year <= self.until_year + 1:
-                    keep_eras.append(era)
-                else:
-                    count += 1
-                # the next era's start year is this era's until_year
-                start_year = era['untilYear']
-            if keep_eras:
-                results[name] = keep_eras
+        results, _, _ = self._apply_zone_stage(
+            self._trim_zone_eras_too_new, zones_map)
+        count = _count_eras(zones_map) - _count_eras(results)
 
         logging.info("Removed %s zone eras starting after %04d", count,
                      self.until_year)
         return results
 
+    def _trim_zone_eras_too_new(
+        self,
+        name: str,
+        eras: List[ZoneEraRaw],
+        removed_zones: CommentsCollection,
+        notable_zones: CommentsCollection,
+    ) -> Optional[List[ZoneEraRaw]]:
+        """ZoneStage of _remove_zone_eras_too_new()."""
+        keep_eras: List[ZoneEraRaw] = []
+        start_year = MIN_YEAR
+        for era in eras:
+            if start_year <= self.until_year + 1:
+                keep_eras.append(era)
+            # the next era's start year is this era's until_year
+            start_year = era.untilYear
+        return keep_eras if keep_eras else None
+
     def _remove_zones_without_eras(self, zones_map: ZonesMap) -> ZonesMap:
         """Remove zones without any eras, which can happen if the start_year and
         until_year are too narrow. This prevents the C++ code from crashing.
         """
-        results: ZonesMap = {}
-        removed_zones: CommentsCollection = {}
-        for name, eras in zones_map.items():
-            if eras:
-                results[name] = eras
-            else:
-                _add_reason(removed_zones, name, "no ZoneEra found")
+        results, removed_zones, _ = self._apply_zone_stage(
+            self._check_zone_has_eras, zones_map)
 
         logging.info(
             "Removed %s zone infos without ZoneEras" % len(removed_zones))
@@ -366,30 +940,48 @@ class Transformer:
         _merge_reasons(self.all_removed_zones, removed_zones)
         return results
 
+    def _check_zone_has_eras(
+        self,
+        name: str,
+        eras: List[ZoneEraRaw],
+        removed_zones: CommentsCollection,
+        notable_zones: CommentsCollection,
+    ) -> Optional[List[ZoneEraRaw]]:
+        """ZoneStage of _remove_zones_without_eras()."""
+        if not eras:
+            _add_reason(removed_zones, name, "no ZoneEra found")
+            return None
+        return eras
+
     def _remove_zone_until_year_only_false(
         self, zones_map: ZonesMap,
     ) -> ZonesMap:
         """Remove zones which have month, day or time in the UNTIL field.
         These are not supported by BasicZoneSpecifier.
         """
-        results: ZonesMap = {}
-        removed_zones: CommentsCollection = {}
-        for name, eras in zones_map.items():
-            valid = True
-            for era in eras:
-                if not era['untilYearOnly']:
-                    valid = False
-                    _add_reason(
-                        removed_zones, name, "UNTIL contains month/day/time")
-                    break
-            if valid:
-                results[name] = eras
+        results, removed_zones, _ = self._apply_zone_stage(
+            self._check_zone_until_year_only, zones_map)
 
         logging.info("Removed %s zone infos with UNTIL month/day/time",
                      len(removed_zones))
         _merge_reasons(self.all_removed_zones, removed_zones)
         return results
 
+    def _check_zone_until_year_only(
+        self,
+        name: str,
+        eras: List[ZoneEraRaw],
+        removed_zones: CommentsCollection,
+        notable_zones: CommentsCollection,
+    ) -> Optional[List[ZoneEraRaw]]:
+        """ZoneStage of _remove_zone_until_year_only_false()."""
+        for era in eras:
+            if not era.untilYearOnly:
+                _add_reason(
+                    removed_zones, name, "UNTIL contains month/day/time")
+                return None
+        return eras
+
     def _create_zones_with_until_day(self, zones_map: ZonesMap) -> ZonesMap:
         """Convert zone.untilDay from 'lastSun' or 'Sun>=1' to a precise day,
         which is possible because the year and month are already known. For
@@ -397,52 +989,8 @@ class Transformer:
             * Zone Asia/Tbilisi 2005 3 lastSun 2:00
             * Zone America/Grand_Turk 2015 Nov Sun>=1 2:00
         """
-        results: ZonesMap = {}
-        removed_zones: CommentsCollection = {}
-        notable_zones: CommentsCollection = {}
-        for name, eras in zones_map.items():
-            valid = True
-            for era in eras:
-                until_day_string = era['untilDayString']
-
-                # Parse the conditional expression in until_day_string. We can
-                # resolve the 'lastSun', 'Sun>=X' and 'Fri<=X' to a specific day
-                # of month because we know the year.
-                (on_day_of_week, on_day_of_month) = \
-                    _parse_on_day_string(until_day_string)
-                if (on_day_of_week, on_day_of_month) == (0, 0):
-                    valid = False
-                    _add_reason(
-                        removed_zones, name,
-                        f"invalid untilDay '{until_day_string}'")
-                    break
-
-                month, day = calc_day_of_month(
-                    era['untilYear'], era['untilMonth'], on_day_of_week,
-                    on_day_of_month)
-                if month == 0:
-                    valid = False
-                    _add_reason(
-                        removed_zones, name,
-                        f"Shift to previous year unsupported for "
-                        f"{until_day_string}")
-                    break
-                if month == 13:
-                    valid = False
-                    _add_reason(
-                        removed_zones, name,
-                        f"Shift to following year unsupported for "
-                        f"{until_day_string}")
-
-                if era['untilMonth'] != month:
-                    _add_reason(
-                        notable_zones, name,
-                        f"untilMonth shifted from '{era['untilMonth']}' to "
-                        f"'{month}' due to {until_day_string}")
-                era['untilMonth'], era['untilDay'] = month, day
-
-            if valid:
-                results[name] = eras
+        results, removed_zones, notable_zones = self._apply_zone_stage(
+            self._expand_zone_until_day, zones_map)
 
         logging.info("Removed %s zone infos with invalid untilDay",
                      len(removed_zones))
@@ -451,52 +999,61 @@ class Transformer:
         _merge_reasons(self.all_notable_zones, notable_zones)
         return results
 
+    def _expand_zone_until_day(
+        self,
+        name: str,
+        eras: List[ZoneEraRaw],
+        removed_zones: CommentsCollection,
+        notable_zones: CommentsCollection,
+    ) -> Optional[List[ZoneEraRaw]]:
+        """ZoneStage of _create_zones_with_until_day()."""
+        valid = True
+        for era in eras:
+            until_day_string = era.untilDayString
+
+            # Parse the conditional expression in until_day_string. We can
+            # resolve the 'lastSun', 'Sun>=X' and 'Fri<=X' to a specific day
+            # of month because we know the year.
+            (on_day_of_week, on_day_of_month) = \
+                _parse_on_day_string(until_day_string)
+            if (on_day_of_week, on_day_of_month) == (0, 0):
+                _add_reason(
+                    removed_zones, name,
+                    f"invalid untilDay '{until_day_string}'")
+                return None
+
+            month, day = calc_day_of_month(
+                era.untilYear, era.untilMonth, on_day_of_week,
+                on_day_of_month)
+            if month == 0:
+                _add_reason(
+                    removed_zones, name,
+                    f"Shift to previous year unsupported for "
+                    f"{until_day_string}")
+                return None
+            if month == 13:
+                valid = False
+                _add_reason(
+                    removed_zones, name,
+                    f"Shift to following year unsupported for "
+                    f"{until_day_string}")
+
+            if era.untilMonth != month:
+                _add_reason(
+                    notable_zones, name,
+                    f"untilMonth shifted from '{era.untilMonth}' to "
+                    f"'{month}' due to {until_day_string}")
+            era.untilMonth, era.untilDay = month, day
+
+        return eras if valid else None
+
     def _create_zones_with_expanded_until_time(
         self, zones_map: ZonesMap,
     ) -> ZonesMap:
         """ Create 'untilSeconds' and 'untilSecondsTruncated' from 'untilTime'.
         """
-        results: ZonesMap = {}
-        removed_zones: CommentsCollection = {}
-        notable_zones: CommentsCollection = {}
-        for name, eras in zones_map.items():
-            valid = True
-            for era in eras:
-                until_time = era['untilTime']
-                until_seconds = time_string_to_seconds(until_time)
-                if until_seconds == INVALID_SECONDS:
-                    valid = False
-                    _add_reason(
-                        removed_zones, name,
-                        f"invalid UNTIL time '%until_time'")
-                    break
-                if until_seconds < 0:
-                    valid = False
-                    _add_reason(
-                        removed_zones, name,
-                        f"negative UNTIL time '{until_time}'")
-                    break
-
-                until_seconds_truncated = truncate_to_granularity(
-                    until_seconds, self.until_at_granularity)
-                if until_seconds != until_seconds_truncated:
-                    if self.strict:
-                        valid = False
-                        _add_reason(
-                            removed_zones, name,
-                            f"UNTIL time '{until_time}' must be multiples "
-                            f"of '{self.until_at_granularity}' seconds")
-                        break
-                    else:
-                        hm = seconds_to_hm_string(until_seconds_truncated)
-                        _add_reason(
-                            notable_zones, name,
-                            f"UNTIL time '{until_time}' truncated to '{hm}'")
-
-                era['untilSeconds'] = until_seconds
-                era['untilSecondsTruncated'] = until_seconds_truncated
-            if valid:
-                results[name] = eras
+        results, removed_zones, notable_zones = self._apply_zone_stage(
+            self._expand_zone_until_time, zones_map)
 
         logging.info("Removed %s zone infos with invalid UNTIL time",
                      len(removed_zones))
@@ -505,11 +1062,70 @@ class Transformer:
         _merge_reasons(self.all_notable_zones, notable_zones)
         return results
 
+    def _expand_zone_until_time(
+        self,
+        name: str,
+        eras: List[ZoneEraRaw],
+        removed_zones: CommentsCollection,
+        notable_zones: CommentsCollection,
+    ) -> Optional[List[ZoneEraRaw]]:
+        """ZoneStage of _create_zones_with_expanded_until_time()."""
+        for era in eras:
+            until_time = era.untilTime
+            until_seconds = time_string_to_seconds(until_time)
+            if until_seconds == INVALID_SECONDS:
+                _add_reason(
+                    removed_zones, name,
+                    f"invalid UNTIL time '%until_time'")
+                return None
+            if until_seconds < 0:
+                _add_reason(
+                    removed_zones, name,
+                    f"negative UNTIL time '{until_time}'")
+                return None
+
+            until_seconds_truncated = truncate_to_granularity(
+                until_seconds, self.until_at_granularity)
+            if until_seconds != until_seconds_truncated:
+                if self.strict:
+                    _add_reason(
+                        removed_zones, name,
+                        f"UNTIL time '{until_time}' must be multiples "
+                        f"of '{self.until_at_granularity}' seconds")
+                    return None
+                else:
+                    hm = seconds_to_hm_string(until_seconds_truncated)
+                    _add_reason(
+                        notable_zones, name,
+                        f"UNTIL time '{until_time}' truncated to '{hm}'")
+
+            era.untilSeconds = until_seconds
+            era.untilSecondsTruncated = until_seconds_truncated
+        return eras
+
     def _remove_zones_invalid_until_time_suffix(
         self, zones_map: ZonesMap,
     ) -> ZonesMap:
         """Remove zones whose UNTIL time contains an unsupported suffix.
         """
+        results, removed_zones, _ = self._apply_zone_stage(
+            self._check_zone_until_time_suffix, zones_map)
+
+        logging.info(
+            "Removed %s zone infos with unsupported UNTIL time suffix",
+            len(removed_zones))
+        self._print_removed_map(removed_zones)
+        _merge_reasons(self.all_removed_policies, removed_zones)
+        return results
+
+    def _check_zone_until_time_suffix(
+        self,
+        name: str,
+        eras: List[ZoneEraRaw],
+        removed_zones: CommentsCollection,
+        notable_zones: CommentsCollection,
+    ) -> Optional[List[ZoneEraRaw]]:
+        """ZoneStage of _remove_zones_invalid_until_time_suffix()."""
         # Define the supported time suffices. Basic supports only 'w', while
         # Extended supports all suffixes. The 'g' and 'z' is the same as 'u' and
         # does not currently appear in any TZ file, so let's catch it because it
@@ -519,82 +1135,24 @@ class Transformer:
         else:
             supported_suffices = ['w', 's', 'u']
 
-        results: ZonesMap = {}
-        removed_zones: CommentsCollection = {}
-        for name, eras in zones_map.items():
-            valid = True
-            for era in eras:
-                suffix = era['untilTimeSuffix']
-                suffix = suffix if suffix else 'w'
-                era['untilTimeSuffix'] = suffix
-                if suffix not in supported_suffices:
-                    valid = False
-                    _add_reason(
-                        removed_zones, name,
-                        f"unsupported UNTIL time suffix '{suffix}'")
-                    break
-            if valid:
-                results[name] = eras
-
-        logging.info(
-            "Removed %s zone infos with unsupported UNTIL time suffix",
-            len(removed_zones))
-        self._print_removed_map(removed_zones)
-        _merge_reasons(self.all_removed_policies, removed_zones)
-        return results
+        for era in eras:
+            suffix = era.untilTimeSuffix
+            suffix = suffix if suffix else 'w'
+            era.untilTimeSuffix = suffix
+            if suffix not in supported_suffices:
+                _add_reason(
+                    removed_zones, name,
+                    f"unsupported UNTIL time suffix '{suffix}'")
+                return None
+        return eras
 
     def _create_zones_with_expanded_offset_string(
         self, zones_map: ZonesMap,
     ) -> ZonesMap:
         """ Create expanded offset 'offsetSeconds' from zone.offsetString.
         """
-        results: ZonesMap = {}
-        removed_zones: CommentsCollection = {}
-        notable_zones: CommentsCollection = {}
-        for name, eras in zones_map.items():
-            valid = True
-            for era in eras:
-                offset_string = era['offsetString']
-                offset_seconds = time_string_to_seconds(offset_string)
-                if offset_seconds == INVALID_SECONDS:
-                    valid = False
-                    _add_reason(
-                        removed_zones, name,
-                        f"invalid STDOFF '{offset_string}'")
-                    break
-
-                # Truncate to requested granularity.
-                offset_seconds_truncated = truncate_to_granularity(
-                    offset_seconds, self.offset_granularity)
-                if offset_seconds != offset_seconds_truncated:
-                    if self.strict:
-                        valid = False
-                        _add_reason(
-                            removed_zones, name,
-                            f"STDOFF '{offset_string}' must be multiples of "
-                            f"'{self.offset_granularity}' seconds")
-                        break
-                    else:
-                        hm = seconds_to_hm_string(offset_seconds_truncated)
-                        _add_reason(
-                            notable_zones, name,
-                            f"STDOFF '{offset_string}' truncated to '{hm}'")
-
-                # Check that offset seconds can fit in a timeCode field
-                # implemented as a signed byte in multiples of 15-minutes.
-                offset_code = div_to_zero(offset_seconds_truncated, 900)
-                if offset_code < -127 or offset_code > 127:
-                    valid = False
-                    _add_reason(
-                        removed_zones, name,
-                        f"STDOFF '{offset_string}' too large for 8-bits")
-                    break
-
-                era['offsetSeconds'] = offset_seconds
-                era['offsetSecondsTruncated'] = offset_seconds_truncated
-
-            if valid:
-                results[name] = eras
+        results, removed_zones, notable_zones = self._apply_zone_stage(
+            self._expand_zone_offset_string, zones_map)
 
         logging.info("Removed %s zones with invalid offsetString",
                      len(removed_zones))
@@ -603,6 +1161,52 @@ class Transformer:
         _merge_reasons(self.all_notable_zones, notable_zones)
         return results
 
+    def _expand_zone_offset_string(
+        self,
+        name: str,
+        eras: List[ZoneEraRaw],
+        removed_zones: CommentsCollection,
+        notable_zones: CommentsCollection,
+    ) -> Optional[List[ZoneEraRaw]]:
+        """ZoneStage of _create_zones_with_expanded_offset_string()."""
+        for era in eras:
+            offset_string = era.offsetString
+            offset_seconds = time_string_to_seconds(offset_string)
+            if offset_seconds == INVALID_SECONDS:
+                _add_reason(
+                    removed_zones, name,
+                    f"invalid STDOFF '{offset_string}'")
+                return None
+
+            # Truncate to requested granularity.
+            offset_seconds_truncated = truncate_to_granularity(
+                offset_seconds, self.offset_granularity)
+            if offset_seconds != offset_seconds_truncated:
+                if self.strict:
+                    _add_reason(
+                        removed_zones, name,
+                        f"STDOFF '{offset_string}' must be multiples of "
+                        f"'{self.offset_granularity}' seconds")
+                    return None
+                else:
+                    hm = seconds_to_hm_string(offset_seconds_truncated)
+                    _add_reason(
+                        notable_zones, name,
+                        f"STDOFF '{offset_string}' truncated to '{hm}'")
+
+            # Check that offset seconds can fit in a timeCode field
+            # implemented as a signed byte in multiples of 15-minutes.
+            offset_code = div_to_zero(offset_seconds_truncated, 900)
+            if offset_code < -127 or offset_code > 127:
+                _add_reason(
+                    removed_zones, name,
+                    f"STDOFF '{offset_string}' too large for 8-bits")
+                return None
+
+            era.offsetSeconds = offset_seconds
+            era.offsetSecondsTruncated = offset_seconds_truncated
+        return eras
+
     def _remove_zones_with_invalid_rules_format_combo(
         self, zones_map: ZonesMap
     ) -> ZonesMap:
@@ -621,33 +1225,8 @@ class Transformer:
         there seems to be no corresponding change in the abbreviation so FORMAT
         contains no '%' or '/'. Generate a warning for now.
         """
-        results: ZonesMap = {}
-        removed_zones: CommentsCollection = {}
-        notable_zones: CommentsCollection = {}
-        for zone_name, eras in zones_map.items():
-            valid = True
-            for era in eras:
-                if not era['format']:
-                    _add_reason(removed_zones, zone_name, 'FORMAT is empty')
-                    valid = False
-                    break
-
-                if era['rules'] == '-' or ':' in era['rules']:
-                    if '%' in era['format']:
-                        _add_reason(
-                            removed_zones, zone_name,
-                            "RULES is fixed but FORMAT contains '%'")
-                        valid = False
-                        break
-                else:
-                    if not ('%' in era['format'] or '/' in era['format']):
-                        _add_reason(
-                            notable_zones, zone_name,
-                            "RULES not fixed but FORMAT is missing "
-                            + "'%' or '/'")
-
-            if valid:
-                results[zone_name] = eras
+        results, removed_zones, notable_zones = self._apply_zone_stage(
+            self._check_zone_rules_format_combo, zones_map)
 
         logging.info("Removed %s zones with invalid RULES and FORMAT combo",
                      len(removed_zones))
@@ -656,6 +1235,33 @@ class Transformer:
         _merge_reasons(self.all_notable_zones, notable_zones)
         return results
 
+    def _check_zone_rules_format_combo(
+        self,
+        name: str,
+        eras: List[ZoneEraRaw],
+        removed_zones: CommentsCollection,
+        notable_zones: CommentsCollection,
+    ) -> Optional[List[ZoneEraRaw]]:
+        """ZoneStage of _remove_zones_with_invalid_rules_format_combo()."""
+        for era in eras:
+            if not era.format:
+                _add_reason(removed_zones, name, 'FORMAT is empty')
+                return None
+
+            if era.rules == '-' or ':' in era.rules:
+                if '%' in era.format:
+                    _add_reason(
+                        removed_zones, name,
+                        "RULES is fixed but FORMAT contains '%'")
+                    return None
+            else:
+                if not ('%' in era.format or '/' in era.format):
+                    _add_reason(
+                        notable_zones, name,
+                        "RULES not fixed but FORMAT is missing "
+                        + "'%' or '/'")
+        return eras
+
     def _create_zones_with_rules_expansion(
         self, zones_map: ZonesMap,
     ) -> ZonesMap:
@@ -672,64 +1278,8 @@ class Transformer:
             * ':' which indicates that 'rulesDeltaSeconds' is defined, or
             * a string reference of the zone policy containing the rules
         """
-        results: ZonesMap = {}
-        removed_zones: CommentsCollection = {}
-        notable_zones: CommentsCollection = {}
-        for name, eras in zones_map.items():
-            valid = True
-            for era in eras:
-                rules_string = era['rules']
-                if rules_string.find(':') >= 0:
-                    if self.scope == 'basic':
-                        valid = False
-                        _add_reason(
-                            removed_zones, name,
-                            f"offset in RULES '{rules_string}'")
-                        break
-
-                    rules_delta_seconds = time_string_to_seconds(rules_string)
-                    if rules_delta_seconds == INVALID_SECONDS:
-                        valid = False
-                        _add_reason(
-                            removed_zones, name,
-                            f"invalid RULES string '{rules_string}'")
-                        break
-                    if rules_delta_seconds == 0:
-                        valid = False
-                        _add_reason(
-                            removed_zones, name,
-                            f"unexpected 0:00 RULES string '{rules_string}'")
-                        break
-
-                    rules_delta_seconds_truncated = truncate_to_granularity(
-                        rules_delta_seconds, self.offset_granularity)
-                    if rules_delta_seconds != rules_delta_seconds_truncated:
-                        if self.strict:
-                            valid = False
-                            _add_reason(
-                                removed_zones, name,
-                                f"RULES delta offset '{rules_string}' must be "
-                                f"multiples of '{self.offset_granularity}' "
-                                f"seconds")
-                            break
-                        else:
-                            hm = seconds_to_hm_string(
-                                rules_delta_seconds_truncated)
-                            _add_reason(
-                                notable_zones, name,
-                                f"RULES delta offset '{rules_string}'"
-                                f"truncated to '{hm}'")
-
-                    era['rules'] = ':'
-                    era['rulesDeltaSeconds'] = rules_delta_seconds
-                    era['rulesDeltaSecondsTruncated'] = \
-                        rules_delta_seconds_truncated
-                else:
-                    # If '-' or named policy, set to 0.
-                    era['rulesDeltaSeconds'] = 0
-                    era['rulesDeltaSecondsTruncated'] = 0
-            if valid:
-                results[name] = eras
+        results, removed_zones, notable_zones = self._apply_zone_stage(
+            self._expand_zone_rules, zones_map)
 
         logging.info("Removed %s zone infos with invalid RULES",
                      len(removed_zones))
@@ -738,6 +1288,63 @@ class Transformer:
         _merge_reasons(self.all_notable_zones, notable_zones)
         return results
 
+    def _expand_zone_rules(
+        self,
+        name: str,
+        eras: List[ZoneEraRaw],
+        removed_zones: CommentsCollection,
+        notable_zones: CommentsCollection,
+    ) -> Optional[List[ZoneEraRaw]]:
+        """ZoneStage of _create_zones_with_rules_expansion()."""
+        for era in eras:
+            rules_string = era.rules
+            if rules_string.find(':') >= 0:
+                if self.scope == 'basic':
+                    _add_reason(
+                        removed_zones, name,
+                        f"offset in RULES '{rules_string}'")
+                    return None
+
+                rules_delta_seconds = time_string_to_seconds(rules_string)
+                if rules_delta_seconds == INVALID_SECONDS:
+                    _add_reason(
+                        removed_zones, name,
+                        f"invalid RULES string '{rules_string}'")
+                    return None
+                if rules_delta_seconds == 0:
+                    _add_reason(
+                        removed_zones, name,
+                        f"unexpected 0:00 RULES string '{rules_string}'")
+                    return None
+
+                rules_delta_seconds_truncated = truncate_to_granularity(
+                    rules_delta_seconds, self.offset_granularity)
+                if rules_delta_seconds != rules_delta_seconds_truncated:
+                    if self.strict:
+                        _add_reason(
+                            removed_zones, name,
+                            f"RULES delta offset '{rules_string}' must be "
+                            f"multiples of '{self.offset_granularity}' "
+                            f"seconds")
+                        return None
+                    else:
+                        hm = seconds_to_hm_string(
+                            rules_delta_seconds_truncated)
+                        _add_reason(
+                            notable_zones, name,
+                            f"RULES delta offset '{rules_string}'"
+                            f"truncated to '{hm}'")
+
+                era.rules = ':'
+                era.rulesDeltaSeconds = rules_delta_seconds
+                era.rulesDeltaSecondsTruncated = \
+                    rules_delta_seconds_truncated
+            else:
+                # If '-' or named policy, set to 0.
+                era.rulesDeltaSeconds = 0
+                era.rulesDeltaSecondsTruncated = 0
+        return eras
+
     def _remove_zones_without_rules(
         self, zones_map: ZonesMap, rules_map: RulesMap
     ) -> ZonesMap:
@@ -749,7 +1356,7 @@ class Transformer:
         for name, eras in zones_map.items():
             valid = True
             for era in eras:
-                rule_name = era['rules']
+                rule_name = era.rules
                 if rule_name not in ['-', ':'] and rule_name not in rules_map:
                     valid = False
                     _add_reason(
@@ -772,37 +1379,8 @@ class Transformer:
             1) not monotonically increasing, or
             2) does not end in year=MAX_UNTIL_YEAR
         """
-        results: ZonesMap = {}
-        removed_zones: CommentsCollection = {}
-        for name, eras in zones_map.items():
-            valid = True
-            prev_until = None
-            for era in eras:
-                # yapf: disable
-                current_until = (
-                    era['untilYear'],
-                    era['untilMonth'] if era['untilMonth'] else 0,
-                    era['untilDay'] if era['untilDayString'] else 0,
-                    era['untilSeconds'] if era['untilSeconds'] else 0
-                )
-                # yapf: enable
-                if prev_until:
-                    if current_until <= prev_until:
-                        valid = False
-                        _add_reason(
-                            removed_zones, name,
-                            'non increasing UNTIL: %04d-%02d-%02d %ds' %
-                            current_until)
-                        break
-                prev_until = current_until
-            if valid and current_until[0] != MAX_UNTIL_YEAR:
-                valid = False
-                _add_reason(
-                    removed_zones, name,
-                    'invalid final UNTIL: %04d-%02d-%02d %ds' % current_until)
-
-            if valid:
-                results[name] = eras
+        results, removed_zones, _ = self._apply_zone_stage(
+            self._check_zone_monotonic_until, zones_map)
 
         logging.info("Removed %s zone infos with invalid UNTIL fields",
                      len(removed_zones))
@@ -810,6 +1388,83 @@ class Transformer:
         _merge_reasons(self.all_removed_zones, removed_zones)
         return results
 
+    def _check_zone_monotonic_until(
+        self,
+        name: str,
+        eras: List[ZoneEraRaw],
+        removed_zones: CommentsCollection,
+        notable_zones: CommentsCollection,
+    ) -> Optional[List[ZoneEraRaw]]:
+        """ZoneStage of _remove_zones_with_non_monotonic_until()."""
+        prev_until = None
+        for era in eras:
+            # yapf: disable
+            current_until = (
+                era.untilYear,
+                era.untilMonth if era.untilMonth else 0,
+                era.untilDay if era.untilDayString else 0,
+                era.untilSeconds if era.untilSeconds else 0
+            )
+            # yapf: enable
+            if prev_until:
+                if current_until <= prev_until:
+                    _add_reason(
+                        removed_zones, name,
+                        'non increasing UNTIL: %04d-%02d-%02d %ds' %
+                        current_until)
+                    return None
+            prev_until = current_until
+        if current_until[0] != MAX_UNTIL_YEAR:
+            _add_reason(
+                removed_zones, name,
+                'invalid final UNTIL: %04d-%02d-%02d %ds' % current_until)
+            return None
+        return eras
+
+    def _merge_zones_equivalent_eras(self, zones_map: ZonesMap) -> ZonesMap:
+        """Merge consecutive Zone eras which have the same truncated STDOFF,
+        the same RULES and the same FORMAT. The UNTIL of the earlier era is
+        then only a boundary which produces no change of the UTC offset or the
+        abbreviation, but costs a ZoneMatch and a Transition.
+        """
+        results, _, notable_zones = self._apply_zone_stage(
+            self._merge_zone_equivalent_eras, zones_map)
+
+        logging.info("Merged equivalent eras in %s zone infos",
+                     len(notable_zones))
+        _merge_reasons(self.all_notable_zones, notable_zones)
+        return results
+
+    def _merge_zone_equivalent_eras(
+        self,
+        name: str,
+        eras: List[ZoneEraRaw],
+        removed_zones: CommentsCollection,
+        notable_zones: CommentsCollection,
+    ) -> Optional[List[ZoneEraRaw]]:
+        """ZoneStage of _merge_zones_equivalent_eras(). The merged era is a
+        copy of the later era, with 'Merged: ' prepended to its rawLine. The
+        eras are not modified.
+        """
+        merged_eras: List[ZoneEraRaw] = []
+        for era in eras:
+            if merged_eras and _is_equivalent_era(merged_eras[-1], era):
+                prev_era = merged_eras[-1]
+                _add_reason(
+                    notable_zones, name,
+                    'merged equivalent eras at UNTIL: %04d-%02d-%02d %ds' % (
+                        prev_era.untilYear,
+                        prev_era.untilMonth,
+                        prev_era.untilDay,
+                        prev_era.untilSecondsTruncated,
+                    ))
+                merged_era = era.copy()
+                merged_era.rawLine = 'Merged: ' + era.rawLine
+                merged_eras[-1] = merged_era
+            else:
+                merged_eras.append(era)
+        return merged_eras if len(merged_eras) < len(eras) else eras
+
     # --------------------------------------------------------------------
     # Methods related to Rules
     # --------------------------------------------------------------------
@@ -824,36 +1479,10 @@ class Transformer:
             * Spain (Found '2' transitions in year/month '1938-04')
             * Tunisia (Found '2' transitions in year/month '1943-04')
         """
-        CountsMap = Dict[Tuple[str, int, int], int]
-
-        # First pass: collect number of transitions for each (year, month) pair.
-        counts: CountsMap = {}
-        for name, rules in rules_map.items():
-            for rule in rules:
-                from_year = rule['fromYear']
-                to_year = rule['toYear']
-                month = rule['inMonth']
-                for year in range(from_year, to_year + 1):
-                    key = (name, year, month)
-                    count = counts.get(key)
-                    count = count + 1 if count else 1
-                    counts[key] = count
-
-        # Second pass: Collect rule policies which have multiple transitions
-        # in one month.
-        removals: Dict[str, Tuple[int, int, int]] = {}
-        for key, count in counts.items():
-            if count > 1:
-                policy_name = key[0]
-                year = key[1]
-                month = key[2]
-                removals[policy_name] = (count, year, month)
-
-        # Third pass: Remove rule policies with multiple counts.
         results: RulesMap = {}
         removed_policies: CommentsCollection = {}
         for name, rules in rules_map.items():
-            removal = removals.get(name)
+            removal = _find_multiple_transitions_in_month(rules)
             if removal:
                 _add_reason(
                     removed_policies, name,
@@ -876,7 +1505,7 @@ class Transformer:
         for name, rules in rules_map.items():
             valid = True
             for rule in rules:
-                letter = rule['letter']
+                letter = rule.letter
                 if len(letter) > 1:
                     valid = False
                     _add_reason(
@@ -907,9 +1536,9 @@ class Transformer:
         for name, rules in rules_map.items():
             valid = True
             for rule in rules:
-                suffix = rule['atTimeSuffix']
+                suffix = rule.atTimeSuffix
                 suffix = suffix if suffix else 'w'
-                rule['atTimeSuffix'] = suffix
+                rule.atTimeSuffix = suffix
                 if suffix not in supported_suffices:
                     valid = False
                     _add_reason(
@@ -942,49 +1571,58 @@ class Transformer:
         For viewing_months==14, init_for_year() will always be called with 2000
         or higher, so we just need 1999 data to get the most recent prior
         Transition before Jan 1, 2000.
+
+        The Rules of each policy are searched through a RuleIndex, created
+        when the policy is first referenced, instead of a scan of all its Rules
+        for each ZoneEra.
         """
+        indexes: Dict[str, RuleIndex] = {}
         for zone_name, eras in zones_map.items():
             begin_year = self.start_year - 1
             for era in eras:
-                policy_name = era['rules']
+                policy_name = era.rules
                 if policy_name in ['-', ':']:
                     continue
 
-                rules = rules_map.get(policy_name)
-                if not rules:
-                    logging.error(
-                        "Zone '%s': Could not find policy '%s': "
-                        + "should not happen", zone_name, policy_name)
-                    sys.exit(1)
+                index = indexes.get(policy_name)
+                if not index:
+                    rules = rules_map.get(policy_name)
+                    if not rules:
+                        logging.error(
+                            "Zone '%s': Could not find policy '%s': "
+                            + "should not happen", zone_name, policy_name)
+                        sys.exit(1)
+                    index = RuleIndex(rules)
+                    indexes[policy_name] = index
 
                 # Make all Rules which overlap with the current Zone Era.
                 # Some Zone Era have an until_month, until_day and until_time
                 # components. To be conservative, we need to expand the
                 # until_year to the following year, so the effective zone era
                 # interval becomes [begin_year, until_year+1).
-                until_year = min(era['untilYear'], self.until_year)
-                matching_rules = find_matching_rules(rules, begin_year,
-                                                     until_year + 1)
+                until_year = min(era.untilYear, self.until_year)
+                matching_rules = index.find_matching_rules(
+                    begin_year, until_year + 1)
                 for rule in matching_rules:
-                    rule['used'] = True
+                    rule.used = True
 
                 # Find latest Rules just prior to the begin_year.
                 # Result: It looks like all of these prior rules are
                 # already picked up by previous calls to find_matching_rules().
-                prior_rules = find_latest_prior_rules(rules, begin_year)
+                prior_rules = index.find_latest_prior_rules(begin_year)
                 for rule in prior_rules:
-                    rule['used'] = True
+                    rule.used = True
 
                 # Find earliest Rules subsequent to the until_year mark.
                 # Result: It looks like all of these subsequent rules are
                 # already picked up by previous calls to find_matching_rules().
-                subsequent_rules = find_earliest_subsequent_rules(
-                    rules, until_year + 1)
+                subsequent_rules = index.find_earliest_subsequent_rules(
+                    until_year + 1)
                 for rule in subsequent_rules:
-                    rule['used'] = True
+                    rule.used = True
 
                 # Set the begin year of the next ZoneEra
-                begin_year = era['untilYear']
+                begin_year = era.untilYear
 
         return (zones_map, rules_map)
 
@@ -1001,10 +1639,10 @@ class Transformer:
         for name, rules in rules_map.items():
             used_rules = []
             for rule in rules:
-                if rule.get('used'):
+                if getattr(rule, 'used', False):
                     used_rules.append(rule)
                     # Set the 'used' to None to remove from JSON output.
-                    del rule['used']
+                    del rule.used
                 else:
                     removed_rule_count += 1
             if used_rules:
@@ -1026,8 +1664,8 @@ class Transformer:
         for name, rules in rules_map.items():
             valid = True
             for rule in rules:
-                from_year = rule['fromYear']
-                to_year = rule['toYear']
+                from_year = rule.fromYear
+                to_year = rule.toYear
                 if not is_year_tiny(from_year) or not is_year_tiny(from_year):
                     valid = False
                     _add_reason(
@@ -1048,15 +1686,15 @@ class Transformer:
     def _create_rules_with_on_day_expansion(
         self, rules_map: RulesMap,
     ) -> RulesMap:
-        """Create rule['onDayOfWeek'] and rule['onDayOfMonth'] from
-        rule['onDay']. The onDayOfMonth will be negative if "<=" is used.
+        """Create rule.onDayOfWeek and rule.onDayOfMonth from
+        rule.onDay. The onDayOfMonth will be negative if "<=" is used.
         """
         results: RulesMap = {}
         removed_policies: CommentsCollection = {}
         for name, rules in rules_map.items():
             valid = True
             for rule in rules:
-                on_day = rule['onDay']
+                on_day = rule.onDay
                 (on_day_of_week, on_day_of_month) = _parse_on_day_string(on_day)
 
                 if (on_day_of_week, on_day_of_month) == (0, 0):
@@ -1072,21 +1710,21 @@ class Transformer:
                 if on_day_of_week != 0 and on_day_of_month != 0:
                     if (-7 <= on_day_of_month
                             and on_day_of_month < -1
-                            and rule['inMonth'] == 1):
+                            and rule.inMonth == 1):
                         valid = False
                         _add_reason(
                             removed_policies, name,
                             f"cannot shift '{on_day}' from Jan to prev year")
                         break
-                    if 26 <= on_day_of_month and rule['inMonth'] == 12:
+                    if 26 <= on_day_of_month and rule.inMonth == 12:
                         valid = False
                         _add_reason(
                             removed_policies, name,
                             f"cannot shift '{on_day}' from Dec to next year")
                         break
 
-                rule['onDayOfWeek'] = on_day_of_week
-                rule['onDayOfMonth'] = on_day_of_month
+                rule.onDayOfWeek = on_day_of_week
+                rule.onDayOfMonth = on_day_of_month
             if valid:
                 results[name] = rules
 
@@ -1125,7 +1763,7 @@ class Transformer:
         """Return True if rules has a rule prior to (self.start_year-1).
         """
         for rule in rules:
-            from_year = rule['fromYear']
+            from_year = rule.fromYear
             if from_year < self.start_year - 1:
                 return True
         return False
@@ -1146,33 +1784,33 @@ class Transformer:
         # rules will never be empty, so this will always produce a
         # non-empty anchor_info['rule'].
         for rule in rules:
-            from_year = rule['fromYear']
-            in_month = rule['inMonth']
-            on_day_of_week = rule['onDayOfWeek']
-            on_day_of_month = rule['onDayOfMonth']
+            from_year = rule.fromYear
+            in_month = rule.inMonth
+            on_day_of_week = rule.onDayOfWeek
+            on_day_of_month = rule.onDayOfMonth
             month, day = calc_day_of_month(
                 from_year, in_month, on_day_of_week, on_day_of_month)
             rule_date = (from_year, month, day)
 
-            if (rule['deltaSeconds'] == 0
+            if (rule.deltaSeconds == 0
                     and rule_date < anchor_info['earliestDate']):
                 anchor_info['earliestDate'] = rule_date
                 anchor_info['rule'] = rule
 
         anchor_rule = cast(ZoneRuleRaw, anchor_info['rule']).copy()
-        anchor_rule['fromYear'] = MIN_YEAR
-        anchor_rule['toYear'] = MIN_YEAR
-        anchor_rule['inMonth'] = 1
-        anchor_rule['onDayOfWeek'] = 0
-        anchor_rule['onDayOfMonth'] = 1
-        anchor_rule['atTime'] = '0'
-        anchor_rule['atTimeSuffix'] = 'w'
-        anchor_rule['deltaOffset'] = '0'
-        anchor_rule['atSeconds'] = 0
-        anchor_rule['atSecondsTruncated'] = 0
-        anchor_rule['deltaSeconds'] = 0
-        anchor_rule['deltaSecondsTruncated'] = 0
-        anchor_rule['rawLine'] = 'Anchor: ' + anchor_rule['rawLine']
+        anchor_rule.fromYear = MIN_YEAR
+        anchor_rule.toYear = MIN_YEAR
+        anchor_rule.inMonth = 1
+        anchor_rule.onDayOfWeek = 0
+        anchor_rule.onDayOfMonth = 1
+        anchor_rule.atTime = '0'
+        anchor_rule.atTimeSuffix = 'w'
+        anchor_rule.deltaOffset = '0'
+        anchor_rule.atSeconds = 0
+        anchor_rule.atSecondsTruncated = 0
+        anchor_rule.deltaSeconds = 0
+        anchor_rule.deltaSecondsTruncated = 0
+        anchor_rule.rawLine = 'Anchor: ' + anchor_rule.rawLine
         return anchor_rule
 
     def _remove_rules_with_border_transitions(
@@ -1188,10 +1826,10 @@ class Transformer:
         for name, rules in rules_map.items():
             valid = True
             for rule in rules:
-                from_year = rule['fromYear']
-                to_year = rule['toYear']
-                month = rule['inMonth']
-                on_day_of_month = rule['onDayOfMonth']
+                from_year = rule.fromYear
+                to_year = rule.toYear
+                month = rule.inMonth
+                on_day_of_month = rule.onDayOfMonth
                 if from_year > MIN_YEAR and to_year > MIN_YEAR:
                     if month == 1 and on_day_of_month == 1:
                         valid = False
@@ -1214,7 +1852,7 @@ class Transformer:
         rules_map: RulesMap,
         rules_to_zones: RulesToZones,
     ) -> RulesMap:
-        """ Create 'atSeconds' parameter from rule['atTime'].
+        """ Create 'atSeconds' parameter from rule.atTime.
         """
         results: RulesMap = {}
         removed_policies: CommentsCollection = {}
@@ -1222,7 +1860,7 @@ class Transformer:
         for policy_name, rules in rules_map.items():
             valid = True
             for rule in rules:
-                at_time = rule['atTime']
+                at_time = rule.atTime
                 at_seconds = time_string_to_seconds(at_time)
                 if at_seconds == INVALID_SECONDS:
                     valid = False
@@ -1263,8 +1901,8 @@ class Transformer:
                                     f"RULE '{policy_name}' "
                                     f"truncated to '{hm}'")
 
-                rule['atSeconds'] = at_seconds
-                rule['atSecondsTruncated'] = at_seconds_truncated
+                rule.atSeconds = at_seconds
+                rule.atSecondsTruncated = at_seconds_truncated
             if valid:
                 results[policy_name] = rules
 
@@ -1280,7 +1918,7 @@ class Transformer:
         rules_map: RulesMap,
     ) -> RulesMap:
         """ Create 'deltaSeconds' and 'deltaSecondsTruncated' from
-        rule['deltaOffset'].
+        rule.deltaOffset.
         """
         results = {}
         removed_policies: CommentsCollection = {}
@@ -1288,7 +1926,7 @@ class Transformer:
         for name, rules in rules_map.items():
             valid = True
             for rule in rules:
-                delta_offset = rule['deltaOffset']
+                delta_offset = rule.deltaOffset
                 delta_seconds = time_string_to_seconds(delta_offset)
                 if delta_seconds == INVALID_SECONDS:
                     valid = False
@@ -1328,8 +1966,8 @@ class Transformer:
                         f"deltaOffset '{delta_offset}' too large for 4-bits")
                     break
 
-                rule['deltaSeconds'] = delta_seconds
-                rule['deltaSecondsTruncated'] = delta_seconds_truncated
+                rule.deltaSeconds = delta_seconds
+                rule.deltaSecondsTruncated = delta_seconds_truncated
             if valid:
                 results[name] = rules
 
@@ -1340,6 +1978,60 @@ class Transformer:
         _merge_reasons(self.all_notable_policies, notable_policies)
         return results
 
+    def _merge_contiguous_rules(self, rules_map: RulesMap) -> RulesMap:
+        """Merge the rules of a policy which differ only in their years, and
+        whose years are contiguous, e.g. '1987 1990 Apr Sun>=1 2:00 1:00 D'
+        followed by '1991 only Apr Sun>=1 2:00 1:00 D' becomes '1987 1991 Apr
+        Sun>=1 2:00 1:00 D'. A rule produces a transition in each year of
+        [fromYear, toYear] independently of its other years, so the merged rule
+        produces the same transitions. A rule is merged only into the closest
+        preceding rule with the same fields, so the rules are expected to be
+        in chronological order, as in the TZ files. The merged rule is a copy
+        of the earliest rule, with 'Merged: ' prepended to its rawLine.
+        """
+        results: RulesMap = {}
+        merged_rule_count = 0
+        merged_policies: List[str] = []
+        for name, rules in rules_map.items():
+            merged_rules: List[ZoneRuleRaw] = []
+            # Index in merged_rules of the last rule with the given fields.
+            last_indexes: Dict[Tuple[Any, ...], int] = {}
+            copied_indexes: Set[int] = set()
+            for rule in rules:
+                key = (
+                    rule.inMonth,
+                    rule.onDay,
+                    rule.atTime,
+                    rule.atTimeSuffix,
+                    rule.deltaOffset,
+                    rule.letter,
+                )
+                index = last_indexes.get(key)
+                if index is not None \
+                        and merged_rules[index].toYear + 1 \
+                        == rule.fromYear:
+                    if index not in copied_indexes:
+                        copied_indexes.add(index)
+                        merged_rule = merged_rules[index].copy()
+                        merged_rule.rawLine = \
+                            'Merged: ' + merged_rule.rawLine
+                        merged_rules[index] = merged_rule
+                    merged_rules[index].toYear = rule.toYear
+                    merged_rule_count += 1
+                    continue
+                last_indexes[key] = len(merged_rules)
+                merged_rules.append(rule)
+
+            if copied_indexes:
+                merged_policies.append(name)
+                results[name] = merged_rules
+            else:
+                results[name] = rules
+
+        logging.info('Merged %s contiguous rules in %s rule policies: %s',
+                     merged_rule_count, len(merged_policies), merged_policies)
+        return results
+
     # --------------------------------------------------------------------
     # Methods related to Links.
     # --------------------------------------------------------------------
@@ -1494,6 +2186,94 @@ def time_string_to_seconds(time_string: str) -> int:
     return sign * ((hour * 60 + minute) * 60 + second)
 
 
+# Minimum number of Rules of a policy to be indexed by RuleIndex. Smaller
+# policies are faster to scan than to sort.
+MIN_INDEXED_RULES = 32
+
+
+class RuleIndex:
+    """Index of the Rules of a single policy, which answers the queries of
+    find_matching_rules(), find_latest_prior_rules() and
+    find_earliest_subsequent_rules() using a binary search over the Rules
+    sorted by fromYear and by toYear, instead of scanning all the Rules. The
+    Rules are returned in their original order, like those functions. Policies
+    with fewer than MIN_INDEXED_RULES Rules are not indexed, and are scanned.
+
+    Usage:
+        index = RuleIndex(rules)
+        matching_rules = index.find_matching_rules(era_from, era_until)
+        prior_rules = index.find_latest_prior_rules(year)
+        subsequent_rules = index.find_earliest_subsequent_rules(year)
+    """
+
+    def __init__(self, rules: List[ZoneRuleRaw]):
+        self.rules = rules
+        self.indexed = len(rules) >= MIN_INDEXED_RULES
+        if not self.indexed:
+            return
+
+        from_years = [rule.fromYear for rule in rules]
+        to_dates = [(rule.toYear, rule.inMonth) for rule in rules]
+
+        # Rule indexes sorted by fromYear, and by (toYear, inMonth). The sort
+        # is stable, so the Rules of the same date remain in their order.
+        self.by_from = sorted(range(len(rules)), key=from_years.__getitem__)
+        self.by_to = sorted(range(len(rules)), key=to_dates.__getitem__)
+        self.from_years = [from_years[i] for i in self.by_from]
+        self.to_dates = [to_dates[i] for i in self.by_to]
+        self.to_years = [date[0] for date in self.to_dates]
+
+    def find_matching_rules(
+        self,
+        era_from: int,
+        era_until: int,
+    ) -> List[ZoneRuleRaw]:
+        """Same as find_matching_rules(rules, era_from, era_until). The Rules
+        with (fromYear < era_until) are a prefix of 'by_from', and the Rules
+        with (era_from <= toYear) are a suffix of 'by_to'. Only the shorter
+        one is checked for the other condition.
+        """
+        if not self.indexed:
+            return find_matching_rules(self.rules, era_from, era_until)
+
+        end = bisect.bisect_left(self.from_years, era_until)
+        begin = bisect.bisect_left(self.to_years, era_from)
+        if end <= len(self.by_to) - begin:
+            matches = [
+                i for i in self.by_from[:end]
+                if era_from <= self.rules[i].toYear
+            ]
+        else:
+            matches = [
+                i for i in self.by_to[begin:]
+                if self.rules[i].fromYear < era_until
+            ]
+        matches.sort()
+        return [self.rules[i] for i in matches]
+
+    def find_latest_prior_rules(self, year: int) -> List[ZoneRuleRaw]:
+        """Same as find_latest_prior_rules(rules, year)."""
+        if not self.indexed:
+            return find_latest_prior_rules(self.rules, year)
+
+        end = bisect.bisect_left(self.to_years, year)
+        if end == 0:
+            return []
+        begin = bisect.bisect_left(self.to_dates, self.to_dates[end - 1])
+        return [self.rules[i] for i in self.by_to[begin:end]]
+
+    def find_earliest_subsequent_rules(self, year: int) -> List[ZoneRuleRaw]:
+        """Same as find_earliest_subsequent_rules(rules, year)."""
+        if not self.indexed:
+            return find_earliest_subsequent_rules(self.rules, year)
+
+        begin = bisect.bisect_left(self.to_years, year)
+        if begin == len(self.to_years):
+            return []
+        end = bisect.bisect_right(self.to_dates, self.to_dates[begin])
+        return [self.rules[i] for i in self.by_to[begin:end]]
+
+
 def find_matching_rules(
     rules: List[ZoneRuleRaw],
     era_from: int,
@@ -1507,7 +2287,7 @@ def find_matching_rules(
     """
     matches = []
     for rule in rules:
-        if rule['fromYear'] < era_until and era_from <= rule['toYear']:
+        if rule.fromYear < era_until and era_from <= rule.toYear:
             matches.append(rule)
     return matches
 
@@ -1543,8 +2323,8 @@ def find_latest_prior_rules(
     candidates = []
     candidate_date = (0, 0)  # sentinel date earlier than all real Rules
     for rule in rules:
-        rule_year = rule['toYear']
-        rule_month = rule['inMonth']
+        rule_year = rule.toYear
+        rule_month = rule.inMonth
         if rule_year < year:
             rule_date = (rule_year, rule_month)
             if rule_date > candidate_date:
@@ -1581,8 +2361,8 @@ def find_earliest_subsequent_rules(
     # sentinel date later than all real Rules
     candidate_date = (MAX_YEAR, 13)
     for rule in rules:
-        rule_year = rule['toYear']
-        rule_month = rule['inMonth']
+        rule_year = rule.toYear
+        rule_month = rule.inMonth
         if rule_year >= year:
             rule_date = (rule_year, rule_month)
             if rule_date < candidate_date:
@@ -1732,13 +2512,13 @@ def create_format_strings(
     strings_count: Dict[str, int] = {}
     for name, eras in zones_map.items():
         for era in eras:
-            format = era['format'].replace('%s', '%')
+            format = era.format.replace('%s', '%')
             count = strings_count.get(format, 0)
             strings_count[format] = count + 1
     for name, rules in rules_map.items():
         for rule in rules:
-            count = strings_count.get(rule['letter'], 0)
-            strings_count[rule['letter']] = count + 1
+            count = strings_count.get(rule.letter, 0)
+            strings_count[rule.letter] = count + 1
 
     format_strings: 'OrderedDict[str, int]' = OrderedDict()
     size = 0
@@ -1793,7 +2573,7 @@ def _create_rules_to_zones(
     rules_to_zones: RulesToZones = {}
     for full_name, eras in zones_map.items():
         for era in eras:
-            rule_name = era['rules']
+            rule_name = era.rules
             if rule_name not in ['-', ':']:
                 zones = rules_to_zones.get(rule_name)
                 if not zones:
@@ -1828,6 +2608,87 @@ def hash_name(name: str) -> int:
     return hash
 
 
+def _count_maps(
+    zones_map: Optional[ZonesMap],
+    rules_map: Optional[RulesMap],
+    links_map: Optional[LinksMap],
+) -> PassCounts:
+    """Return the PassCounts of the given maps."""
+    counts: PassCounts = {}
+    if zones_map is not None:
+        counts['zones'] = len(zones_map)
+        counts['eras'] = sum(len(eras) for eras in zones_map.values())
+    if rules_map is not None:
+        counts['policies'] = len(rules_map)
+        counts['rules'] = sum(len(rules) for rules in rules_map.values())
+    if links_map is not None:
+        counts['links'] = len(links_map)
+    return counts
+
+
+def _find_multiple_transitions_in_month(
+    rules: List[ZoneRuleRaw],
+) -> Optional[Tuple[int, int, int]]:
+    """Return the (count, year, month) of a month which contains more than one
+    transition of 'rules', or None if there are none. The [fromYear, toYear]
+    intervals of the rules of each month are split at their boundaries into
+    segments of years covered by the same rules, instead of counting the
+    transitions of each year, which would loop over thousands of years for
+    the rules ending in 'max'.
+
+    If there are several such months, the one reported is the last one in the
+    order of the first rule of each month, then the year. This is the month
+    reported by the previous implementation which counted each year.
+    """
+    # month -> [(index, fromYear, toYear)]
+    intervals_by_month: Dict[int, List[Tuple[int, int, int]]] = {}
+    for index, rule in enumerate(rules):
+        intervals = intervals_by_month.setdefault(rule.inMonth, [])
+        intervals.append((index, rule.fromYear, rule.toYear))
+
+    # (index of the first rule, year, count, month)
+    last: Optional[Tuple[int, int, int, int]] = None
+    for month, intervals in intervals_by_month.items():
+        if len(intervals) < 2:
+            continue
+        boundaries = sorted(
+            {from_year for _, from_year, _ in intervals}
+            | {to_year + 1 for _, _, to_year in intervals})
+        for begin, end in zip(boundaries, boundaries[1:]):
+            covering = [
+                index for index, from_year, to_year in intervals
+                if from_year <= begin <= to_year
+            ]
+            if len(covering) < 2:
+                continue
+            overlap = (covering[0], end - 1, len(covering), month)
+            if last is None or overlap[:2] > last[:2]:
+                last = overlap
+
+    if last is None:
+        return None
+    return (last[2], last[1], last[3])
+
+
+def _is_equivalent_era(era: ZoneEraRaw, next_era: ZoneEraRaw) -> bool:
+    """Return True if 'era' and 'next_era' produce the same UTC offset and
+    abbreviation, using the truncated offsets which are used by the
+    generators.
+    """
+    return (
+        era.offsetSecondsTruncated == next_era.offsetSecondsTruncated
+        and era.rules == next_era.rules
+        and era.rulesDeltaSecondsTruncated
+        == next_era.rulesDeltaSecondsTruncated
+        and era.format == next_era.format
+    )
+
+
+def _count_eras(zones_map: ZonesMap) -> int:
+    """Return the total number of eras in 'zones_map'."""
+    return sum(len(eras) for eras in zones_map.values())
+
+
 def _add_reason(m: CommentsCollection, name: str, reason: str) -> None:
     """Add the human readable 'reason' to a map of {name -> Set(reasons)}.
     """
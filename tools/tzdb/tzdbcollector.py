@@ -8,6 +8,7 @@ import json
 from .extractor import ZonesMap
 from .extractor import RulesMap
 from .extractor import LinksMap
+from .extractor import record_to_json
 from .transformer import CommentsMap
 from .transformer import StringCollection
 from typing import List
@@ -47,7 +48,8 @@ class TzDbCollector:
     into a single TzDb data structure which can easily be exported as a JSON
     file. Downstream processors (e.g. pygenerator.py, zonelistgenerator.py,
     argenerator.py) can consume this single data structure to generate ZoneInfo
-    files for any other languages or targets.
+    files for any other languages or targets. The ZoneEraRaw and ZoneRuleRaw
+    records are converted to dicts only when the JSON file is written.
     """
 
     # The output of this is called "tzdb.json" because it is the JSON
@@ -114,6 +116,7 @@ class TzDbCollector:
     def generate_files(self, output_dir: str) -> None:
         full_filename = os.path.join(output_dir, self._OUTPUT_FILE)
         with open(full_filename, 'w', encoding='utf-8') as output_file:
-            json.dump(self.tzdb, output_file, indent=2)
+            json.dump(
+                self.tzdb, output_file, indent=2, default=record_to_json)
             print(file=output_file)  # add terminating newline
         logging.info("Created %s", full_filename)
@@ -18,8 +18,13 @@ Flags:
     The following flags are recognized and passed along into the various helper
     classes:
 
+    Extractor:
+
+        --jobs
+
     Transformer:
 
+        --jobs
         --scope (basic|extended)
         --start_year
         --until_year
@@ -27,6 +32,9 @@ Flags:
         --until_at_granularity
         --offset_granularity
         --strict
+        --transform_profile {file}
+        --fused_transform
+        --in_place_transform
 
     TestDataGenerator:
 
@@ -39,12 +47,14 @@ Flags:
         --debug_specifier
         --in_place_transitions
         --optimize_candidates
+        --prune_candidates
 
     Validator:
 
         --zone {zone_name}
         --year {year}
         --validate_dst_offset
+        --validate_equivalence_classes
         --debug_validator
 
 Examples:
@@ -57,34 +67,44 @@ import logging
 
 from tzdb.extractor import Extractor
 from tzdb.transformer import Transformer
-from zonedb.ingenerator import InlineGenerator, ZoneInfoMap, ZonePolicyMap
+from zonedb.ingenerator import InlineGenerator
+from zonedb.ingenerator import ZoneInfoCookedMap
+from zonedb.ingenerator import ZonePolicyCookedMap
 from validator.validator import Validator
 
 
 def validate(
-    zone_infos: ZoneInfoMap,
-    zone_policies: ZonePolicyMap,
+    scope: str,
+    zone_infos: ZoneInfoCookedMap,
+    zone_policies: ZonePolicyCookedMap,
     zone: str,
     year: int,
     start_year: int,
     until_year: int,
     validate_buffer_size: bool,
     validate_test_data: bool,
+    validate_equivalence_classes: bool,
     viewing_months: int,
     validate_dst_offset: bool,
     debug_validator: bool,
     debug_specifier: bool,
     in_place_transitions: bool,
     optimize_candidates: bool,
+    prune_candidates: bool,
 ) -> None:
 
     # Set the default to set both --validate_buffer_size and
-    # --validate_test_data if neither flags are given explicitly.
-    if not validate_buffer_size and not validate_test_data:
+    # --validate_test_data if no validation flags are given explicitly.
+    if (
+        not validate_buffer_size
+        and not validate_test_data
+        and not validate_equivalence_classes
+    ):
         validate_buffer_size = True
         validate_test_data = True
 
     validator = Validator(
+        scope=scope,
         zone_infos=zone_infos,
         zone_policies=zone_policies,
         viewing_months=viewing_months,
@@ -96,12 +116,19 @@ def validate(
         start_year=start_year,
         until_year=until_year,
         in_place_transitions=in_place_transitions,
-        optimize_candidates=optimize_candidates)
+        optimize_candidates=optimize_candidates,
+        prune_candidates=prune_candidates)
 
     if validate_buffer_size:
         logging.info('======== Validating transition buffer sizes')
         validator.validate_buffer_size()
 
+    # Classify the zones before validating the test data, so that the offsets
+    # are computed only once for each equivalence class.
+    if validate_equivalence_classes:
+        logging.info('======== Validating zone equivalence classes')
+        validator.validate_equivalence_classes()
+
     if validate_test_data:
         logging.info('======== Validating test data')
         validator.validate_test_data()
@@ -115,7 +142,14 @@ def main() -> None:
 
     # Extractor flags.
     parser.add_argument(
-        '--input_dir', help='Location of the input directory', required=True)
+        '--input_dir',
+        help='Location of the input directory, tzdata tarball, or tzdata.zi',
+        required=True)
+    parser.add_argument(
+        '--jobs',
+        help='Number of worker processes (default: 1)',
+        type=int,
+        default=1)
 
     # Transformer flags.
     parser.add_argument(
@@ -161,6 +195,19 @@ def main() -> None:
         help='Remove zones and rules not aligned at granularity time boundary',
         action='store_true',
         default=False)
+    parser.add_argument(
+        '--transform_profile',
+        help='Write the JSON profile of each pass of the Transformer to file')
+    parser.add_argument(
+        '--fused_transform',
+        help='Run the zone passes of the Transformer in a single traversal',
+        action='store_true',
+        default=False)
+    parser.add_argument(
+        '--in_place_transform',
+        help='Update the extracted maps in place instead of copying them',
+        action='store_true',
+        default=False)
 
     # Validator flags.
     parser.add_argument(
@@ -180,6 +227,11 @@ def main() -> None:
         '--validate_test_data',
         help='Validate the TestDataGenerator with pytz',
         action="store_true")
+    parser.add_argument(
+        '--validate_equivalence_classes',
+        help='List the zones with identical transitions, and share the '
+        + 'test data validation within each class',
+        action="store_true")
     parser.add_argument(
         '--validate_dst_offset',
         # Not enabled by default because pytz DST seems to be buggy.
@@ -208,6 +260,10 @@ def main() -> None:
         '--optimize_candidates',
         help='Optimize the candidate transitions',
         action='store_true')
+    parser.add_argument(
+        '--prune_candidates',
+        help='Prune the candidate transitions using the ZoneMatch months',
+        action='store_true')
 
     # TestDataGenerator flag.
     #
@@ -259,10 +315,13 @@ def main() -> None:
 
     # Extract the TZ files
     logging.info('======== Extracting TZ Data files')
-    extractor = Extractor(args.input_dir)
+    extractor = Extractor(
+        args.input_dir, args.jobs, raw_lines=False,
+        start_year=args.start_year, until_year=args.until_year)
     extractor.parse()
     extractor.print_summary()
     rules_map, zones_map, links_map = extractor.get_data()
+    del extractor
 
     # Transform the TZ zones and rules
     logging.info('======== Transforming Zones and Rules')
@@ -277,20 +336,27 @@ def main() -> None:
         until_at_granularity,
         offset_granularity,
         args.strict,
+        profile=bool(args.transform_profile),
+        fused=args.fused_transform,
+        jobs=args.jobs,
+        in_place=args.in_place_transform,
     )
     transformer.transform()
     transformer.print_summary()
+    if args.transform_profile:
+        transformer.write_profile(args.transform_profile)
     (
         zones_map, rules_map, links_map, removed_zones, removed_policies,
         removed_links, notable_zones, notable_policies, notable_links,
         format_strings, zone_strings,
     ) = transformer.get_data()
+    del transformer
 
     # Generate internal versions of zone_infos and zone_policies
     # so that ZoneSpecifier can be created.
     logging.info('======== Generating inlined zone_infos and zone_policies')
     inline_generator = InlineGenerator(zones_map, rules_map)
-    (zone_infos, zone_policies) = inline_generator.generate_maps()
+    (zone_infos, zone_policies) = inline_generator.generate_cooked_maps()
     logging.info('zone_infos=%d; zone_policies=%d', len(zone_infos),
                  len(zone_policies))
 
@@ -308,6 +374,7 @@ def main() -> None:
     )
 
     validate(
+        scope=args.scope,
         zone_infos=zone_infos,
         zone_policies=zone_policies,
         zone=args.zone,
@@ -316,12 +383,14 @@ def main() -> None:
         until_year=validation_until_year,
         validate_buffer_size=args.validate_buffer_size,
         validate_test_data=args.validate_test_data,
+        validate_equivalence_classes=args.validate_equivalence_classes,
         viewing_months=args.viewing_months,
         validate_dst_offset=args.validate_dst_offset,
         debug_validator=args.debug_validator,
         debug_specifier=args.debug_specifier,
         in_place_transitions=args.in_place_transitions,
         optimize_candidates=args.optimize_candidates,
+        prune_candidates=args.prune_candidates,
     )
 
     logging.info('======== Finished processing TZ Data files.')
@@ -14,12 +14,18 @@ continuous integration pipeline, it's too easy to bitrot.
 
 import logging
 from datetime import datetime
-from zonedb.ingenerator import ZoneInfoMap
-from zonedb.ingenerator import ZonePolicyMap
+from zonedb.basic_zone_specifier import BasicZoneSpecifier
+from zonedb.ingenerator import ZoneInfoCooked
+from zonedb.ingenerator import ZoneInfoCookedMap
+from zonedb.ingenerator import ZonePolicyCookedMap
+from zonedb.eqclassifier import EquivalenceClassifier
+from zonedb.zone_specifier import OffsetInfo
 from zonedb.zone_specifier import ZoneSpecifier
 from zonedb.zone_specifier import to_utc_string
 from zonedb.zone_specifier import SECONDS_SINCE_UNIX_EPOCH
+from typing import Dict
 from typing import List
+from typing import Union
 from .zstdgenerator import TestDataGenerator
 from .zstdgenerator import TestData
 from .zstdgenerator import TestItem
@@ -28,14 +34,19 @@ from .zstdgenerator import TestItem
 class Validator:
     """Validate the zone_infos and zone_policies data from the TZ Database,
     as extracted and transformed by Extractor and Transformer. Provides
-    2 validation methods:
+    3 validation methods:
 
         * validate_buffer_size(): to determine the sizes of various internal
-          buffers using the ZoneSpecifier. The resulting buffer size gives
+          buffers using the ZoneSpecifier (or the BasicZoneSpecifier for the
+          'basic' scope). The resulting buffer size gives
           insights into the corresponding buffer sizes of the C++ classes.
         * validate_test_data(): to compare the DST transitions between
           those determined by pztz (through TestDataGenerator) and those
           determined by ZoneSpecifier
+        * validate_equivalence_classes(): to list the zones whose transitions
+          are identical over [start_year, until_year). If called before
+          validate_test_data(), the offsets computed for the representative
+          of each class are shared with the other members of the class
 
     Usage:
         # For validation against pytz golden test data
@@ -46,8 +57,9 @@ class Validator:
 
     def __init__(
         self,
-        zone_infos: ZoneInfoMap,
-        zone_policies: ZonePolicyMap,
+        scope: str,
+        zone_infos: ZoneInfoCookedMap,
+        zone_policies: ZonePolicyCookedMap,
         viewing_months: int,
         validate_dst_offset: bool,
         debug_validator: bool,
@@ -58,11 +70,14 @@ class Validator:
         until_year: int,
         in_place_transitions: bool,
         optimize_candidates: bool,
+        prune_candidates: bool,
     ):
         """
         Args:
-            zone_infos: {name -> zone_info{} }
-            zone_policies: {name ->zone_policy{} }
+            scope: 'basic' or 'extended', selects BasicZoneSpecifier or
+                ZoneSpecifier
+            zone_infos: {name -> ZoneInfoCooked}
+            zone_policies: {name -> ZonePolicyCooked}
             viewing_months: number of months in the calculation window
                 (13, 14, 36)
             validate_dst_offset: validate DST offset against Python in
@@ -75,7 +90,9 @@ class Validator:
             until_year: until year of validation
             in_place_transitions: see ZoneSpecifier.in_place_transitions
             optimize_candidates: see ZoneSpecifier.optimize_candidates
+            prune_candidates: see ZoneSpecifier.prune_candidates
         """
+        self.scope = scope
         self.zone_infos = zone_infos
         self.zone_policies = zone_policies
         self.viewing_months = viewing_months
@@ -88,6 +105,13 @@ class Validator:
         self.until_year = until_year
         self.in_place_transitions = in_place_transitions
         self.optimize_candidates = optimize_candidates
+        self.prune_candidates = prune_candidates
+
+        # Set by validate_equivalence_classes(): the map of {zone_name ->
+        # canonical zone_name}, and the [start, until) epoch seconds over which
+        # the members of each class are equivalent.
+        self.representatives: Dict[str, str] = {}
+        self.equivalence_window = (0, 0)
 
     # The following are public methods.
 
@@ -114,12 +138,7 @@ class Validator:
             if self.debug_validator:
                 logging.info('Validating zone %s' % zone_name)
 
-            zone_specifier = ZoneSpecifier(
-                zone_info_data=zone_info,
-                viewing_months=self.viewing_months,
-                debug=self.debug_specifier,
-                in_place_transitions=self.in_place_transitions,
-                optimize_candidates=self.optimize_candidates)
+            zone_specifier = self._create_zone_specifier(zone_info)
 
             transition_stats[zone_name] = zone_specifier.get_buffer_sizes(
                 self.start_year, self.until_year)
@@ -131,12 +150,32 @@ class Validator:
                 '%s: %d (%04d); %d (%04d)'
                 % ((zone_name, ) + count_record[0] + count_record[1]))
 
+    def validate_equivalence_classes(self) -> None:
+        """Partition the zones into the classes of zones which have exactly
+        the same transitions within [start_year, until_year). The classes are
+        saved so that validate_test_data() evaluates each class only once.
+        """
+        zone_infos = self.zone_infos
+        if self.zone_name:
+            zone_infos = {self.zone_name: zone_infos[self.zone_name]}
+        classifier = EquivalenceClassifier(
+            zone_infos, self.start_year, self.until_year)
+        (classes, representatives) = classifier.classify()
+        self.representatives = representatives
+        self.equivalence_window = (
+            classifier.start_epoch_seconds, classifier.until_epoch_seconds)
+
+        logging.info('Equivalence classes with more than one zone:')
+        for members in classes:
+            if len(members) > 1:
+                logging.info('%s: %s', members[0], ', '.join(members[1:]))
+
     def validate_test_data(self) -> None:
         """Compare Python and AceTime offsets by generating TestDataGenerator.
         """
         logging.info('Creating test data')
         data_generator = TestDataGenerator(
-            'basic',
+            self.scope,
             self.zone_infos,
             self.zone_policies,
             self.start_year,
@@ -151,32 +190,54 @@ class Validator:
         else:
             logging.info('No errors found!')
 
+    def _create_zone_specifier(
+        self,
+        zone_info: ZoneInfoCooked,
+    ) -> Union[ZoneSpecifier, BasicZoneSpecifier]:
+        """Create the zone specifier of the scope: BasicZoneSpecifier for
+        'basic', ZoneSpecifier otherwise.
+        """
+        if self.scope == 'basic':
+            return BasicZoneSpecifier(
+                zone_info_data=zone_info,
+                debug=self.debug_specifier)
+        return ZoneSpecifier(
+            zone_info_data=zone_info,
+            viewing_months=self.viewing_months,
+            debug=self.debug_specifier,
+            in_place_transitions=self.in_place_transitions,
+            optimize_candidates=self.optimize_candidates,
+            prune_candidates=self.prune_candidates)
+
     def _validate_test_data(self, test_data: TestData) -> int:
         num_errors = 0
+        # Map of {representative -> {epoch -> OffsetInfo}} shared by the
+        # members of each equivalence class.
+        class_infos: Dict[str, Dict[int, OffsetInfo]] = {}
         for zone_name, items in test_data.items():
             if self.zone_name and zone_name != self.zone_name:
                 continue
             if self.debug_validator:
                 logging.info('  Validating zone %s' % zone_name)
-            num_errors += self._validate_test_data_for_zone(zone_name, items)
+            representative = self.representatives.get(zone_name, zone_name)
+            num_errors += self._validate_test_data_for_zone(
+                zone_name, items, class_infos.setdefault(representative, {}))
         return num_errors
 
     def _validate_test_data_for_zone(
         self,
         zone_name: str,
         items: List[TestItem],
+        shared_infos: Dict[int, OffsetInfo],
     ) -> int:
         """Compare the given test 'items' generatd by TestDataGenerator (using
         pytz) with the expected datetime components from ZoneSpecifier. Returns
-        the number of errors.
+        the number of errors. The 'shared_infos' caches the OffsetInfo of each
+        epoch inside the equivalence window for the class of the zone.
         """
         zone_info = self.zone_infos[zone_name]
-        zone_specifier = ZoneSpecifier(
-            zone_info_data=zone_info,
-            viewing_months=self.viewing_months,
-            debug=self.debug_specifier,
-            in_place_transitions=self.in_place_transitions,
-            optimize_candidates=self.optimize_candidates)
+        zone_specifier = self._create_zone_specifier(zone_info)
+        (window_start, window_until) = self.equivalence_window
 
         num_errors = 0
         for item in items:
@@ -194,12 +255,22 @@ class Validator:
             if self.debug_specifier:
                 logging.info(header)
 
+            is_shared = window_start <= item.epoch < window_until
+            info = shared_infos.get(item.epoch) if is_shared else None
+            is_cached = info is not None
             try:
-                info = zone_specifier.get_timezone_info_for_seconds(item.epoch)
+                if info is None:
+                    info = zone_specifier.get_timezone_info_for_seconds(
+                        item.epoch)
+                    if is_shared:
+                        shared_infos[item.epoch] = info
             except Exception:
                 logging.exception('Exception with test data %s', item)
                 raise
             is_matched = info.total_offset == item.total_offset
+            if is_cached and (self.debug_specifier or not is_matched):
+                # Load the Transitions of this zone for the diagnostics below.
+                zone_specifier.get_timezone_info_for_seconds(item.epoch)
             status = '**Matched**' if is_matched else '**Mismatched**'
             body = ('%s: AceTime(%s); Expected(%s)' %
                     (status, to_utc_string(info.utc_offset, info.dst_offset),
@@ -17,17 +17,19 @@ ZoneInfo validation exposed by 'validate.py' script.
 import logging
 import datetime
 import pytz
+from zonedb.basic_zone_specifier import BasicZoneSpecifier
 from zonedb.zone_specifier import ZoneSpecifier
 from zonedb.zone_specifier import SECONDS_SINCE_UNIX_EPOCH
 from zonedb.zone_specifier import DateTuple
-from zonedb.ingenerator import ZoneInfo
-from zonedb.ingenerator import ZoneInfoMap
-from zonedb.ingenerator import ZonePolicyMap
+from zonedb.ingenerator import ZoneInfoCooked
+from zonedb.ingenerator import ZoneInfoCookedMap
+from zonedb.ingenerator import ZonePolicyCookedMap
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
+from typing import Union
 from typing import NamedTuple
 
 # An entry in the test data set.
@@ -62,16 +64,16 @@ class TestDataGenerator:
     def __init__(
         self,
         scope: str,
-        zone_infos: ZoneInfoMap,
-        zone_policies: ZonePolicyMap,
+        zone_infos: ZoneInfoCookedMap,
+        zone_policies: ZonePolicyCookedMap,
         start_year: int,
         until_year: int,
     ):
         """
         Args:
             scope: 'basic' or 'extended'
-            zone_infos (dict): {zone_name -> zone_info{} }
-            zone_policies (dict): {zone_name ->zone_policy{} }
+            zone_infos (dict): {zone_name -> ZoneInfoCooked}
+            zone_policies (dict): {zone_name -> ZonePolicyCooked}
         """
         self.scope = scope
         self.zone_infos = zone_infos
@@ -103,11 +105,15 @@ class TestDataGenerator:
     def _create_test_data_for_zone(
         self,
         zone_name: str,
-        zone_info: ZoneInfo,
+        zone_info: ZoneInfoCooked,
     ) -> Optional[List[TestItem]]:
         """Create the TestItems for a specific zone.
         """
-        zone_specifier = ZoneSpecifier(zone_info)
+        zone_specifier: Union[ZoneSpecifier, BasicZoneSpecifier]
+        if self.scope == 'basic':
+            zone_specifier = BasicZoneSpecifier(zone_info)
+        else:
+            zone_specifier = ZoneSpecifier(zone_info)
         try:
             tz = pytz.timezone(zone_name)
         except pytz.UnknownTimeZoneError:
@@ -141,7 +147,7 @@ class TestDataGenerator:
         self,
         zone_name: str,
         tz: Any,  # TODO: Figure out correct typing info for pytz.timezone
-        zone_specifier: ZoneSpecifier
+        zone_specifier: Union[ZoneSpecifier, BasicZoneSpecifier],
     ) -> List[TestItem]:
         """Create a TestItem for the tz for each zone, for each year from
         start_year to until_year, exclusive. The following test samples are
@@ -80,6 +80,10 @@ def main() -> None:
         '--optimize_candidates',
         help='Optimize the candidate transitions',
         action='store_true')
+    parser.add_argument(
+        '--prune_candidates',
+        help='Prune the candidate transitions using the ZoneMatch months',
+        action='store_true')
     parser.add_argument('--zone', help='Name of time zone', required=True)
     parser.add_argument('--year', help='Year of interest', type=int)
     parser.add_argument('--date', help='DateTime of interest')
@@ -100,7 +104,8 @@ def main() -> None:
         viewing_months=args.viewing_months,
         debug=args.debug,
         in_place_transitions=args.in_place_transitions,
-        optimize_candidates=args.optimize_candidates)
+        optimize_candidates=args.optimize_candidates,
+        prune_candidates=args.prune_candidates)
 
     if args.year:
         zone_specifier.init_for_year(args.year)
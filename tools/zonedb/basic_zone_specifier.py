@@ -0,0 +1,503 @@
+# Copyright 2020 Brian T. Park
+#
+# MIT License
+"""
+A Python version of the C++ BasicZoneProcessor class. It supports only the
+zones of the 'basic' scope, whose ZoneEras end on whole years and whose
+ZonePolicies contain at most one ZoneRule per month, which makes it much
+simpler and cheaper than the ExtendedZoneSpecifier algorithm of
+zone_specifier.py: there are no 's' and 'u' suffixes to juggle across
+ZoneMatch boundaries, and the Transitions of a year fit in a small array sorted
+by month.
+"""
+
+import logging
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+from typing import Union
+from tzdb.transformer import calc_day_of_month
+from .ingenerator import ZoneEraCooked
+from .ingenerator import ZoneInfo
+from .ingenerator import ZoneInfoCooked
+from .ingenerator import ZonePolicyCooked
+from .ingenerator import ZoneRuleCooked
+from .zone_specifier import ACETIME_EPOCH
+from .zone_specifier import SECONDS_SINCE_UNIX_EPOCH
+from .zone_specifier import DateTuple
+from .zone_specifier import OffsetInfo
+
+# The startEpochSecond of the first Transition, representing -Infinity. Same
+# as BasicZoneProcessor::kMinEpochSeconds.
+MIN_EPOCH_SECONDS = -2**31 + 1
+
+# Maximum number of Transitions needed by the supported zones. Same as
+# BasicZoneProcessor::kMaxCacheEntries.
+MAX_CACHE_ENTRIES = 5
+
+
+class BasicTransition:
+    """The start of a specific UTC offset, as described by the matching ZoneEra
+    and its ZoneRule for a given year. If the ZoneEra has no ZoneRule, the
+    Transition is defined by the start of the ZoneEra. Corresponds to the
+    basic::Transition struct of BasicZoneProcessor.
+    """
+    __slots__ = [
+        'zoneEra',  # (ZoneEraCooked) the ZoneEra that matched the year
+        'zoneRule',  # (ZoneRuleCooked) None if RULES is '-' or 'hh:mm'
+        'year',  # (int) year of the Transition
+        'month',  # (int) inMonth of the ZoneRule, or 1 if no ZoneRule
+        'deltaSeconds',  # (int) DST offset
+        'startEpochSecond',  # (int) start of the Transition
+        'startDateTime',  # (DateTuple) start in the wall time of Transition
+        'abbrev',  # (str) abbreviation
+    ]
+
+    # Hack because '__slots__' is unsupported by mypy. See
+    # https://github.com/python/mypy/issues/5941.
+    if TYPE_CHECKING:
+        zoneEra: ZoneEraCooked
+        zoneRule: Optional[ZoneRuleCooked]
+        year: int
+        month: int
+        deltaSeconds: int
+        startEpochSecond: int
+        startDateTime: DateTuple
+        abbrev: str
+
+    def __init__(
+        self,
+        year: int,
+        month: int,
+        zone_era: ZoneEraCooked,
+        zone_rule: Optional[ZoneRuleCooked],
+    ):
+        """Create a Transition for the (zone_era, zone_rule) in the given year.
+        If 'month' is 0, it is taken from the zone_rule (or 1 if there is no
+        zone_rule), otherwise the Transition is shifted to that month. Mirrors
+        BasicZoneProcessor::createTransition().
+        """
+        if zone_rule:
+            self.month = zone_rule.inMonth
+            self.deltaSeconds = zone_rule.deltaSeconds
+        else:
+            self.month = 1
+            self.deltaSeconds = zone_era.rulesDeltaSeconds
+        if month != 0:
+            self.month = month
+        self.zoneEra = zone_era
+        self.zoneRule = zone_rule
+        self.year = year
+        self.startEpochSecond = 0
+        self.abbrev = ''
+
+    @property
+    def offsetSeconds(self) -> int:
+        return self.zoneEra.offsetSeconds
+
+    @property
+    def totalOffsetSeconds(self) -> int:
+        return self.zoneEra.offsetSeconds + self.deltaSeconds
+
+    def to_timezone_tuple(self) -> OffsetInfo:
+        """Convert a BasicTransition into a OffsetInfo.
+        """
+        return OffsetInfo(self.totalOffsetSeconds, self.offsetSeconds,
+                          self.deltaSeconds, self.abbrev)
+
+    def __repr__(self) -> str:
+        rule = self.zoneRule
+        rule_string = (
+            'ZR[%d,%d]' % (rule.fromYear, rule.toYear) if rule else 'ZR(null)'
+        )
+        return (
+            'BasicTransition(%04d/%02d; stEps: %d; off: %d; delta: %d; '
+            'abbrev: %s; %s)' % (
+                self.year, self.month, self.startEpochSecond,
+                self.offsetSeconds, self.deltaSeconds, self.abbrev,
+                rule_string,
+            )
+        )
+
+
+class BasicZoneSpecifier:
+    """Extract the DST transition information of a ZoneInfo of the 'basic'
+    scope, using the algorithm of the C++ BasicZoneProcessor. It provides the
+    same query methods as ZoneSpecifier:
+
+        * get_timezone_info_for_seconds(): get info using epoch_seconds (from
+          2000-01-01 00:00:00 UTC)
+        * get_timezone_info_for_datetime(): get info using a 'datetime.datetime'
+          instance
+
+    The init_for_year() method calculates at most MAX_CACHE_ENTRIES
+    Transitions for the given year, and caches them:
+
+        1. The latest ZoneRule in effect just before the year.
+        2. The latest prior ZoneRule of a new ZoneEra starting in the year.
+        3. The ZoneRules which occur in the year.
+        4. The latest prior ZoneRule of a new ZoneEra starting in the next
+           year.
+
+    Usage:
+        zone_specifier = BasicZoneSpecifier(zone_info [, debug])
+
+        # Validate transitions
+        zone_specifier.init_for_year(args.year)
+        zone_specifier.print_matches_and_transitions()
+
+        # Get (offset_seconds, dst_seconds, abbrev) for an epoch_seconds.
+        (offset_seconds, dst_seconds, abbrev) = \\
+            zone_specifier.get_timezone_info_for_seconds(epoch_seconds)
+    """
+
+    def __init__(
+        self,
+        zone_info_data: Union[ZoneInfo, ZoneInfoCooked],
+        debug: bool = False,
+    ):
+        """Constructor.
+
+        Args:
+            zone_info_data: one of the ZONE_INFO_xxx constants from
+                zone_infos.py, or a ZoneInfoCooked (e.g. from
+                InlineGenerator.generate_cooked_maps())
+            debug (bool): set to True to enable logging
+        """
+        if isinstance(zone_info_data, ZoneInfoCooked):
+            self.zone_info = zone_info_data
+        else:
+            self.zone_info = ZoneInfoCooked(zone_info_data)
+        self.debug = debug
+
+        # Used by init_for_year() to indicate the current year of interest.
+        self.year = 0
+
+        # List of Transitions of self.year, sorted by (year, month).
+        self.transitions: List[BasicTransition] = []
+
+    def get_transition_for_seconds(
+        self,
+        epoch_seconds: int,
+    ) -> Optional[BasicTransition]:
+        """Return BasicTransition for the given epoch_seconds.
+        """
+        self.init_for_year(self._get_year_for_second(epoch_seconds))
+        return self._find_transition_for_seconds(epoch_seconds)
+
+    def get_timezone_info_for_seconds(self, epoch_seconds: int) -> OffsetInfo:
+        """Return a tuple of (total_offset, utc_offset, dst_offset, abbrev).
+        """
+        transition = self.get_transition_for_seconds(epoch_seconds)
+        if not transition:
+            raise Exception(
+                f"Transition not found for {epoch_seconds} "
+                f"in zone '{self.zone_info.name}'")
+        return transition.to_timezone_tuple()
+
+    def get_timezone_info_for_datetime(
+        self,
+        dt: datetime,
+    ) -> OffsetInfo:
+        """Return the OffsetInfo of the local datetime 'dt'. BasicTransition
+        does not retain the local date and time of its start, so this uses the
+        iterative approximation of
+        BasicZoneProcessor::getOffsetDateTime(): treat 'dt' as UTC, then
+        refine the UTC offset twice. If the 2 refinements disagree, 'dt' is in
+        a gap or an overlap, and the OffsetInfo of the later epoch_seconds is
+        returned.
+        """
+        local_seconds = int(
+            (dt.replace(tzinfo=timezone.utc) - ACETIME_EPOCH).total_seconds())
+
+        offset0 = self.get_timezone_info_for_seconds(local_seconds)
+        epoch_seconds1 = local_seconds - offset0.total_offset
+        offset1 = self.get_timezone_info_for_seconds(epoch_seconds1)
+        epoch_seconds2 = local_seconds - offset1.total_offset
+        offset2 = self.get_timezone_info_for_seconds(epoch_seconds2)
+
+        if offset1.total_offset == offset2.total_offset:
+            return offset2
+        elif epoch_seconds1 > epoch_seconds2:
+            return offset1
+        else:
+            return offset2
+
+    def init_for_year(self, year: int) -> None:
+        """Calculate the Transitions of the given year. Mirrors
+        BasicZoneProcessor::init(), except that the year of the query has
+        already been determined by the caller.
+        """
+        if self.debug:
+            logging.info('init_for_year(): year: %d', year)
+        if self.year == year:
+            return
+
+        self.year = year
+        self.transitions = []
+
+        prior_era = self._add_transition_prior_to_year(year)
+        current_era = self._add_transitions_for_year(year, prior_era)
+        self._add_transition_after_year(year, current_era)
+        self._calc_transitions()
+        self._calc_abbrevs()
+
+        if self.debug:
+            self.print_matches_and_transitions()
+
+    def get_buffer_sizes(
+        self,
+        start_year: int,
+        until_year: int,
+    ) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """Find the maximum number of Transitions across the given start_year
+        and until_year. BasicZoneProcessor keeps no candidate Transitions, so
+        the buffer size is the number of Transitions.
+
+        Returns a tuple of tuples:
+            ((max_actives, year), (max_buffer_size, year)).
+        """
+        max_actives = (0, 0)  # (count, year)
+        for year in range(start_year, until_year):
+            self.init_for_year(year)
+            transition_count = len(self.transitions)
+            if transition_count > max_actives[0]:
+                max_actives = (transition_count, year)
+        return (max_actives, max_actives)
+
+    def print_matches_and_transitions(self) -> None:
+        logging.info('---- Transitions:')
+        for t in self.transitions:
+            logging.info(t)
+
+    # The following methods are designed to be used internally.
+
+    @staticmethod
+    def _get_year_for_second(epoch_seconds: int) -> int:
+        """Return the year of the given epoch_seconds. A UTC date of Jan 1
+        belongs to the previous year, to support zones which change on Dec 31
+        (e.g. Asia/Dhaka). The transformer.py removes the zones with
+        ZoneRules on Jan 1, so this is always correct.
+        """
+        ldt = datetime.utcfromtimestamp(
+            epoch_seconds + SECONDS_SINCE_UNIX_EPOCH)
+        if ldt.month == 1 and ldt.day == 1:
+            return ldt.year - 1
+        return ldt.year
+
+    def _find_transition_for_seconds(
+        self,
+        epoch_seconds: int,
+    ) -> Optional[BasicTransition]:
+        """Return the last Transition which starts at or before epoch_seconds,
+        or the first Transition. Mirrors BasicZoneProcessor::findMatch().
+        """
+        closest_match: Optional[BasicTransition] = None
+        for transition in self.transitions:
+            if (closest_match is None
+                    or transition.startEpochSecond <= epoch_seconds):
+                closest_match = transition
+        return closest_match
+
+    def _add_transition_prior_to_year(self, year: int) -> ZoneEraCooked:
+        """Add the latest ZoneRule in effect just before the given year, and
+        return the ZoneEra of the previous year.
+        """
+        era = _find_zone_era(self.zone_info, year - 1)
+        latest = _find_latest_prior_rule(era.zonePolicy, year)
+        self._add_transition(BasicTransition(year - 1, 0, era, latest))
+        return era
+
+    def _add_transitions_for_year(
+        self,
+        year: int,
+        prior_era: ZoneEraCooked,
+    ) -> ZoneEraCooked:
+        """Add the Transitions which occur in the given year, and return the
+        ZoneEra of the year.
+        """
+        era = _find_zone_era(self.zone_info, year)
+
+        # If the ZoneEra has no ZonePolicy, the Transition takes effect at the
+        # start of the year.
+        zone_policy = era.zonePolicy
+        if not isinstance(zone_policy, ZonePolicyCooked):
+            self._add_transition(BasicTransition(year, 0, era, None))
+            return era
+
+        # If the ZoneEra changed, the latest prior ZoneRule of the new ZoneEra
+        # is shifted to Jan of the year.
+        if era is not prior_era:
+            latest_prior = _find_latest_prior_rule(zone_policy, year)
+            self._add_transition(BasicTransition(year, 1, era, latest_prior))
+
+        for rule in zone_policy.rules:
+            if rule.fromYear <= year and year <= rule.toYear:
+                self._add_transition(BasicTransition(year, 0, era, rule))
+
+        return era
+
+    def _add_transition_after_year(
+        self,
+        year: int,
+        current_era: ZoneEraCooked,
+    ) -> None:
+        """Add the latest prior ZoneRule shifted to Jan 1 of the following
+        year, if the ZoneEra changes at the end of the given year.
+        """
+        era_after = _find_zone_era(self.zone_info, year + 1)
+        if era_after is current_era:
+            return
+
+        latest = _find_latest_prior_rule(era_after.zonePolicy, year + 1)
+        self._add_transition(BasicTransition(year + 1, 1, era_after, latest))
+
+    def _add_transition(self, transition: BasicTransition) -> None:
+        """Insert the Transition, sorted by (year, month). Like the C++
+        version, Transitions beyond MAX_CACHE_ENTRIES are dropped, but a
+        warning is logged.
+        """
+        transitions = self.transitions
+        if len(transitions) >= MAX_CACHE_ENTRIES:
+            logging.warning(
+                "Zone '%s': more than %d Transitions in year %d",
+                self.zone_info.name, MAX_CACHE_ENTRIES, self.year)
+            return
+
+        transitions.append(transition)
+        for i in range(len(transitions) - 1, 0, -1):
+            left = transitions[i - 1]
+            right = transitions[i]
+            if (left.year, left.month) > (right.year, right.month):
+                transitions[i - 1] = right
+                transitions[i] = left
+
+    def _calc_transitions(self) -> None:
+        """Calculate the startEpochSecond and startDateTime of each
+        Transition. The start time is a wall time, so it is defined in terms of
+        the offset of the *previous* Transition.
+        """
+        transitions = self.transitions
+        prev = transitions[0]
+        prev.startEpochSecond = MIN_EPOCH_SECONDS
+        prev.startDateTime = DateTuple(
+            y=prev.year, M=prev.month, d=1, ss=0, f='w')
+
+        for transition in transitions[1:]:
+            rule = transition.zoneRule
+            if rule is None:
+                # A ZoneEra without ZoneRule starts at 00:00 on Jan 1 in the
+                # offset of the previous Transition.
+                (month, day) = (1, 1)
+                at_seconds = 0
+                offset_seconds = prev.totalOffsetSeconds
+            else:
+                (month, day) = calc_day_of_month(
+                    transition.year, transition.month, rule.onDayOfWeek,
+                    rule.onDayOfMonth)
+                at_seconds = rule.atSeconds
+                offset_seconds = _calc_rule_offset_seconds(
+                    prev.totalOffsetSeconds, transition.offsetSeconds,
+                    rule.atTimeSuffix)
+
+            # Handle a shift into the previous or next year.
+            year = transition.year
+            if month == 0:
+                (year, month) = (year - 1, 12)
+            elif month == 13:
+                (year, month) = (year + 1, 1)
+            start = datetime(year, month, day, tzinfo=timezone.utc)
+            epoch_seconds = (
+                int((start - ACETIME_EPOCH).total_seconds())
+                + at_seconds - offset_seconds
+            )
+            transition.startEpochSecond = epoch_seconds
+
+            wall = (
+                ACETIME_EPOCH
+                + timedelta(seconds=epoch_seconds
+                            + transition.totalOffsetSeconds)
+            )
+            transition.startDateTime = DateTuple(
+                y=wall.year, M=wall.month, d=wall.day,
+                ss=wall.hour * 3600 + wall.minute * 60 + wall.second, f='w')
+            prev = transition
+
+    def _calc_abbrevs(self) -> None:
+        """Calculate the abbreviation of each Transition. Mirrors
+        BasicZoneProcessor::createAbbreviation().
+        """
+        for transition in self.transitions:
+            format = transition.zoneEra.format
+            rule = transition.zoneRule
+            if format.find('%s') >= 0:
+                if rule is None:
+                    abbrev = format
+                else:
+                    letter = rule.letter
+                    if letter == '-':
+                        letter = ''
+                    abbrev = format % letter
+            else:
+                index = format.find('/')
+                if index >= 0:
+                    if transition.deltaSeconds == 0:
+                        abbrev = format[:index]
+                    else:
+                        abbrev = format[index + 1:]
+                else:
+                    abbrev = format
+            transition.abbrev = abbrev
+
+
+def _find_zone_era(zone_info: ZoneInfoCooked, year: int) -> ZoneEraCooked:
+    """Return the ZoneEra which applies to the given year, i.e. the first one
+    which satisfies (year < untilYear), or the last ZoneEra.
+    """
+    for era in zone_info.eras:
+        if year < era.untilYear:
+            return era
+    return zone_info.eras[-1]
+
+
+def _find_latest_prior_rule(
+    zone_policy: Union[ZonePolicyCooked, str],
+    year: int,
+) -> Optional[ZoneRuleCooked]:
+    """Return the latest ZoneRule in effect before the given year, assuming at
+    most one ZoneRule per month. Return None if the ZoneEra has no ZonePolicy.
+    """
+    if not isinstance(zone_policy, ZonePolicyCooked):
+        return None
+
+    latest: Optional[ZoneRuleCooked] = None
+    latest_key = (0, 0)
+    for rule in zone_policy.rules:
+        if rule.fromYear < year:
+            prior_year = rule.toYear if rule.toYear < year else year - 1
+            key = (prior_year, rule.inMonth)
+            if latest is None or key > latest_key:
+                latest = rule
+                latest_key = key
+    return latest
+
+
+def _calc_rule_offset_seconds(
+    prev_total_offset_seconds: int,
+    current_offset_seconds: int,
+    at_time_suffix: str,
+) -> int:
+    """Return the UTC offset of the AT time of a ZoneRule: the total offset of
+    the previous Transition for 'w', the standard offset of the current
+    ZoneEra for 's', and 0 for 'u'.
+    """
+    if at_time_suffix == 'w':
+        return prev_total_offset_seconds
+    elif at_time_suffix == 's':
+        return current_offset_seconds
+    else:
+        return 0
@@ -2,32 +2,38 @@
 #
 # MIT License
 
+from .basic_zone_specifier import BasicZoneSpecifier
 from .zone_specifier import ZoneSpecifier
-from .ingenerator import ZoneInfoMap
-from .ingenerator import ZonePolicyMap
+from .ingenerator import ZoneInfoCooked
+from .ingenerator import ZoneInfoCookedMap
+from .ingenerator import ZonePolicyCookedMap
 from typing import Dict
 from typing import Tuple
 
 
 class BufSizeEstimator:
     """Estimate the ExtendedZoneSpecifier::TransitionStorage buffer size for
-    each zone.
+    each zone. For the 'basic' scope, estimate the number of Transitions
+    cached by BasicZoneProcessor instead.
     """
 
     def __init__(
         self,
-        zone_infos: ZoneInfoMap,
-        zone_policies: ZonePolicyMap,
+        scope: str,
+        zone_infos: ZoneInfoCookedMap,
+        zone_policies: ZonePolicyCookedMap,
         start_year: int,
         until_year: int,
     ):
         """
         Args:
-            zone_infos: dict of ZoneInfos
-            zone_policies dict of ZonePolicies
+            scope: 'basic' or 'extended'
+            zone_infos: dict of ZoneInfoCooked
+            zone_policies dict of ZonePolicyCooked
             start_year: start year
             until_year: until year
         """
+        self.scope = scope
         self.zone_infos = zone_infos
         self.zone_policies = zone_policies
         self.start_year = start_year
@@ -35,30 +41,51 @@ class BufSizeEstimator:
 
     def estimate(self) -> Tuple[Dict[str, int], int]:
         """Calculate the (dict) of {full_name -> buf_size} where buf_size is one
-        more than the estimate from ZoneSpecifier.get_buffer_sizes(). Return
-        the tuple of (buf_sizes, max_size).
+        more than the estimate from ZoneSpecifier.get_buffer_sizes(), or the
+        maximum number of Transitions from BasicZoneSpecifier for the 'basic'
+        scope. Return the tuple of (buf_sizes, max_size).
         """
         buf_sizes: Dict[str, int] = {}
         max_size = 0
         for zone_name, zone_info in self.zone_infos.items():
-            zone_specifier = ZoneSpecifier(zone_info)
-            (max_actives, max_buffer_size) = zone_specifier.get_buffer_sizes(
-                self.start_year, self.until_year)
-
-            # The TransitionStorage size should be one more than the estimate
-            # because TransitionStorage.getFreeAgent() needs one slot even if
-            # it's not used.
-            buf_size = max_buffer_size[0] + 1
-
-            # The estimate is off for Asia/Atyrau. ZoneSpecifier returns
-            # max_buffer_size[0]==4 which means 5 should be enough, but
-            # TransitionStorage.getHighWater() says that 6 is required. Not sure
-            # why.
-            if zone_name == 'Asia/Atyrau':
-                buf_size += 1
+            if self.scope == 'basic':
+                buf_size = self._estimate_basic(zone_info)
+            else:
+                buf_size = self._estimate_extended(zone_name, zone_info)
 
             buf_sizes[zone_name] = buf_size
             if buf_size > max_size:
                 max_size = buf_size
 
         return (buf_sizes, max_size)
+
+    def _estimate_basic(self, zone_info: ZoneInfoCooked) -> int:
+        # BasicZoneProcessor has no free agent, so the buffer size is the
+        # maximum number of Transitions.
+        zone_specifier = BasicZoneSpecifier(zone_info)
+        (max_actives, max_buffer_size) = zone_specifier.get_buffer_sizes(
+            self.start_year, self.until_year)
+        return max_buffer_size[0]
+
+    def _estimate_extended(
+        self,
+        zone_name: str,
+        zone_info: ZoneInfoCooked,
+    ) -> int:
+        zone_specifier = ZoneSpecifier(zone_info)
+        (max_actives, max_buffer_size) = zone_specifier.get_buffer_sizes(
+            self.start_year, self.until_year)
+
+        # The TransitionStorage size should be one more than the estimate
+        # because TransitionStorage.getFreeAgent() needs one slot even if
+        # it's not used.
+        buf_size = max_buffer_size[0] + 1
+
+        # The estimate is off for Asia/Atyrau. ZoneSpecifier returns
+        # max_buffer_size[0]==4 which means 5 should be enough, but
+        # TransitionStorage.getHighWater() says that 6 is required. Not sure
+        # why.
+        if zone_name == 'Asia/Atyrau':
+            buf_size += 1
+
+        return buf_size
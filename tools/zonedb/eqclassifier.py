@@ -0,0 +1,119 @@
+# Copyright 2020 Brian T. Park
+#
+# MIT License
+"""
+Partition the zones into behavioral equivalence classes over the
+[start_year, until_year) interval. Two zones are equivalent if ZoneSpecifier
+produces exactly the same sequence of (startEpochSecond, total_offset,
+utc_offset, dst_offset, abbrev) for both of them inside that interval, even if
+their ZoneEras differ in the history before the interval. Anything computed
+from the Transitions of one member of a class (e.g. cached Transitions,
+precomputed tables, validation results) applies to all the other members.
+"""
+
+import logging
+from datetime import datetime
+from datetime import timezone
+from typing import Dict
+from typing import List
+from typing import Tuple
+from .ingenerator import ZoneInfoCookedMap
+from .zone_specifier import ACETIME_EPOCH
+from .zone_specifier import OffsetInfo
+from .zone_specifier import ZoneSpecifier
+from .zone_specifier import find_transition_in
+
+# The observable behavior of a zone: the list of (startEpochSecond, OffsetInfo)
+# of each change of UTC offset or abbreviation, starting with the one in effect
+# at the beginning of the interval.
+ZoneSignature = Tuple[Tuple[int, OffsetInfo], ...]
+
+
+class EquivalenceClassifier:
+    """Compute the behavioral equivalence classes of the zones in zone_infos.
+
+    Usage:
+        classifier = EquivalenceClassifier(zone_infos, start_year, until_year)
+        (classes, representatives) = classifier.classify()
+    """
+
+    def __init__(
+        self,
+        zone_infos: ZoneInfoCookedMap,
+        start_year: int,
+        until_year: int,
+    ):
+        """
+        Args:
+            zone_infos: dict of ZoneInfoCooked
+            start_year: start year of the comparison interval
+            until_year: until year of the comparison interval
+        """
+        self.zone_infos = zone_infos
+        self.start_year = start_year
+        self.until_year = until_year
+        # The [start, until) interval in epoch seconds over which the members
+        # of a class are known to be equivalent.
+        self.start_epoch_seconds = _year_to_epoch_seconds(start_year)
+        self.until_epoch_seconds = _year_to_epoch_seconds(until_year)
+
+    def classify(self) -> Tuple[List[List[str]], Dict[str, str]]:
+        """Return the tuple of (classes, representatives). The 'classes' is
+        the list of equivalence classes, each being the sorted list of its zone
+        names, sorted by the name of its first member. The 'representatives' is
+        the map of {zone_name -> canonical zone_name}, where the canonical zone
+        is the first member of its class.
+        """
+        zones_by_signature: Dict[ZoneSignature, List[str]] = {}
+        for zone_name in sorted(self.zone_infos.keys()):
+            signature = self.calc_signature(zone_name)
+            zones_by_signature.setdefault(signature, []).append(zone_name)
+
+        classes = sorted(zones_by_signature.values(), key=lambda x: x[0])
+        representatives: Dict[str, str] = {}
+        for members in classes:
+            for zone_name in members:
+                representatives[zone_name] = members[0]
+
+        logging.info(
+            'Found %d equivalence classes for %d zones in [%d, %d)',
+            len(classes), len(representatives), self.start_year,
+            self.until_year)
+        return (classes, representatives)
+
+    def calc_signature(self, zone_name: str) -> ZoneSignature:
+        """Return the ZoneSignature of the given zone over the
+        [start_year, until_year) interval. Transitions which do not change the
+        OffsetInfo (e.g. a ZoneEra boundary with the same offsets and
+        abbreviation) are not observable, so they are dropped.
+        """
+        zone_specifier = ZoneSpecifier(self.zone_infos[zone_name])
+        signature: List[Tuple[int, OffsetInfo]] = []
+        for year in range(self.start_year, self.until_year):
+            zone_specifier.init_for_year(year)
+            transitions = zone_specifier.transitions
+            year_start = _year_to_epoch_seconds(year)
+            year_until = _year_to_epoch_seconds(year + 1)
+
+            if year == self.start_year:
+                transition = find_transition_in(transitions, year_start)
+                if transition:
+                    signature.append(
+                        (year_start, transition.to_timezone_tuple()))
+
+            for transition in transitions:
+                start = transition.startEpochSecond
+                if start < year_start or start >= year_until:
+                    continue
+                info = transition.to_timezone_tuple()
+                if signature and signature[-1][1] == info:
+                    continue
+                signature.append((start, info))
+
+        return tuple(signature)
+
+
+def _year_to_epoch_seconds(year: int) -> int:
+    """Return the epoch seconds of {year}-01-01T00:00:00 UTC."""
+    dt = datetime(year, 1, 1, tzinfo=timezone.utc)
+    return int((dt - ACETIME_EPOCH).total_seconds())
@@ -10,7 +10,9 @@ import logging
 from typing import Dict
 from typing import List
 from typing import Tuple
+from typing import TYPE_CHECKING
 from typing import Union
+from typing import cast
 from typing_extensions import TypedDict
 from tzdb.extractor import ZonesMap
 from tzdb.extractor import RulesMap
@@ -61,6 +63,263 @@ ZoneInfo = TypedDict(
 
 ZoneInfoMap = Dict[str, ZoneInfo]
 
+# Note on the various XxxCooked classes: The ZoneRuleCooked, ZonePolicyCooked,
+# ZoneEraCooked, ZoneInfoCooked classes are thin class wrappers around the
+# corresponding pure data dictionaries defined above, and written into the
+# zonedb/zone_infos.py and zonedb/zone_policies.py files. I created them mostly
+# to take advantage of the Python interpreter to validate the access to various
+# fields. In other words, a typo in the 'name' in 'zone_info.name' would show an
+# error, but "zone_info['name']" would not. I created these classes before I
+# knew about the type checking abilities of mypy, so I think *most* of the
+# XxxCooked classes could be replaced by direct references to the underlying
+# data objects. One possible problem is that some wrapper classes provide
+# additional convenience methods which return values that are derived from the
+# other values. Not sure how I would implement that with primitive dict() types.
+#
+# The InlineGenerator can create the XxxCooked objects directly through their
+# create() class methods, without going through the intermediate dicts. A
+# ZoneSpecifier given a ZoneInfoCooked uses it as is.
+
+
+class ZoneRuleCooked:
+    """Internal representation of a ZoneRule dictionary in the zone_policies.py
+    output file.
+    """
+    # yapf: disable
+    __slots__ = [
+        'fromYear',  # (int) from year
+        'toYear',  # (int) to year, 1 to MAX_YEAR (9999) means 'max'
+        'inMonth',  # (int) month index (1-12)
+        'onDayOfWeek',  # (int) 1=Monday, 7=Sunday, 0={exact dayOfMonth match}
+        'onDayOfMonth',  # (int) (1-31), 0={last dayOfWeek match}
+        'atSeconds',  # (int) atTime in seconds since 00:00:00
+        'atTimeSuffix',  # (char) 's', 'w', 'u'
+        'deltaSeconds',  # (int) offset from Standard time in seconds
+        'letter',  # (str) Usually ('D', 'S', '-'), but sometimes longer
+                   # (e.g. WAT, CAT, DD, +00, +02, CST).
+    ]
+    # yapf: enable
+
+    # Hack because '__slots__' is unsupported by mypy. See
+    # https://github.com/python/mypy/issues/5941.
+    if TYPE_CHECKING:
+        fromYear: int
+        toYear: int
+        inMonth: int
+        onDayOfWeek: int
+        onDayOfMonth: int
+        atSeconds: int
+        atTimeSuffix: str
+        deltaSeconds: int
+        letter: str
+
+    def __init__(self, arg: ZoneRule):
+        """Create a ZoneRuleCooked from a dict in zone_infos.py.
+        """
+        if not isinstance(arg, dict):
+            raise Exception('Expected a dict')
+
+        for s in self.__slots__:
+            setattr(self, s, None)
+
+        for key, value in arg.items():
+            setattr(self, key, value)
+
+    @classmethod
+    def create(
+        cls,
+        fromYear: int,
+        toYear: int,
+        inMonth: int,
+        onDayOfWeek: int,
+        onDayOfMonth: int,
+        atSeconds: int,
+        atTimeSuffix: str,
+        deltaSeconds: int,
+        letter: str,
+    ) -> 'ZoneRuleCooked':
+        """Create a ZoneRuleCooked from its field values directly."""
+        rule = cls.__new__(cls)
+        rule.fromYear = fromYear
+        rule.toYear = toYear
+        rule.inMonth = inMonth
+        rule.onDayOfWeek = onDayOfWeek
+        rule.onDayOfMonth = onDayOfMonth
+        rule.atSeconds = atSeconds
+        rule.atTimeSuffix = atTimeSuffix
+        rule.deltaSeconds = deltaSeconds
+        rule.letter = letter
+        return rule
+
+
+class ZonePolicyCooked:
+    """Internal representation of a ZonePolicy dictionary in the
+    zone_policies.py output file.
+    """
+    __slots__ = ['name', 'rules']
+
+    # Hack because '__slots__' is unsupported by mypy. See
+    # https://github.com/python/mypy/issues/5941.
+    if TYPE_CHECKING:
+        name: str
+        rules: List[ZoneRuleCooked]
+
+    def __init__(self, arg: ZonePolicy):
+        if not isinstance(arg, dict):
+            raise Exception('Expected a dict')
+
+        rules = [ZoneRuleCooked(i) for i in arg['rules']]
+        self.name = arg['name']
+        self.rules = rules
+
+    @classmethod
+    def create(
+        cls,
+        name: str,
+        rules: List[ZoneRuleCooked],
+    ) -> 'ZonePolicyCooked':
+        """Create a ZonePolicyCooked from its field values directly."""
+        policy = cls.__new__(cls)
+        policy.name = name
+        policy.rules = rules
+        return policy
+
+
+class ZoneEraCooked:
+    """Internal representation of the ZoneEra dictionary stored in the
+    zone_infos.py file.
+    """
+    # yapf: disable
+    __slots__ = [
+        'offsetSeconds',  # (int) offset from UTC/GMT in seconds
+        'zonePolicy',  # (ZonePolicyCooked or str) ZonePolicyCooked if 'RULES'
+                       # field is a named policy, otherwise '-' or ':'
+        'rulesDeltaSeconds',  # (int) delta offset from UTC in seconds
+                              # if zonePolicy == ':'. Always 0 if zonePolicy is
+                              # '-'.
+        'format',  # (string) abbreviation format (e.g. P%sT, E%sT, GMT/BST)
+        'untilYear',  # (int) MAX_UNTIL_YEAR means 'max'
+        'untilMonth',  # (int) 1-12
+        'untilDay',  # (int) 1-31
+        'untilSeconds',  # (int) untilTime converted into total seconds
+        'untilTimeSuffix',  # (char) '', 's', 'w', 'u'
+    ]
+    # yapf: enable
+
+    # Hack because '__slots__' is unsupported by mypy. See
+    # https://github.com/python/mypy/issues/5941.
+    if TYPE_CHECKING:
+        offsetSeconds: int
+        zonePolicy: Union['ZonePolicyCooked', str]
+        rulesDeltaSeconds: int
+        format: str
+        untilYear: int
+        untilMonth: int
+        untilDay: int
+        untilSeconds: int
+        untilTimeSuffix: str
+
+    def __init__(self, arg: ZoneEra):
+        """Create a ZoneEraCooked from a dict in zone_infos.py. The 'zonePolicy'
+        will be another 'dict', which needs to be converted to a
+        ZonePolicyCooked object.
+        """
+        if not isinstance(arg, dict):
+            raise Exception('Expected a dict')
+
+        for s in self.__slots__:
+            setattr(self, s, None)
+
+        for key, value in arg.items():
+            if key == 'zonePolicy':
+                if isinstance(value, str):
+                    setattr(self, key, value)
+                elif isinstance(value, dict):
+                    setattr(self, key, ZonePolicyCooked(
+                        cast(ZonePolicy, value)))
+                else:
+                    raise Exception('zonePolicy value must be str or dict')
+            else:
+                setattr(self, key, value)
+
+    @classmethod
+    def create(
+        cls,
+        offsetSeconds: int,
+        zonePolicy: Union[ZonePolicyCooked, str],
+        rulesDeltaSeconds: int,
+        format: str,
+        untilYear: int,
+        untilMonth: int,
+        untilDay: int,
+        untilSeconds: int,
+        untilTimeSuffix: str,
+    ) -> 'ZoneEraCooked':
+        """Create a ZoneEraCooked from its field values directly. The
+        'zonePolicy' must already be a ZonePolicyCooked (or '-' or ':'), which
+        allows the same ZonePolicyCooked to be shared by multiple eras.
+        """
+        era = cls.__new__(cls)
+        era.offsetSeconds = offsetSeconds
+        era.zonePolicy = zonePolicy
+        era.rulesDeltaSeconds = rulesDeltaSeconds
+        era.format = format
+        era.untilYear = untilYear
+        era.untilMonth = untilMonth
+        era.untilDay = untilDay
+        era.untilSeconds = untilSeconds
+        era.untilTimeSuffix = untilTimeSuffix
+        return era
+
+    @property
+    def policyName(self) -> str:
+        """Return the human-readable name of the zone policy used by
+        this zoneEra (i.e. value of RULES column). Will be in one of 3 states:
+        '-', ':' or a reference
+        """
+        if self.zonePolicy in ['-', ':']:
+            return cast(str, self.zonePolicy)
+        else:
+            return cast(ZonePolicyCooked, self.zonePolicy).name
+
+
+class ZoneInfoCooked:
+    """Internal representation of a single ZoneInfo dictionary stored in the
+    zone_infos.py file.
+    """
+    __slots__ = ['name', 'eras']
+
+    # Hack because '__slots__' is unsupported by mypy. See
+    # https://github.com/python/mypy/issues/5941.
+    if TYPE_CHECKING:
+        name: str
+        eras: List[ZoneEraCooked]
+
+    def __init__(self, arg: ZoneInfo):
+        if not isinstance(arg, dict):
+            raise Exception('Expected a dict')
+
+        eras = [ZoneEraCooked(i) for i in arg['eras']]
+        self.name = arg['name']
+        self.eras = eras
+
+    @classmethod
+    def create(
+        cls,
+        name: str,
+        eras: List[ZoneEraCooked],
+    ) -> 'ZoneInfoCooked':
+        """Create a ZoneInfoCooked from its field values directly."""
+        info = cls.__new__(cls)
+        info.name = name
+        info.eras = eras
+        return info
+
+
+ZonePolicyCookedMap = Dict[str, ZonePolicyCooked]
+
+ZoneInfoCookedMap = Dict[str, ZoneInfoCooked]
+
 
 class InlineGenerator:
     """Generate Python zone infos and policies maps inlined (instead of files).
@@ -78,6 +337,9 @@ class InlineGenerator:
         self.zone_infos: ZoneInfoMap = {}
         self.zone_policies: ZonePolicyMap = {}
 
+        self.zone_infos_cooked: ZoneInfoCookedMap = {}
+        self.zone_policies_cooked: ZonePolicyCookedMap = {}
+
     def generate_maps(self) -> Tuple[ZoneInfoMap, ZonePolicyMap]:
         """Return the zone_infos and zone_policies maps which look identical
         to the zone_infos.py and zone_policies.py generated by PythonGenerator.
@@ -87,21 +349,34 @@ class InlineGenerator:
         self._generate_infos()
         return (self.zone_infos, self.zone_policies)
 
+    def generate_cooked_maps(
+        self,
+    ) -> Tuple[ZoneInfoCookedMap, ZonePolicyCookedMap]:
+        """Return the zone_infos and zone_policies maps as ZoneInfoCooked and
+        ZonePolicyCooked objects, created directly from the zones_map and
+        rules_map without the intermediate dicts of generate_maps(). Each
+        ZonePolicyCooked is shared by all the eras which reference it.
+        """
+        logging.info('Generating inlined cooked zone_policies and zone_infos')
+        self._generate_cooked_policies()
+        self._generate_cooked_infos()
+        return (self.zone_infos_cooked, self.zone_policies_cooked)
+
     def _generate_policies(self) -> None:
         for name, rules in self.rules_map.items():
             policy_rules: List[ZoneRule] = []
             for rule in rules:
                 # yapf: disable
                 policy_rules.append({
-                    'fromYear': rule['fromYear'],
-                    'toYear': rule['toYear'],
-                    'inMonth': rule['inMonth'],
-                    'onDayOfWeek': rule['onDayOfWeek'],
-                    'onDayOfMonth': rule['onDayOfMonth'],
-                    'atSeconds': rule['atSecondsTruncated'],
-                    'atTimeSuffix': rule['atTimeSuffix'],
-                    'deltaSeconds': rule['deltaSecondsTruncated'],
-                    'letter': rule['letter']
+                    'fromYear': rule.fromYear,
+                    'toYear': rule.toYear,
+                    'inMonth': rule.inMonth,
+                    'onDayOfWeek': rule.onDayOfWeek,
+                    'onDayOfMonth': rule.onDayOfMonth,
+                    'atSeconds': rule.atSecondsTruncated,
+                    'atTimeSuffix': rule.atTimeSuffix,
+                    'deltaSeconds': rule.deltaSecondsTruncated,
+                    'letter': rule.letter
                 })
                 # yapf: enable
 
@@ -115,7 +390,7 @@ class InlineGenerator:
         for zone_name, eras in self.zones_map.items():
             zone_eras: List[ZoneEra] = []
             for era in eras:
-                policy_name = era['rules']
+                policy_name = era.rules
                 zone_policy: Union[ZonePolicy, str]
                 if policy_name in ['-', ':']:
                     zone_policy = policy_name
@@ -125,15 +400,61 @@ class InlineGenerator:
 
                 # yapf: disable
                 zone_eras.append({
-                    'offsetSeconds': era['offsetSecondsTruncated'],
+                    'offsetSeconds': era.offsetSecondsTruncated,
                     'zonePolicy': zone_policy,
-                    'rulesDeltaSeconds': era['rulesDeltaSecondsTruncated'],
-                    'format': era['format'],
-                    'untilYear': era['untilYear'],
-                    'untilMonth': era['untilMonth'],
-                    'untilDay': era['untilDay'],
-                    'untilSeconds': era['untilSecondsTruncated'],
-                    'untilTimeSuffix': era['untilTimeSuffix'],
+                    'rulesDeltaSeconds': era.rulesDeltaSecondsTruncated,
+                    'format': era.format,
+                    'untilYear': era.untilYear,
+                    'untilMonth': era.untilMonth,
+                    'untilDay': era.untilDay,
+                    'untilSeconds': era.untilSecondsTruncated,
+                    'untilTimeSuffix': era.untilTimeSuffix,
                 })
                 # yapf: enable
             self.zone_infos[zone_name] = {'name': zone_name, 'eras': zone_eras}
+
+    def _generate_cooked_policies(self) -> None:
+        for name, rules in self.rules_map.items():
+            policy_rules = [
+                ZoneRuleCooked.create(
+                    fromYear=rule.fromYear,
+                    toYear=rule.toYear,
+                    inMonth=rule.inMonth,
+                    onDayOfWeek=rule.onDayOfWeek,
+                    onDayOfMonth=rule.onDayOfMonth,
+                    atSeconds=rule.atSecondsTruncated,
+                    atTimeSuffix=rule.atTimeSuffix,
+                    deltaSeconds=rule.deltaSecondsTruncated,
+                    letter=rule.letter,
+                )
+                for rule in rules
+            ]
+            normalized_name = normalize_name(name)
+            self.zone_policies_cooked[normalized_name] = \
+                ZonePolicyCooked.create(name=name, rules=policy_rules)
+
+    def _generate_cooked_infos(self) -> None:
+        for zone_name, eras in self.zones_map.items():
+            zone_eras: List[ZoneEraCooked] = []
+            for era in eras:
+                policy_name = era.rules
+                zone_policy: Union[ZonePolicyCooked, str]
+                if policy_name in ['-', ':']:
+                    zone_policy = policy_name
+                else:
+                    policy_name = normalize_name(policy_name)
+                    zone_policy = self.zone_policies_cooked[policy_name]
+
+                zone_eras.append(ZoneEraCooked.create(
+                    offsetSeconds=era.offsetSecondsTruncated,
+                    zonePolicy=zone_policy,
+                    rulesDeltaSeconds=era.rulesDeltaSecondsTruncated,
+                    format=era.format,
+                    untilYear=era.untilYear,
+                    untilMonth=era.untilMonth,
+                    untilDay=era.untilDay,
+                    untilSeconds=era.untilSecondsTruncated,
+                    untilTimeSuffix=era.untilTimeSuffix,
+                ))
+            self.zone_infos_cooked[zone_name] = ZoneInfoCooked.create(
+                name=zone_name, eras=zone_eras)
@@ -0,0 +1,207 @@
+# Copyright 2020 Brian T. Park
+#
+# MIT License
+"""
+Expand a recurring local-time schedule (e.g. "every day at 02:30", "first
+Sunday of the month at 09:00") into the UTC epoch seconds of its occurrences
+in a given zone. Instead of converting each occurrence through
+ZoneSpecifier.get_timezone_info_for_datetime(), the Transitions of the zone
+are collected once into a list of segments of constant UTC offset, and the
+sorted local occurrences are matched against that list in a single pass.
+
+A local time can fall into a gap (e.g. 02:30 on the day that the clock jumps
+from 02:00 to 03:00) or into an overlap (e.g. 01:30 on the day the clock falls
+back from 02:00 to 01:00). The handling of these is explicit, through the
+'gap' and 'overlap' policies of ScheduleExpander.
+"""
+
+import calendar
+from datetime import datetime
+from datetime import timezone
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+from typing import Union
+from tzdb.transformer import calc_day_of_month
+from .ingenerator import ZoneInfo
+from .ingenerator import ZoneInfoCooked
+from .zone_specifier import ACETIME_EPOCH
+from .zone_specifier import ZoneSpecifier
+
+# A recurring local time, using the same conventions as the ON and AT fields
+# of the TZ Database RULE entries:
+#
+#   * 'Sun>=1' (first Sunday) is (on_day_of_week=7, on_day_of_month=1)
+#   * 'lastSun' is (on_day_of_week=7, on_day_of_month=0)
+#   * 'Sun<=25' is (on_day_of_week=7, on_day_of_month=-25)
+#   * '15' is (on_day_of_week=0, on_day_of_month=15)
+#
+# If both on_day_of_week and on_day_of_month are 0, the Recurrence occurs on
+# every day of the month.
+Recurrence = NamedTuple('Recurrence', [
+    ('month', int),  # 1-12, or 0 for every month
+    ('on_day_of_week', int),  # 1=Monday, 7=Sunday, 0={exact on_day_of_month}
+    ('on_day_of_month', int),  # 1-31, 0=last on_day_of_week, <0 for '<='
+    ('at_seconds', int),  # local wall time in seconds since 00:00
+])
+
+# A span of constant total UTC offset: (start epoch_seconds, total_offset).
+# A segment ends at the start of the next one.
+Segment = Tuple[int, int]
+
+# Policies for a local time which does not exist because of a gap:
+#   * 'shift': interpret it using the UTC offset before the gap, which moves
+#     it forward by the size of the gap (e.g. 02:30 becomes 03:30)
+#   * 'skip': drop the occurrence
+GAP_POLICIES = ['shift', 'skip']
+
+# Policies for a local time which occurs twice because of an overlap:
+#   * 'earlier': keep the first occurrence
+#   * 'later': keep the second occurrence
+#   * 'both': keep both occurrences
+OVERLAP_POLICIES = ['earlier', 'later', 'both']
+
+
+class ScheduleExpander:
+    """Expand a Recurrence into the epoch seconds (from 2000-01-01 00:00:00
+    UTC) of its occurrences in a zone.
+
+    Usage:
+        expander = ScheduleExpander(zone_info [, gap] [, overlap])
+        recurrence = Recurrence(
+            month=0, on_day_of_week=0, on_day_of_month=0,
+            at_seconds=2 * 3600 + 30 * 60)
+        epoch_seconds = expander.expand(recurrence, start_year, until_year)
+    """
+
+    def __init__(
+        self,
+        zone_info_data: Union[ZoneInfo, ZoneInfoCooked],
+        gap: str = 'shift',
+        overlap: str = 'earlier',
+    ):
+        """Constructor.
+
+        Args:
+            zone_info_data: one of the ZONE_INFO_xxx constants from
+                zone_infos.py, or a ZoneInfoCooked
+            gap: one of GAP_POLICIES
+            overlap: one of OVERLAP_POLICIES
+        """
+        if gap not in GAP_POLICIES:
+            raise Exception(f"Unknown gap policy '{gap}'")
+        if overlap not in OVERLAP_POLICIES:
+            raise Exception(f"Unknown overlap policy '{overlap}'")
+
+        self.zone_specifier = ZoneSpecifier(zone_info_data)
+        self.gap = gap
+        self.overlap = overlap
+
+    def expand(
+        self,
+        recurrence: Recurrence,
+        start_year: int,
+        until_year: int,
+    ) -> List[int]:
+        """Return the sorted epoch seconds of the occurrences of 'recurrence'
+        whose local date is in the years [start_year, until_year).
+        """
+        segments = self.calc_segments(start_year, until_year)
+        local_seconds = _calc_local_seconds(recurrence, start_year, until_year)
+
+        results: List[int] = []
+        # Index of the first segment which ends after the current local time,
+        # expressed in the UTC offset of that segment.
+        index = 0
+        last = len(segments) - 1
+        for local in local_seconds:
+            while (index < last
+                    and segments[index + 1][0] + segments[index][1] <= local):
+                index += 1
+            (start, offset) = segments[index]
+
+            if index > 0 and local < start + offset:
+                # In the gap before this segment.
+                if self.gap == 'shift':
+                    results.append(local - segments[index - 1][1])
+                continue
+
+            results.append(local - offset)
+
+            # In an overlap with the next segment.
+            if index < last:
+                (next_start, next_offset) = segments[index + 1]
+                if next_start + next_offset <= local:
+                    if self.overlap == 'later':
+                        results[-1] = local - next_offset
+                    elif self.overlap == 'both':
+                        results.append(local - next_offset)
+
+        return results
+
+    def calc_segments(self, start_year: int, until_year: int) -> List[Segment]:
+        """Return the list of Segments which cover the years
+        [start_year, until_year). Consecutive Transitions with the same total
+        offset (e.g. a change of abbreviation only) are merged.
+        """
+        transitions: Dict[int, int] = {}
+        for year in range(start_year, until_year):
+            self.zone_specifier.init_for_year(year)
+            for transition in self.zone_specifier.transitions:
+                transitions[transition.startEpochSecond] = \
+                    transition.to_timezone_tuple().total_offset
+
+        segments: List[Segment] = []
+        for start, offset in sorted(transitions.items()):
+            if segments and segments[-1][1] == offset:
+                continue
+            segments.append((start, offset))
+        return segments
+
+
+def _calc_local_seconds(
+    recurrence: Recurrence,
+    start_year: int,
+    until_year: int,
+) -> List[int]:
+    """Return the sorted local times of the occurrences of 'recurrence' in
+    [start_year, until_year), in seconds from 2000-01-01 00:00:00 of the local
+    time.
+    """
+    months = [recurrence.month] if recurrence.month else list(range(1, 13))
+    every_day = (
+        recurrence.on_day_of_week == 0 and recurrence.on_day_of_month == 0
+    )
+
+    local_seconds: List[int] = []
+    for year in range(start_year, until_year):
+        for month in months:
+            if every_day:
+                start = _to_epoch_seconds(year, month, 1)
+                days = calendar.monthrange(year, month)[1]
+                local_seconds.extend(
+                    start + day * 86400 + recurrence.at_seconds
+                    for day in range(days)
+                )
+                continue
+
+            (shifted_month, day) = calc_day_of_month(
+                year, month, recurrence.on_day_of_week,
+                recurrence.on_day_of_month)
+            shifted_year = year
+            if shifted_month == 0:
+                (shifted_year, shifted_month) = (year - 1, 12)
+            elif shifted_month == 13:
+                (shifted_year, shifted_month) = (year + 1, 1)
+            local_seconds.append(
+                _to_epoch_seconds(shifted_year, shifted_month, day)
+                + recurrence.at_seconds)
+
+    local_seconds.sort()
+    return local_seconds
+
+
+def _to_epoch_seconds(year: int, month: int, day: int) -> int:
+    dt = datetime(year, month, day, tzinfo=timezone.utc)
+    return int((dt - ACETIME_EPOCH).total_seconds())
@@ -11,12 +11,15 @@ experiment and debug the C++ code in the Arduino environment.
 
 import sys
 import logging
+import zlib
+from datetime import date
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Mapping
 from typing import NamedTuple
 from typing import Optional
 from typing import Tuple
@@ -24,14 +27,17 @@ from typing import TYPE_CHECKING
 from typing import Union
 from typing import cast
 from typing_extensions import Protocol
+from tzdb.extractor import MAX_UNTIL_YEAR
+from tzdb.extractor import MAX_YEAR
 from tzdb.extractor import MIN_YEAR
 from tzdb.transformer import seconds_to_hms
 from tzdb.transformer import hms_to_seconds
 from tzdb.transformer import calc_day_of_month
-from .ingenerator import ZoneRule
-from .ingenerator import ZonePolicy
-from .ingenerator import ZoneEra
 from .ingenerator import ZoneInfo
+from .ingenerator import ZoneRuleCooked
+from .ingenerator import ZonePolicyCooked
+from .ingenerator import ZoneEraCooked
+from .ingenerator import ZoneInfoCooked
 
 # A datetime representation using seconds instead of h:m:s
 DateTuple = NamedTuple('DateTuple', [
@@ -66,175 +72,27 @@ SECONDS_SINCE_UNIX_EPOCH = 946684800
 
 ACETIME_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
 
-# Note on the various XxxCooked classes: The ZoneRuleCooked, ZonePolicyCooked,
-# ZoneEraCooked, ZoneInfoCooked classes are thin class wrappers around the
-# corresponding pure data dictionaries defined in the 'ingenerator' module, and
-# written into the zonedb/zone_infos.py and zonedb/zone_policies.py files. I
-# created them mostly to take advantage of the Python interpreter to validate
-# the access to various fields. In other words, a typo in the 'name' in
-# 'zone_info.name' would show an error, but "zone_info['name']" would not. I
-# created these classes before I knew about the type checking abilities of mypy,
-# so I think *most* of the XxxCooked classes could be replaced by direct
-# references to the underlying data objects. One possible problem is that some
-# wrapper classes provide additional convenience methods which return values
-# that are derived from the other values. Not sure how I would implement that
-# with primitive dict() types.
-
-
-class ZoneRuleCooked:
-    """Internal representation of a ZoneRule dictionary in the zone_policies.py
-    output file.
-    """
-    # yapf: disable
-    __slots__ = [
-        'fromYear',  # (int) from year
-        'toYear',  # (int) to year, 1 to MAX_YEAR (9999) means 'max'
-        'inMonth',  # (int) month index (1-12)
-        'onDayOfWeek',  # (int) 1=Monday, 7=Sunday, 0={exact dayOfMonth match}
-        'onDayOfMonth',  # (int) (1-31), 0={last dayOfWeek match}
-        'atSeconds',  # (int) atTime in seconds since 00:00:00
-        'atTimeSuffix',  # (char) 's', 'w', 'u'
-        'deltaSeconds',  # (int) offset from Standard time in seconds
-        'letter',  # (str) Usually ('D', 'S', '-'), but sometimes longer
-                   # (e.g. WAT, CAT, DD, +00, +02, CST).
-    ]
-    # yapf: enable
-
-    # Hack because '__slots__' is unsupported by mypy. See
-    # https://github.com/python/mypy/issues/5941.
-    if TYPE_CHECKING:
-        fromYear: int
-        toYear: int
-        inMonth: int
-        onDayOfWeek: int
-        onDayOfMonth: int
-        atSeconds: int
-        atTimeSuffix: str
-        deltaSeconds: int
-        letter: str
-
-    def __init__(self, arg: ZoneRule):
-        """Create a ZoneRuleCooked from a dict in zone_infos.py.
-        """
-        if not isinstance(arg, dict):
-            raise Exception('Expected a dict')
-
-        for s in self.__slots__:
-            setattr(self, s, None)
-
-        for key, value in arg.items():
-            setattr(self, key, value)
-
-
-class ZonePolicyCooked:
-    """Internal representation of a ZonePolicy dictionary in the
-    zone_policies.py output file.
-    """
-    __slots__ = ['name', 'rules']
-
-    # Hack because '__slots__' is unsupported by mypy. See
-    # https://github.com/python/mypy/issues/5941.
-    if TYPE_CHECKING:
-        name: str
-        rules: List[ZoneRuleCooked]
-
-    def __init__(self, arg: ZonePolicy):
-        if not isinstance(arg, dict):
-            raise Exception('Expected a dict')
-
-        rules = [ZoneRuleCooked(i) for i in arg['rules']]
-        self.name = arg['name']
-        self.rules = rules
-
-
-class ZoneEraCooked:
-    """Internal representation of the ZoneEra dictionary stored in the
-    zone_infos.py file.
-    """
-    # yapf: disable
-    __slots__ = [
-        'offsetSeconds',  # (int) offset from UTC/GMT in seconds
-        'zonePolicy',  # (ZonePolicyCooked or str) ZonePolicyCooked if 'RULES'
-                       # field is a named policy, otherwise '-' or ':'
-        'rulesDeltaSeconds',  # (int) delta offset from UTC in seconds
-                              # if zonePolicy == ':'. Always 0 if zonePolicy is
-                              # '-'.
-        'format',  # (string) abbreviation format (e.g. P%sT, E%sT, GMT/BST)
-        'untilYear',  # (int) MAX_UNTIL_YEAR means 'max'
-        'untilMonth',  # (int) 1-12
-        'untilDay',  # (int) 1-31
-        'untilSeconds',  # (int) untilTime converted into total seconds
-        'untilTimeSuffix',  # (char) '', 's', 'w', 'u'
-    ]
-    # yapf: enable
+# Margin around the UTC time of a query used by the lazy evaluation path to find
+# the ZoneMatches which could contain it. Must be larger than the largest UTC
+# offset (including DST) of any zone.
+LAZY_MATCH_SLACK = timedelta(days=2)
 
-    # Hack because '__slots__' is unsupported by mypy. See
-    # https://github.com/python/mypy/issues/5941.
-    if TYPE_CHECKING:
-        offsetSeconds: int
-        zonePolicy: Union['ZonePolicyCooked', str]
-        rulesDeltaSeconds: int
-        format: str
-        untilYear: int
-        untilMonth: int
-        untilDay: int
-        untilSeconds: int
-        untilTimeSuffix: str
-
-    def __init__(self, arg: ZoneEra):
-        """Create a ZoneEraCooked from a dict in zone_infos.py. The 'zonePolicy'
-        will be another 'dict', which needs to be converted to a
-        ZonePolicyCooked object.
-        """
-        if not isinstance(arg, dict):
-            raise Exception('Expected a dict')
-
-        for s in self.__slots__:
-            setattr(self, s, None)
-
-        for key, value in arg.items():
-            if key == 'zonePolicy':
-                if isinstance(value, str):
-                    setattr(self, key, value)
-                elif isinstance(value, dict):
-                    setattr(self, key, ZonePolicyCooked(
-                        cast(ZonePolicy, value)))
-                else:
-                    raise Exception('zonePolicy value must be str or dict')
-            else:
-                setattr(self, key, value)
-
-    @property
-    def policyName(self) -> str:
-        """Return the human-readable name of the zone policy used by
-        this zoneEra (i.e. value of RULES column). Will be in one of 3 states:
-        '-', ':' or a reference
-        """
-        if self.zonePolicy in ['-', ':']:
-            return cast(str, self.zonePolicy)
-        else:
-            return cast(ZonePolicyCooked, self.zonePolicy).name
-
-
-class ZoneInfoCooked:
-    """Internal representation of a single ZoneInfo dictionary stored in the
-    zone_infos.py file.
-    """
-    __slots__ = ['name', 'eras']
-
-    # Hack because '__slots__' is unsupported by mypy. See
-    # https://github.com/python/mypy/issues/5941.
-    if TYPE_CHECKING:
-        name: str
-        eras: List[ZoneEraCooked]
+# Number of days around a ZoneMatch inside which CandidateFinderPruned keeps the
+# candidate Transitions.
+PRUNE_MARGIN_DAYS = 3
 
-    def __init__(self, arg: ZoneInfo):
-        if not isinstance(arg, dict):
-            raise Exception('Expected a dict')
+# Registry of {zone_name -> ZoneInfo or ZoneInfoCooked} used to rehydrate a
+# pickled ZoneSpecifier (see ZoneSpecifier.__reduce__()). Populated by
+# register_zone_infos(). Zones not in the registry are looked up in
+# zonedbpy.zone_infos.ZONE_INFO_MAP.
+ZONE_REGISTRY: Dict[str, Union[ZoneInfo, ZoneInfoCooked]] = {}
 
-        eras = [ZoneEraCooked(i) for i in arg['eras']]
-        self.name = arg['name']
-        self.eras = eras
+# The ZoneMatches and Transitions of ZoneSpecifier.init_for_year() in the form
+# carried by a pickle if 'pickle_transitions' is set: (year, [(startDateTime,
+# untilDateTime, era_index)], [tuple of the Transition.__slots__],
+# max_transition_buffer_size). See ZoneSpecifier._pack_state().
+PackedState = Tuple[
+    int, List[Tuple[Any, ...]], List[Tuple[Any, ...]], int]
 
 
 class ZoneMatch:
@@ -473,6 +331,12 @@ class ZoneSpecifier:
     'datetime' will be efficient if the closest 'year' is the same. See
     init_for_year() for high level explanation of the internal algorithm.
 
+    If 'lazy_evaluation' is enabled, get_timezone_info_for_seconds() and
+    get_transition_for_seconds() compute only the ZoneMatch containing the
+    epoch_seconds (plus the prior Transition needed for its start), which is
+    cheaper for one-off lookups in a year that has not been initialized. The
+    full window remains available through init_for_year().
+
     Usage:
         zone_specifier = ZoneSpecifier(zone_info [, viewing_months, debug])
 
@@ -514,11 +378,14 @@ class ZoneSpecifier:
 
     def __init__(
             self,
-            zone_info_data: ZoneInfo,
+            zone_info_data: Union[ZoneInfo, ZoneInfoCooked],
             viewing_months: int = 14,
             debug: bool = False,
             in_place_transitions: bool = True,
             optimize_candidates: bool = True,
+            lazy_evaluation: bool = False,
+            prune_candidates: bool = False,
+            pickle_transitions: bool = False,
     ):
         """Constructor.
 
@@ -526,7 +393,8 @@ class ZoneSpecifier:
             zone_info_data (dict): one of the ZONE_INFO_xxx constants from
                 zone_infos.py. It can contain a reference to a zone_policy_data
                 map. We need to convert these into ZoneEraCooked and
-                ZoneRuleCooked classes.
+                ZoneRuleCooked classes. A ZoneInfoCooked (e.g. from
+                InlineGenerator.generate_cooked_maps()) is used as is.
             viewing_months (int): size of the window to consider when
                 determining the DST transitions (default: 14)
             debug (bool): set to True to enable logging
@@ -537,11 +405,29 @@ class ZoneSpecifier:
             optimize_candidates (bool): set to True to use
                 CandidateFinderOptimized class instead of CandidateFinderBasic
                 to obtain the list of candidate Transitions
+            lazy_evaluation (bool): set to True to let the epoch_seconds
+                queries compute only the Transitions of the ZoneMatch which
+                contains the given epoch_seconds, instead of the entire viewing
+                window of init_for_year() (see
+                _find_transition_for_seconds_lazily())
+            prune_candidates (bool): set to True to use the
+                CandidateFinderPruned and ActiveSelectorSinglePass classes,
+                overriding in_place_transitions and optimize_candidates
+            pickle_transitions (bool): set to True to include the ZoneMatches
+                and Transitions of init_for_year() in the pickle, in a packed
+                form, instead of recalculating them on the first query after
+                unpickling (see __reduce__())
         """
-        self.zone_info = ZoneInfoCooked(zone_info_data)
+        if isinstance(zone_info_data, ZoneInfoCooked):
+            self.zone_info = zone_info_data
+        else:
+            self.zone_info = ZoneInfoCooked(zone_info_data)
         self.viewing_months = viewing_months
         self.in_place_transitions = in_place_transitions
         self.optimize_candidates = optimize_candidates
+        self.lazy_evaluation = lazy_evaluation
+        self.prune_candidates = prune_candidates
+        self.pickle_transitions = pickle_transitions
 
         # Used by init_*() to indicate the current year of interest.
         self.year = 0
@@ -572,14 +458,105 @@ class ZoneSpecifier:
         # by the C++ code.
         self.max_transition_buffer_size = 0
 
+        # The [start_ym, until_ym) interval and the Transitions most recently
+        # calculated by the lazy evaluation path. Unlike self.transitions,
+        # these cover only the few months around the last epoch_seconds query.
+        self.lazy_window: Optional[
+            Tuple[YearMonthTuple, YearMonthTuple]] = None
+        self.lazy_transitions: List[Transition] = []
+
         self.debug = debug
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle only the zone name and the options, instead of the entire
+        graph of ZoneEraCooked, ZonePolicyCooked and Transition objects. The
+        receiving process retrieves the ZoneInfo from its own ZONE_REGISTRY. A
+        checksum of the zone data detects a registry which does not contain
+        the same zone data.
+
+        By default, the cached Transitions are dropped, and the first query
+        after unpickling recalculates the Transitions of its own year. If
+        'pickle_transitions' is set, the ZoneMatches and Transitions of the
+        current year are carried along as tuples of their slots, with the
+        ZoneEraCooked and ZoneRuleCooked references replaced by their indexes
+        in the ZoneInfoCooked.
+        """
+        packed_state = self._pack_state() if self.pickle_transitions else None
+        return (
+            _rehydrate_zone_specifier,
+            (
+                self.zone_info.name,
+                _calc_zone_checksum(self.zone_info),
+                self.viewing_months,
+                self.debug,
+                self.in_place_transitions,
+                self.optimize_candidates,
+                self.lazy_evaluation,
+                self.prune_candidates,
+                packed_state,
+            ),
+        )
+
+    def _pack_state(self) -> Optional[PackedState]:
+        """Return the PackedState of the year calculated by init_for_year(),
+        or None if no year has been calculated.
+        """
+        if not self.year:
+            return None
+        era_indexes = {id(era): i for i, era in enumerate(self.zone_info.eras)}
+        packed_matches = [
+            (m.startDateTime, m.untilDateTime, era_indexes[id(m.zoneEra)])
+            for m in self.matches
+        ]
+        packed_transitions = []
+        for t in self.transitions:
+            fields = []
+            for s in Transition.__slots__:
+                value = getattr(t, s)
+                if s == 'zoneEra':
+                    value = era_indexes[id(value)]
+                elif s == 'zoneRule':
+                    value = _find_rule_index(t.zoneEra, value)
+                fields.append(value)
+            packed_transitions.append(tuple(fields))
+        return (
+            self.year,
+            packed_matches,
+            packed_transitions,
+            self.max_transition_buffer_size,
+        )
+
+    def _unpack_state(self, packed_state: PackedState) -> None:
+        """Restore the ZoneMatches and Transitions saved by _pack_state()."""
+        (year, packed_matches, packed_transitions, buffer_size) = packed_state
+        eras = self.zone_info.eras
+        self.matches = [
+            ZoneMatch({
+                'startDateTime': start,
+                'untilDateTime': until,
+                'zoneEra': eras[era_index],
+            }) for (start, until, era_index) in packed_matches
+        ]
+        self.transitions = []
+        for fields in packed_transitions:
+            transition = Transition.__new__(Transition)
+            values = dict(zip(Transition.__slots__, fields))
+            zone_era = eras[values['zoneEra']]
+            values['zoneEra'] = zone_era
+            values['zoneRule'] = _get_rule_at(zone_era, values['zoneRule'])
+            transition.update(values)
+            self.transitions.append(transition)
+        self.max_transition_buffer_size = buffer_size
+        self.year = year
+
     def get_transition_for_seconds(
             self,
             epoch_seconds: int,
     ) -> Optional[Transition]:
         """Return Transition for the given epoch_seconds.
         """
+        if self.lazy_evaluation:
+            return self._find_transition_for_seconds_lazily(epoch_seconds)
         self._init_for_second(epoch_seconds)
         return self._find_transition_for_seconds(epoch_seconds)
 
@@ -593,11 +570,9 @@ class ZoneSpecifier:
     def get_timezone_info_for_seconds(self, epoch_seconds: int) -> OffsetInfo:
         """Return a tuple of (total_offset, dst_seconds, abbrev).
         """
-        self._init_for_second(epoch_seconds)
-
         # TODO(bpark): Check for None
         transition = cast(Transition,
-                          self._find_transition_for_seconds(epoch_seconds))
+                          self.get_transition_for_seconds(epoch_seconds))
         return transition.to_timezone_tuple()
 
     def get_timezone_info_for_datetime(
@@ -644,21 +619,7 @@ class ZoneSpecifier:
         self.transitions = []
         self.all_candidate_transitions = []
 
-        if self.viewing_months == 12:
-            start_ym = YearMonthTuple(year, 1)
-            until_ym = YearMonthTuple(year + 1, 1)
-        elif self.viewing_months == 13:
-            start_ym = YearMonthTuple(year, 1)
-            until_ym = YearMonthTuple(year + 1, 2)
-        elif self.viewing_months == 14:
-            start_ym = YearMonthTuple(year - 1, 12)
-            until_ym = YearMonthTuple(year + 1, 2)
-        elif self.viewing_months == 36:
-            start_ym = YearMonthTuple(year - 1, 1)
-            until_ym = YearMonthTuple(year + 2, 1)
-        else:
-            raise Exception(
-                'Unsupported viewing_months: %d' % self.viewing_months)
+        (start_ym, until_ym) = self._get_viewing_window(year)
 
         if self.debug:
             logging.info('==== Finding matches')
@@ -736,9 +697,39 @@ class ZoneSpecifier:
                          self.max_transition_buffer_size)
         self.all_candidate_transitions.extend(candidate_transitions)
 
+    def _get_viewing_window(
+            self,
+            year: int,
+    ) -> Tuple[YearMonthTuple, YearMonthTuple]:
+        """Return the [start_ym, until_ym) interval of the viewing window
+        around the given year, as determined by 'viewing_months'.
+        """
+        if self.viewing_months == 12:
+            start_ym = YearMonthTuple(year, 1)
+            until_ym = YearMonthTuple(year + 1, 1)
+        elif self.viewing_months == 13:
+            start_ym = YearMonthTuple(year, 1)
+            until_ym = YearMonthTuple(year + 1, 2)
+        elif self.viewing_months == 14:
+            start_ym = YearMonthTuple(year - 1, 12)
+            until_ym = YearMonthTuple(year + 1, 2)
+        elif self.viewing_months == 36:
+            start_ym = YearMonthTuple(year - 1, 1)
+            until_ym = YearMonthTuple(year + 2, 1)
+        else:
+            raise Exception(
+                'Unsupported viewing_months: %d' % self.viewing_months)
+        return (start_ym, until_ym)
+
     def _init_for_second(self, epoch_seconds: int) -> None:
         """Initialize the Transitions from the given epoch_seconds.
         """
+        self.init_for_year(self._get_year_for_second(epoch_seconds))
+
+    def _get_year_for_second(self, epoch_seconds: int) -> int:
+        """Return the year whose viewing window is used to determine the
+        Transition of the given epoch_seconds.
+        """
         ldt = datetime.utcfromtimestamp(
             epoch_seconds + SECONDS_SINCE_UNIX_EPOCH)
 
@@ -761,7 +752,7 @@ class ZoneSpecifier:
 
             year = ldt.year
 
-        self.init_for_year(year)
+        return year
 
     def _find_transition_for_seconds(
             self,
@@ -769,13 +760,104 @@ class ZoneSpecifier:
     ) -> Optional[Transition]:
         """Return the matching transition, or None if not found.
         """
-        matching_transition = None
-        for transition in self.transitions:
-            if transition.startEpochSecond <= epoch_seconds:
-                matching_transition = transition
-            elif transition.startEpochSecond > epoch_seconds:
-                break
-        return matching_transition
+        return find_transition_in(self.transitions, epoch_seconds)
+
+    def _find_transition_for_seconds_lazily(
+            self,
+            epoch_seconds: int,
+    ) -> Optional[Transition]:
+        """Return the matching transition for the given epoch_seconds, without
+        calculating the Transitions of the entire viewing window. If the
+        viewing window of the year has already been initialized by
+        init_for_year(), the cached Transitions are used instead.
+
+        The UTC datetime of epoch_seconds is widened by LAZY_MATCH_SLACK
+        (larger than any UTC offset) on both sides and rounded out to whole
+        months. Only the ZoneMatches overlapping that small interval are
+        created, truncated to it, and evaluated. See
+        _find_transitions_lazily() for how the start of the interval is
+        anchored. The resulting UTC offsets and abbreviations are identical to
+        those calculated by init_for_year(), but the Transition objects
+        themselves may be shifted to the start of the smaller interval.
+        """
+        year = self._get_year_for_second(epoch_seconds)
+        if self.year == year:
+            return self._find_transition_for_seconds(epoch_seconds)
+
+        udt = datetime.utcfromtimestamp(
+            epoch_seconds + SECONDS_SINCE_UNIX_EPOCH)
+        lo = udt - LAZY_MATCH_SLACK
+        hi = udt + LAZY_MATCH_SLACK
+        start_ym = YearMonthTuple(lo.year, lo.month)
+        if hi.month == 12:
+            until_ym = YearMonthTuple(hi.year + 1, 1)
+        else:
+            until_ym = YearMonthTuple(hi.year, hi.month + 1)
+
+        if self.lazy_window != (start_ym, until_ym):
+            self.lazy_window = (start_ym, until_ym)
+            self.lazy_transitions = self._find_transitions_lazily(
+                start_ym, until_ym)
+        return find_transition_in(self.lazy_transitions, epoch_seconds)
+
+    def _find_transitions_lazily(
+            self,
+            start_ym: YearMonthTuple,
+            until_ym: YearMonthTuple,
+    ) -> List[Transition]:
+        """Calculate the Transitions of the ZoneMatches which overlap
+        [start_ym, until_ym), without touching self.matches, self.transitions
+        or the buffer size statistics of init_for_year().
+
+        If the first ZoneMatch begins inside the interval, the Transitions of
+        init_for_year() would convert its start time using the UTC offset of
+        the last Transition of the previous ZoneEra. That Transition is found
+        by evaluating only the final month of the previous ZoneEra, and is
+        prepended to the result.
+        """
+        if self.debug:
+            logging.info('_find_transitions_lazily(): [%s, %s)',
+                         start_ym, until_ym)
+
+        prev_era = self.ZONE_ERA_ANCHOR
+        prior_eras: Optional[Tuple[ZoneEraCooked, ZoneEraCooked]] = None
+        matches: List[ZoneMatch] = []
+        for zone_era in self.zone_info.eras:
+            if self._era_overlaps_interval(prev_era, zone_era, start_ym,
+                                           until_ym):
+                matches.append(self._create_match(prev_era, zone_era,
+                                                  start_ym, until_ym))
+            elif not matches:
+                prior_eras = (prev_era, zone_era)
+            prev_era = zone_era
+        if not matches:
+            return []
+
+        transitions: List[Transition] = []
+        window_start = DateTuple(y=start_ym.y, M=start_ym.M, d=1, ss=0, f='w')
+        if prior_eras and matches[0].startDateTime != window_start:
+            (prior_prev_era, prior_era) = prior_eras
+            if prior_era.untilMonth == 1:
+                prior_start_ym = YearMonthTuple(prior_era.untilYear - 1, 12)
+            else:
+                prior_start_ym = YearMonthTuple(
+                    prior_era.untilYear, prior_era.untilMonth - 1)
+            prior_until_ym = YearMonthTuple(prior_era.untilYear + 1, 1)
+            prior_match = self._create_match(prior_prev_era, prior_era,
+                                             prior_start_ym, prior_until_ym)
+            prior_transitions = self._find_transitions_for_match(
+                prior_match, update_stats=False)
+            transitions.append(prior_transitions[-1])
+
+        for match in matches:
+            transitions.extend(
+                self._find_transitions_for_match(match, update_stats=False))
+        self._fix_transition_times(transitions)
+        self._generate_start_until_times(transitions)
+        self._calc_abbrev(transitions)
+        if self.debug:
+            print_transitions(transitions)
+        return transitions
 
     def _find_transition_for_datetime(self,
                                       dt: datetime) -> Optional[Transition]:
@@ -853,12 +935,16 @@ class ZoneSpecifier:
             transitions_for_match = self._find_transitions_for_match(match)
             self.transitions.extend(transitions_for_match)
 
-    def _find_transitions_for_match(self,
-                                    match: ZoneMatch) -> List[Transition]:
+    def _find_transitions_for_match(
+            self,
+            match: ZoneMatch,
+            update_stats: bool = True,
+    ) -> List[Transition]:
         """Determine if the given ZoneMatch is a simple ZoneMatch (contains an
         explicit DST offset) or named (references a named ZonePolicy to
         determine the DST offset). Then find the Transitions of the given match
-        using the appropriate algorithm.
+        using the appropriate algorithm. If 'update_stats' is False, the buffer
+        size statistics of init_for_year() are left untouched.
         """
         if self.debug:
             logging.info('_find_transitions_for_match(): %s' % match)
@@ -866,13 +952,16 @@ class ZoneSpecifier:
         zone_era = match.zoneEra
         zone_policy = zone_era.zonePolicy
         if zone_policy in ['-', ':']:
-            return self._find_transitions_from_simple_match(match)
+            return self._find_transitions_from_simple_match(
+                match, update_stats)
         else:
-            return self._find_transitions_from_named_match(match)
+            return self._find_transitions_from_named_match(
+                match, update_stats)
 
     def _find_transitions_from_simple_match(
             self,
             match: ZoneMatch,
+            update_stats: bool = True,
     ) -> List[Transition]:
         """The zonePolicy is '-' or ':' then the Zone Era itself defines the UTC
         offset and the abbreviation. Returns a list of one Transition object,
@@ -886,12 +975,14 @@ class ZoneSpecifier:
             'transitionTime': match.startDateTime,
         })
         transitions = [transition]
-        self._update_transition_buffer_size(transitions)
+        if update_stats:
+            self._update_transition_buffer_size(transitions)
         return transitions
 
     def _find_transitions_from_named_match(
             self,
             match: ZoneMatch,
+            update_stats: bool = True,
     ) -> List[Transition]:
         """Find the transitions of the named ZoneMatch. The search for the
         relevant Transition occurs in 2 passes:
@@ -919,6 +1010,12 @@ class ZoneSpecifier:
         microcontroller environments which have limited memory (~32kB of
         flash RAM, and ~2kB of static RAM).
 
+        A fifth combination, selected by 'prune_candidates', pairs
+        CandidateFinderPruned with ActiveSelectorSinglePass. The finder rejects
+        rule years by their inMonth before creating any Transition, and uses a
+        window of a few days instead of months around the ZoneMatch, so fewer
+        candidates reach _fix_transition_times() and the selector.
+
         The 'self.max_transition_buffer_size' counter and
         'self.all_candidate_transitions' list attempt to track the amount of
         internal buffer space needed by the various algorithms. See comments in
@@ -929,7 +1026,9 @@ class ZoneSpecifier:
         assert isinstance(zone_policy, ZonePolicyCooked)
         rules = zone_policy.rules
         finder: 'CandidateFinder'
-        if self.optimize_candidates:
+        if self.prune_candidates:
+            finder = CandidateFinderPruned(self.debug)
+        elif self.optimize_candidates:
             finder = CandidateFinderOptimized(self.debug)
         else:
             finder = CandidateFinderBasic(self.debug)
@@ -951,14 +1050,17 @@ class ZoneSpecifier:
         self._check_transitions_sorted(candidate_transitions)
 
         # Update statistics on active transitions
-        self._update_transition_buffer_size(candidate_transitions)
+        if update_stats:
+            self._update_transition_buffer_size(candidate_transitions)
 
         # Select only those Transitions which overlap with the actual start and
         # until times of the ZoneMatch.
         if self.debug:
             logging.info('==== Select active transitions')
         selector: 'ActiveSelector'
-        if self.in_place_transitions:
+        if self.prune_candidates:
+            selector = ActiveSelectorSinglePass(self.debug)
+        elif self.in_place_transitions:
             selector = ActiveSelectorInPlace(self.debug)
         else:
             selector = ActiveSelectorBasic(self.debug)
@@ -1451,6 +1553,83 @@ class CandidateFinderOptimized:
             return transition
 
 
+class CandidateFinderPruned:
+    """A version of CandidateFinderOptimized which avoids creating the
+    Transitions that cannot be candidates:
+
+        * A rule year whose inMonth lies more than a month before (or after)
+          the ZoneMatch cannot produce a candidate, because the day of month of
+          the rule can shift the transition into the adjacent month at most.
+          Years after the ZoneMatch are dropped, and only the latest year
+          before it is created, as the potential most recent prior Transition.
+        * The remaining Transitions are compared to the ZoneMatch using a
+          margin of PRUNE_MARGIN_DAYS, instead of the months of
+          _compare_transition_to_match_fuzzy(). The margin covers the
+          difference between the 'w', 's' and 'u' times (at most 16h) plus an
+          AT time of up to 25:00, so a Transition outside of the margin cannot
+          become active after _fix_transition_times().
+    """
+
+    def __init__(self, debug: bool):
+        self.debug = debug
+
+    def find_candidate_transitions(
+            self,
+            match: ZoneMatch,
+            rules: List[ZoneRuleCooked],
+    ) -> List[Transition]:
+        if self.debug:
+            logging.info('Pruned.find_candidate_transitions()')
+
+        start_y = match.startDateTime.y
+        until = match.untilDateTime
+        if until.M == 1 and until.d == 1 and until.ss == 0:
+            end_y = until.y - 1
+        else:
+            end_y = until.y
+        (lower, upper) = _calc_pruning_bounds(match)
+        lower_month = 12 * lower[0] + lower[1]
+        upper_month = 12 * upper[0] + upper[1]
+
+        transitions: List[Transition] = []
+        prior_transition: Optional[Transition] = None
+        for rule in rules:
+            from_year = rule.fromYear
+            to_year = rule.toYear
+            prior_year = _get_most_recent_prior_year(from_year, to_year,
+                                                     start_y, end_y)
+            for year in _get_interior_years(from_year, to_year, start_y,
+                                            end_y):
+                # Month-level pruning, without creating a Transition.
+                rule_month = 12 * year + rule.inMonth
+                if rule_month + 1 < lower_month:
+                    prior_year = year
+                    continue
+                if rule_month - 1 > upper_month:
+                    break
+
+                transition = _create_transition_for_year(year, rule, match)
+                tt = transition.transitionTime
+                if (tt.y, tt.M, tt.d) < lower:
+                    prior_transition = CandidateFinderOptimized \
+                        ._calc_prior_transition(prior_transition, transition)
+                elif (tt.y, tt.M, tt.d) <= upper:
+                    _add_transition_sorted(transitions, transition)
+
+            if self.debug:
+                logging.info('find_candidate_transitions(): prior year: %s',
+                             prior_year)
+            if prior_year >= 0:
+                transition = _create_transition_for_year(
+                    prior_year, rule, match)
+                prior_transition = CandidateFinderOptimized \
+                    ._calc_prior_transition(prior_transition, transition)
+        if prior_transition:
+            _add_transition_sorted(transitions, prior_transition)
+
+        return transitions
+
+
 class ActiveSelector(Protocol):
     """Define the common methods of ActiveSelectorBasic and
     ActiveSelectorInPlace for mypy type checking.
@@ -1643,6 +1822,186 @@ class ActiveSelectorInPlace:
         return prior
 
 
+class ActiveSelectorSinglePass:
+    def __init__(self, debug: bool):
+        self.debug = debug
+
+    def select_active_transitions(
+            self,
+            transitions: List[Transition],
+            match: ZoneMatch,
+    ) -> List[Transition]:
+        """Similar to ActiveSelectorInPlace.select_active_transitions() except
+        that the sorted 'transitions' are classified and collected in a single
+        pass, without the Transition.isActive flag. Since the 'transitions'
+        are sorted, the latest prior Transition is the first of the last run of
+        equal transition times before the ZoneMatch, and it precedes all the
+        active Transitions.
+        """
+        if self.debug:
+            logging.info('ActiveSelectorSinglePass.select_active_transitions()')
+
+        prior: Optional[Transition] = None
+        active_transitions: List[Transition] = []
+        for transition in transitions:
+            comp = _compare_transition_to_match(transition, match)
+            if comp < 0:
+                if not prior:
+                    prior = transition
+                elif transition.transitionTime > prior.transitionTime:
+                    prior = transition
+            elif comp == 0:
+                prior = transition
+            elif comp == 1:
+                active_transitions.append(transition)
+
+        if prior:
+            if prior.transitionTime < match.startDateTime:
+                prior.originalTransitionTime = prior.transitionTime
+                prior.transitionTime = match.startDateTime
+            active_transitions.insert(0, prior)
+        return active_transitions
+
+
+def _calc_pruning_bounds(
+        match: ZoneMatch,
+) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+    """Return the (y, M, d) dates which are PRUNE_MARGIN_DAYS before the
+    start and after the until of the ZoneMatch. A Transition before the lower
+    date is a prior Transition, and a Transition after the upper date is
+    beyond the ZoneMatch, regardless of the 'w', 's' or 'u' suffixes.
+    """
+    start = match.startDateTime
+    if start.y <= MIN_YEAR + 1:
+        lower = (MIN_YEAR, 1, 1)
+    else:
+        d = date(start.y, start.M, start.d) - timedelta(days=PRUNE_MARGIN_DAYS)
+        lower = (d.year, d.month, d.day)
+
+    until = match.untilDateTime
+    if until.y >= MAX_YEAR - 1:
+        upper = (MAX_UNTIL_YEAR, 12, 31)
+    else:
+        d = date(until.y, until.M, until.d) + timedelta(days=PRUNE_MARGIN_DAYS)
+        upper = (d.year, d.month, d.day)
+    return (lower, upper)
+
+
+def find_transition_in(
+        transitions: List[Transition],
+        epoch_seconds: int,
+) -> Optional[Transition]:
+    """Return the last Transition in the sorted 'transitions' which starts at
+    or before epoch_seconds, or None if not found.
+    """
+    matching_transition = None
+    for transition in transitions:
+        if transition.startEpochSecond <= epoch_seconds:
+            matching_transition = transition
+        elif transition.startEpochSecond > epoch_seconds:
+            break
+    return matching_transition
+
+
+def register_zone_infos(
+    zone_infos: Mapping[str, Union[ZoneInfo, ZoneInfoCooked]],
+) -> None:
+    """Add the given zone_infos to the ZONE_REGISTRY used to rehydrate pickled
+    ZoneSpecifier objects. Call this in each worker process (e.g. in the
+    initializer of a multiprocessing.Pool) if the zone data does not come from
+    zonedbpy.
+    """
+    ZONE_REGISTRY.update(zone_infos)
+
+
+def _rehydrate_zone_specifier(
+    zone_name: str,
+    checksum: int,
+    viewing_months: int,
+    debug: bool,
+    in_place_transitions: bool,
+    optimize_candidates: bool,
+    lazy_evaluation: bool,
+    prune_candidates: bool,
+    packed_state: Optional[PackedState],
+) -> ZoneSpecifier:
+    """Recreate the ZoneSpecifier pickled by ZoneSpecifier.__reduce__()."""
+    zone_info: Optional[Union[ZoneInfo, ZoneInfoCooked]]
+    zone_info = ZONE_REGISTRY.get(zone_name)
+    if zone_info is None:
+        from zonedbpy.zone_infos import ZONE_INFO_MAP
+        zone_info = cast(Optional[ZoneInfo], ZONE_INFO_MAP.get(zone_name))
+    if zone_info is None:
+        raise Exception(f"Zone '{zone_name}' not found in registry")
+
+    zone_specifier = ZoneSpecifier(
+        zone_info,
+        viewing_months=viewing_months,
+        debug=debug,
+        in_place_transitions=in_place_transitions,
+        optimize_candidates=optimize_candidates,
+        lazy_evaluation=lazy_evaluation,
+        prune_candidates=prune_candidates,
+        pickle_transitions=packed_state is not None,
+    )
+    if _calc_zone_checksum(zone_specifier.zone_info) != checksum:
+        raise Exception(
+            f"Zone '{zone_name}' in registry differs from the pickled zone")
+    if packed_state:
+        zone_specifier._unpack_state(packed_state)
+    return zone_specifier
+
+
+def _find_rule_index(
+    zone_era: ZoneEraCooked,
+    zone_rule: Optional[ZoneRuleCooked],
+) -> int:
+    """Return the index of zone_rule in the ZonePolicyCooked of zone_era, or
+    -1 if zone_rule is None.
+    """
+    if zone_rule is None:
+        return -1
+    rules = cast(ZonePolicyCooked, zone_era.zonePolicy).rules
+    for i, rule in enumerate(rules):
+        if rule is zone_rule:
+            return i
+    raise Exception(f'ZoneRule {zone_rule} not found in its ZonePolicy')
+
+
+def _get_rule_at(
+    zone_era: ZoneEraCooked,
+    index: int,
+) -> Optional[ZoneRuleCooked]:
+    """Return the ZoneRuleCooked at 'index' of the ZonePolicyCooked of
+    zone_era, or None if index is -1. Inverse of _find_rule_index().
+    """
+    if index < 0:
+        return None
+    return cast(ZonePolicyCooked, zone_era.zonePolicy).rules[index]
+
+
+def _calc_zone_checksum(zone_info: ZoneInfoCooked) -> int:
+    """Return a CRC32 of the eras and rules of the given zone_info. Unlike
+    hash(), it is the same in every process.
+    """
+    checksum = 0
+    for era in zone_info.eras:
+        policy = era.zonePolicy
+        if isinstance(policy, ZonePolicyCooked):
+            rules = [
+                [getattr(rule, s) for s in ZoneRuleCooked.__slots__]
+                for rule in policy.rules
+            ]
+        else:
+            rules = []
+        fields = [
+            getattr(era, s) if s != 'zonePolicy' else era.policyName
+            for s in ZoneEraCooked.__slots__
+        ]
+        checksum = zlib.crc32(repr((fields, rules)).encode(), checksum)
+    return checksum
+
+
 def print_transitions(transitions: List[Transition]) -> None:
     logging.info('Num transitions: %d' % len(transitions))
     for t in transitions: